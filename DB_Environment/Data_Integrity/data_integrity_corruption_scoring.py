@@ -0,0 +1,119 @@
+# This class is designed to score the data checks against the corruption manifest the generator writes
+# next to each table of the archive (<file name>.manifest.npz): the row positions each corruption altered.
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+
+# ---------------------------------------------------------------------------------------------------------
+# ---------------------------------------------------------------------------------------------------------
+# --------------                    Corruption Scoring Classes                               --------------
+# ---------------------------------------------------------------------------------------------------------
+# ---------------------------------------------------------------------------------------------------------
+
+class Corruption_Scorer:
+      def __init__(self, manifest_path):
+            """
+            Initialize the Corruption_Scorer object with the corruption manifest of one table.
+            :param manifest_path: Path to the .manifest.npz file written next to the table.
+            """
+            manifest_path = Path(manifest_path)
+            if not manifest_path.exists():
+                  raise FileNotFoundError(f"...File existance check: Failed for {manifest_path}")
+            self.truth = {}
+            with np.load(manifest_path) as manifest:
+                  if '__key_separator__' not in manifest.files:
+                        raise ValueError(f"{manifest_path} is not a corruption manifest")
+                  self.table_name = str(manifest['__table__'])
+                  self.num_records = int(manifest['__num_records__'])
+                  # The manifest names its arrays "<field><separator><corruption type>" and stores the separator it used
+                  key_separator = str(manifest['__key_separator__'])
+                  for key in manifest.files:
+                        if not key.startswith("__"):
+                              field_name, corruption_type = key.split(key_separator, 1)
+                              self.truth[(field_name, corruption_type)] = manifest[key]
+
+      def _unique_positions(self, positions):
+            # Sorted unique row positions through a row mask of the table (linear, and fast on already sorted positions)
+            if len(positions) and (positions.min() < 0 or positions.max() >= self.num_records):
+                  raise ValueError(f"Row positions must be between 0 and {self.num_records - 1}, the rows of {self.table_name}")
+            row_mask = np.zeros(self.num_records, dtype=bool)
+            row_mask[positions] = True
+            return np.flatnonzero(row_mask)
+
+      def corruption_types(self, field_name):
+            """
+            Corruption types injected into a field.
+            :param field_name: The name of the field.
+            :return: List of corruption types.
+            """
+            return [corruption_type for field, corruption_type in self.truth if field == field_name]
+
+      def truth_positions(self, field_name, corruption_types = None):
+            """
+            Row positions of a field altered by the given corruption types.
+            :param field_name: The name of the field.
+            :param corruption_types: List of corruption types (default None takes every type of the field).
+            :return: Sorted NumPy array of unique row positions.
+            """
+            if corruption_types is None:
+                  corruption_types = self.corruption_types(field_name)
+            position_arrays = [self.truth[(field_name, corruption_type)] for corruption_type in corruption_types \
+                               if (field_name, corruption_type) in self.truth]
+            if not position_arrays:
+                  return np.empty(0, dtype=np.int64)
+            if len(position_arrays) == 1:
+                  return position_arrays[0].astype(np.int64)
+            return self._unique_positions(np.concatenate(position_arrays).astype(np.int64))
+
+      def _flagged_positions(self, flagged):
+            # A check can flag rows as a boolean mask over the table or as row positions (None flags nothing)
+            if flagged is None:
+                  return np.empty(0, dtype=np.int64)
+            flagged = np.asarray(flagged)
+            if flagged.dtype == bool:
+                  if len(flagged) != self.num_records:
+                        raise ValueError(f"Boolean mask of {len(flagged)} rows does not match the {self.num_records} rows of {self.table_name}")
+                  return np.flatnonzero(flagged)
+            return self._unique_positions(flagged.astype(np.int64))
+
+      def score(self, flagged, field_name, corruption_types = None):
+            """
+            Score the rows a check flagged against the rows the corruptions altered.
+            :param flagged: Row positions flagged by the check, or a boolean mask over the rows of the table.
+            :param field_name: The name of the checked field.
+            :param corruption_types: Corruption types the check is expected to catch (default None takes every type of the field).
+            :return: Dictionary with the flagged, corrupted, true positive, false positive and false negative counts, precision and recall.
+            """
+            flagged_positions = self._flagged_positions(flagged)
+            truth_positions = self.truth_positions(field_name, corruption_types)
+            # Both arrays are sorted and unique, so the intersection is a binary search of the flagged rows
+            match_index = np.searchsorted(truth_positions, flagged_positions)
+            in_range = match_index < len(truth_positions)
+            true_positives = int((truth_positions[match_index[in_range]] == flagged_positions[in_range]).sum())
+            return {'table': self.table_name, 'field': field_name,
+                    'corruption_types': ", ".join(corruption_types or self.corruption_types(field_name)),
+                    'flagged': len(flagged_positions), 'corrupted': len(truth_positions),
+                    'true_positives': true_positives, 'false_positives': len(flagged_positions) - true_positives,
+                    'false_negatives': len(truth_positions) - true_positives,
+                    'precision': round(true_positives / len(flagged_positions), 4) if len(flagged_positions) else 0.0,
+                    'recall': round(true_positives / len(truth_positions), 4) if len(truth_positions) else 0.0}
+
+      def score_checks(self, check_results, print_results = "Y"):
+            """
+            Score several checks of the table.
+            :param check_results: List of (field name, flagged rows) or (field name, flagged rows, corruption types) tuples.
+            :param print_results: Print a line per check ("Y") or not (default "Y").
+            :return: DataFrame with one row of scores per check.
+            """
+            results = []
+            for check_result in check_results:
+                  field_name, flagged = check_result[:2]
+                  corruption_types = check_result[2] if len(check_result) > 2 else None
+                  result = self.score(flagged, field_name, corruption_types)
+                  results.append(result)
+                  if print_results.upper() == "Y":
+                        print(f"...Corruption score {self.table_name}.{field_name}: precision {result['precision']}, recall {result['recall']} "
+                              f"({result['true_positives']} of {result['corrupted']} corrupted rows caught, {result['false_positives']} false flags)")
+            return pd.DataFrame(results)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 # ---------------------------------------------------------------------------------------------------------
@@ -17,6 +18,8 @@ file_types = {
     ".pdf": "Portable Document Format",
     ".txt": "Text File",
     ".csv": "Comma-Separated Values",
+    ".parquet": "Apache Parquet",
+    ".feather": "Feather (Arrow IPC)",
     ".json": "JavaScript Object Notation",
     ".xml": "eXtensible Markup Language",
     ".html": "HyperText Markup Language",
@@ -47,6 +50,12 @@ file_types_pd = {
       '.xlsx'                 : pd.read_excel,
       'xlsx'                  : pd.read_excel,
       'Comma-Separated Values': pd.read_csv,
+      'Apache Parquet'        : pd.read_parquet,
+      '.parquet'              : pd.read_parquet,
+      'parquet'               : pd.read_parquet,
+      'Feather (Arrow IPC)'   : pd.read_feather,
+      '.feather'              : pd.read_feather,
+      'feather'               : pd.read_feather,
       'JavaScript'            : pd.read_json,
       '.json'                 : pd.read_json,
       'json'                  : pd.read_json
@@ -308,20 +317,31 @@ class Data_Check_Formats:
             """
             self.df = df
 
+      # Row mask of the values failing a format (positional, so duplicate or non-default index labels are fine)
+      def _invalid_format_mask(self, column, pattern):
+            """
+            Flag the non-empty values of a column not matching a regex pattern.
+            :param column: The column name to be validated.
+            :param pattern: The regex pattern of a valid value.
+            :return: Boolean NumPy array over the rows of the DataFrame.
+            """
+            values = self.df[column]
+            filled = (values.notna() & (values != '')).to_numpy(dtype=bool, na_value=False)
+            return filled & ~values.astype(str).str.match(pattern).to_numpy(dtype=bool, na_value=False)
+
       # Employee email address format validation
       def check_employee_email_format_field(self, column, return_list = "n"):
             """
             Validate the email address format in a specified column of the DataFrame.
             The function checks against a specified regex pattern for email validation.
             :param column: The column name containing the email addresses.
-            :param return_list: Set to "y" to return a list of invalid email addresses.
-            :return: Optional list of invalid email addresses if return_list is set to "y".
+            :param return_list: Set to "y" to return a list of invalid email addresses, or "i" for an array of their row positions.
+            :return: Optional list of invalid email addresses if return_list is set to "y", or their row positions if set to "i".
             """
             pattern = r"^[a-zA-Z]+\.[a-zA-Z]+\d?@mailtype\.com$"
-            # Filter out NaN and empty string values before applying the regex
-            filtered_df = self.df[self.df[column].notna() & (self.df[column] != '')]
-            # Search for invalid zip codes based off regex pattern
-            invalid_emails = filtered_df[~filtered_df[column].astype(str).str.match(pattern)][column]
+            # Search for invalid values based off regex pattern, skipping NaN and empty string values
+            invalid_mask = self._invalid_format_mask(column, pattern)
+            invalid_emails = self.df[column][invalid_mask]
 
             if not invalid_emails.empty:
                   # Creating a list of invalid emails
@@ -332,6 +352,8 @@ class Data_Check_Formats:
                   print(f"   {invalid_email_count} emails flagged as wrong format")
                   if return_list.lower() == "y":
                         return invalid_email_list
+                  elif return_list.lower() == "i":
+                        return np.flatnonzero(invalid_mask)
             else:
                   print("...Email format check: Passed")
     
@@ -341,15 +363,14 @@ class Data_Check_Formats:
             Validate the street address format in a specified column of the DataFrame.
             The function checks addresses against a regex pattern for standard street address validation.
             :param column: The column name containing street addresses.
-            :param return_list: Set to "y" to return a list of invalid addresses.
-            :return: Optional list of invalid addresses if return_list is set to "y".
+            :param return_list: Set to "y" to return a list of invalid addresses, or "i" for an array of their row positions.
+            :return: Optional list of invalid addresses if return_list is set to "y", or their row positions if set to "i".
             """
             # Define a simple street address regex pattern or use a more complex one depending on the requirement
             pattern = r"^\d+\s[A-Za-z]+(\s[A-Za-z]+)?"
-            # Filter out NaN and empty string values before applying the regex
-            filtered_df = self.df[self.df[column].notna() & (self.df[column] != '')]
-            # Search for invalid zip codes based off regex pattern
-            invalid_addresses = filtered_df[~filtered_df[column].astype(str).str.match(pattern)][column]
+            # Search for invalid values based off regex pattern, skipping NaN and empty string values
+            invalid_mask = self._invalid_format_mask(column, pattern)
+            invalid_addresses = self.df[column][invalid_mask]
 
             if not invalid_addresses.empty:
                   # Creating a list of invalid addresses
@@ -360,6 +381,8 @@ class Data_Check_Formats:
                   print(f"   {invalid_address_count} addresses flagged as wrong format")
                   if return_list.lower() == "y":
                         return invalid_address_list
+                  elif return_list.lower() == "i":
+                        return np.flatnonzero(invalid_mask)
             else:
                   print("...Street address format check: Passed")
 
@@ -371,14 +394,13 @@ class Data_Check_Formats:
             The function checks zip codes against a regex pattern for standard 5 or 9 digit zip code validation.
             It excludes NaN and empty string values.
             :param column: The column name containing zip codes.
-            :param return_list: Set to "y" to return a list of invalid zip codes.
-            :return: Optional list of invalid zip codes if return_list is set to "y".
+            :param return_list: Set to "y" to return a list of invalid zip codes, or "i" for an array of their row positions.
+            :return: Optional list of invalid zip codes if return_list is set to "y", or their row positions if set to "i".
             """
             pattern = r"^\d{5}(-\d{4})?$"
-            # Filter out NaN and empty string values before applying the regex
-            filtered_df = self.df[self.df[column].notna() & (self.df[column] != '')]
-            # Search for invalid zip codes based off regex pattern
-            invalid_zip_codes = filtered_df[~filtered_df[column].astype(str).str.match(pattern)][column]
+            # Search for invalid values based off regex pattern, skipping NaN and empty string values
+            invalid_mask = self._invalid_format_mask(column, pattern)
+            invalid_zip_codes = self.df[column][invalid_mask]
 
             if not invalid_zip_codes.empty:
                   invalid_zip_code_list = invalid_zip_codes.tolist()
@@ -386,6 +408,8 @@ class Data_Check_Formats:
                   print(f"   {len(invalid_zip_code_list)} zip code(s) flagged as wrong format")
                   if return_list.lower() == "y":
                         return invalid_zip_code_list
+                  elif return_list.lower() == "i":
+                        return np.flatnonzero(invalid_mask)
             else:
                   print("...Zip code format check: Passed")
 
@@ -395,14 +419,13 @@ class Data_Check_Formats:
             Validate the IP address format in a specified column of the DataFrame.
             The function checks IP addresses against a regex pattern for standard IP address validation.
             :param column: The column name containing IP addresses.
-            :param return_list: Set to "y" to return a list of invalid IP addresses.
-            :return: Optional list of invalid IP addresses if return_list is set to "y".
+            :param return_list: Set to "y" to return a list of invalid IP addresses, or "i" for an array of their row positions.
+            :return: Optional list of invalid IP addresses if return_list is set to "y", or their row positions if set to "i".
             """
             pattern = r"^(\d{1,3}\.){3}\d{1,3}$"
-            # Filter out NaN and empty string values before applying the regex
-            filtered_df = self.df[self.df[column].notna() & (self.df[column] != '')]
-            # Search for invalid zip codes based off regex pattern
-            invalid_ips = filtered_df[~filtered_df[column].astype(str).str.match(pattern)][column]
+            # Search for invalid values based off regex pattern, skipping NaN and empty string values
+            invalid_mask = self._invalid_format_mask(column, pattern)
+            invalid_ips = self.df[column][invalid_mask]
             
             if not invalid_ips.empty:
                   invalid_ip_list = invalid_ips.tolist()
@@ -410,6 +433,8 @@ class Data_Check_Formats:
                   print(f"   {len(invalid_ip_list)} IP addresses flagged as wrong format")
                   if return_list.lower() == "y":
                         return invalid_ip_list
+                  elif return_list.lower() == "i":
+                        return np.flatnonzero(invalid_mask)
             else:
                   print("...IP address format check: Passed")
 
@@ -419,14 +444,13 @@ class Data_Check_Formats:
             Validate the domain name format in a specified column of the DataFrame.
             The function checks domain names against a regex pattern for standard domain name validation.
             :param column: The column name containing domain names.
-            :param return_list: Set to "y" to return a list of invalid domain names.
-            :return: Optional list of invalid domain names if return_list is set to "y".
+            :param return_list: Set to "y" to return a list of invalid domain names, or "i" for an array of their row positions.
+            :return: Optional list of invalid domain names if return_list is set to "y", or their row positions if set to "i".
             """
             pattern = r"^(https?://)?(www\.)?[a-zA-Z0-9-]+\.[a-zA-Z]{2,}$"
-            # Filter out NaN and empty string values before applying the regex
-            filtered_df = self.df[self.df[column].notna() & (self.df[column] != '')]
-            # Search for invalid zip codes based off regex pattern
-            invalid_domains = filtered_df[~filtered_df[column].astype(str).str.match(pattern)][column]
+            # Search for invalid values based off regex pattern, skipping NaN and empty string values
+            invalid_mask = self._invalid_format_mask(column, pattern)
+            invalid_domains = self.df[column][invalid_mask]
             
             if not invalid_domains.empty:
                   invalid_domain_list = invalid_domains.tolist()
@@ -434,6 +458,8 @@ class Data_Check_Formats:
                   print(f"   {len(invalid_domain_list)} domain names flagged as wrong format")
                   if return_list.lower() == "y":
                         return invalid_domain_list
+                  elif return_list.lower() == "i":
+                        return np.flatnonzero(invalid_mask)
             else:
                   print("...Domain name format check: Passed")
 
@@ -0,0 +1,156 @@
+# This class is designed to check that the foreign keys and bridge tables of the
+# generated archive resolve to the keys of their parent files, reading the files chunk by chunk.
+
+import pandas as pd
+from pathlib import Path
+
+# pyarrow is only needed to stream Parquet and Feather files
+try:
+      import pyarrow.parquet as pq
+      import pyarrow.ipc as ipc
+except ImportError:
+      pq = None
+
+
+# ---------------------------------------------------------------------------------------------------------
+# ---------------------------------------------------------------------------------------------------------
+# --------------                    Support Dictionaries and List                            --------------
+# ---------------------------------------------------------------------------------------------------------
+# ---------------------------------------------------------------------------------------------------------
+
+# Links of the generated archive: (child file, foreign key field, parent file, parent key field)
+referential_links = [
+      ("legal data",      "Bus External ID",  "business data", "External ID"),
+      ("address data",    "Bus External ID",  "business data", "External ID"),
+      ("address data",    "Legal Account ID", "legal data",    "Legal Account"),
+      ("tax data",        "Legal Account ID", "legal data",    "Legal Account"),
+      ("finance data",    "Legal Account ID", "legal data",    "Legal Account"),
+      ("finance data",    "Tax Account ID",   "tax data",      "Tax Account"),
+      ("Employee System", "Employee ID",      "employee data", "Employee ID"),
+      ("Employee System", "Legal Account",    "legal data",    "Legal Account"),
+]
+
+
+# ---------------------------------------------------------------------------------------------------------
+# ---------------------------------------------------------------------------------------------------------
+# --------------                    Referential Integrity Classes                            --------------
+# ---------------------------------------------------------------------------------------------------------
+# ---------------------------------------------------------------------------------------------------------
+
+class Referential_Check:
+      def __init__(self, path, filetype = ".csv", chunk_size = 100000):
+            """
+            Initialize the Referential_Check object.
+            :param path: Path to the archive folder.
+            :param filetype: Extension of the archive files: .csv, .parquet or .feather (default .csv).
+            :param chunk_size: Number of child rows read per chunk (default 100000).
+            """
+            self.file_path = Path(path)
+            self.file_type = filetype if filetype.startswith(".") else "." + filetype
+            if self.file_type not in (".csv", ".parquet", ".feather"):
+                  raise ValueError(f"Unsupported file type: {self.file_type}")
+            if self.file_type != ".csv" and pq is None:
+                  raise ImportError(f"Reading {self.file_type} files requires the pyarrow package")
+            if chunk_size < 1:
+                  raise ValueError(f"chunk_size value of {chunk_size} must be 1 or greater")
+            self.chunk_size = chunk_size
+            self.parent_keys = {}
+
+      def _full_path(self, file_name):
+            full_path = self.file_path / f"{file_name}{self.file_type}"
+            if not full_path.exists():
+                  raise FileNotFoundError(f"...File existance check: Failed for {full_path}")
+            return full_path
+
+      def iter_file_chunks(self, file_name, columns = None):
+            """
+            Read a file of the archive chunk by chunk.
+            :param file_name: Name of the file without extension.
+            :param columns: List of columns to read (default None reads every column).
+            :return: Generator of DataFrame chunks.
+            """
+            full_path = self._full_path(file_name)
+            if self.file_type == ".csv":
+                  # Keys are compared as text, so every column is read as text
+                  yield from pd.read_csv(full_path, usecols=columns, dtype=str, chunksize=self.chunk_size)
+            elif self.file_type == ".parquet":
+                  for batch in pq.ParquetFile(full_path).iter_batches(batch_size=self.chunk_size, columns=columns):
+                        yield batch.to_pandas()
+            else:
+                  with ipc.open_file(full_path) as reader:
+                        for batch_num in range(reader.num_record_batches):
+                              batch = reader.get_batch(batch_num)
+                              yield (batch.select(columns) if columns else batch).to_pandas()
+
+      @staticmethod
+      def _key_values(series):
+            # Compare keys as text, so numeric keys match whatever dtype each file stored them with
+            return series.astype("string")
+
+      def load_parent_keys(self, file_name, key_field):
+            """
+            Read the distinct keys of a parent file, only reading its key column. The keys are cached per file and field.
+            :param file_name: Name of the parent file without extension.
+            :param key_field: Key field of the parent file.
+            :return: pandas Index of the distinct parent keys (the hash index the children are checked against).
+            """
+            if (file_name, key_field) not in self.parent_keys:
+                  key_chunks = [pd.Series(self._key_values(chunk[key_field]).dropna().unique(), dtype="string") \
+                                for chunk in self.iter_file_chunks(file_name, [key_field])]
+                  keys = pd.concat(key_chunks).unique() if key_chunks else []
+                  self.parent_keys[(file_name, key_field)] = pd.Index(keys, dtype="string")
+            return self.parent_keys[(file_name, key_field)]
+
+      def find_orphans(self, child_file_name, fk_field, parent_file_name, parent_key_field, sample_size = 5):
+            """
+            Anti-join a child file against its parent keys, streaming the child chunk by chunk.
+            :param child_file_name: Name of the child file without extension.
+            :param fk_field: Foreign key field of the child file.
+            :param parent_file_name: Name of the parent file without extension.
+            :param parent_key_field: Key field of the parent file.
+            :param sample_size: Number of orphan rows kept as a sample (default 5).
+            :return: Dictionary with the row, null key and orphan counts, the orphan percentage and a DataFrame of sample orphan rows.
+            """
+            parent_keys = self.load_parent_keys(parent_file_name, parent_key_field)
+            row_count = 0
+            null_count = 0
+            orphan_count = 0
+            samples = []
+            for chunk in self.iter_file_chunks(child_file_name):
+                  if fk_field not in chunk.columns:
+                        raise ValueError(f"{fk_field} not in {child_file_name}")
+                  fk_values = self._key_values(chunk[fk_field])
+                  null_keys = fk_values.isna().to_numpy()
+                  orphan_keys = ~null_keys & ~fk_values.isin(parent_keys).to_numpy()
+                  row_count += len(chunk)
+                  null_count += int(null_keys.sum())
+                  orphan_count += int(orphan_keys.sum())
+                  kept_samples = sum(len(sample) for sample in samples)
+                  if kept_samples < sample_size and orphan_keys.any():
+                        samples.append(chunk[orphan_keys].head(sample_size - kept_samples))
+            return {'child': child_file_name, 'foreign_key': fk_field, 'parent': parent_file_name, 'parent_key': parent_key_field,
+                    'rows': row_count, 'null_keys': null_count, 'orphans': orphan_count,
+                    'orphan_perc': round(100 * orphan_count / row_count, 2) if row_count else 0.0,
+                    'sample': pd.concat(samples) if samples else pd.DataFrame()}
+
+      def check_archive(self, links = None, sample_size = 5, print_results = "Y"):
+            """
+            Check every link of the archive and summarize the orphan counts.
+            :param links: List of (child file, foreign key field, parent file, parent key field) (default referential_links).
+            :param sample_size: Number of orphan rows kept as a sample per link (default 5).
+            :param print_results: Print a line per link ("Y") or not (default "Y").
+            :return: Tuple of a summary DataFrame (one row per link) and a dictionary of (child file, foreign key field) -> sample orphan rows.
+            """
+            results = []
+            samples = {}
+            for child_file_name, fk_field, parent_file_name, parent_key_field in links or referential_links:
+                  result = self.find_orphans(child_file_name, fk_field, parent_file_name, parent_key_field, sample_size)
+                  samples[(child_file_name, fk_field)] = result.pop('sample')
+                  results.append(result)
+                  if print_results.upper() == "Y":
+                        if result['orphans'] == 0:
+                              print(f"...Referential check {child_file_name}.{fk_field} -> {parent_file_name}.{parent_key_field}: Passed")
+                        else:
+                              print(f"...Referential check {child_file_name}.{fk_field} -> {parent_file_name}.{parent_key_field}: "
+                                    f"Failed, {result['orphans']} of {result['rows']} rows ({result['orphan_perc']}%) are orphans")
+            return pd.DataFrame(results), samples
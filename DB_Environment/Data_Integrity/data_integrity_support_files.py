@@ -22,6 +22,8 @@ file_types = {
     ".pdf": "Portable Document Format",
     ".txt": "Text File",
     ".csv": "Comma-Separated Values",
+    ".parquet": "Apache Parquet",
+    ".feather": "Feather (Arrow IPC)",
     ".json": "JavaScript Object Notation",
     ".xml": "eXtensible Markup Language",
     ".html": "HyperText Markup Language",
@@ -52,6 +54,12 @@ file_types_pd = {
       '.xlsx'                 : pd.read_excel,
       'xlsx'                  : pd.read_excel,
       'Comma-Separated Values': pd.read_csv,
+      'Apache Parquet'        : pd.read_parquet,
+      '.parquet'              : pd.read_parquet,
+      'parquet'               : pd.read_parquet,
+      'Feather (Arrow IPC)'   : pd.read_feather,
+      '.feather'              : pd.read_feather,
+      'feather'               : pd.read_feather,
       'JavaScript'            : pd.read_json,
       '.json'                 : pd.read_json,
       'json'                  : pd.read_json
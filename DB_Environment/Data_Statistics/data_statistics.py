@@ -11,11 +11,7 @@ class Statistics:
         :param field: The field name whose unique values are to be listed.
         :return: A set of unique values in the specified field.
         """
-        unique_values = set()
-        for record in self.df[field_name]:
-            if record not in unique_values:
-                unique_values.add(record)
-        return unique_values
+        return set(self.df[field_name].unique())
         
     def count_values_field_dict(self, list_to_count, field):
         """
@@ -25,18 +21,21 @@ class Statistics:
         :param field: The field name for which to count the occurrences.
         :return: A dictionary with values as keys and their occurrence counts as values.
         """
-        value_counts = {}
-        for list in list_to_count:
-            value_counts[list] = 0
-            for record in self.df[field]:
-                if list == record:
-                    value_counts[list] += 1
-        return value_counts
+        # One value_counts pass (on the category codes for categorical fields) instead of a scan per value
+        field_counts = self.df[field].value_counts()
+        return {value: int(field_counts.get(value, 0)) for value in list_to_count}
     
     def count_values_field(self, field_name):
+        """
+        Count how many times each value occurs in a specified field, most frequent first.
+
+        :param field_name: The field name for which to count the occurrences.
+        :return: pandas Series of value counts; categories that do not occur are left out.
+        """
         if field_name not in self.df.columns:
             raise ValueError(f"Field '{field_name}' not found in DataFrame.")
-        return self.df[field_name].value_counts()
+        field_counts = self.df[field_name].value_counts()
+        return field_counts[field_counts > 0]
     
 
     
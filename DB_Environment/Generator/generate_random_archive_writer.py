@@ -0,0 +1,170 @@
+import os
+import pandas as pd
+from generate_random_corruption_manifest import manifest_extension
+
+# pyarrow is only needed for the columnar formats, so CSV output keeps working without it
+try:
+      import pyarrow as pa
+      import pyarrow.parquet as pq
+      import pyarrow.ipc as ipc
+except ImportError:
+      pa = None
+
+
+# File extension of every archive format
+archive_formats = {
+      'csv':     ".csv",
+      'parquet': ".parquet",
+      'feather': ".feather",
+}
+
+# Default number of rows per Parquet row group / Arrow record batch
+default_row_group_size = 100000
+
+
+class Archive_Writer:
+      """
+      Writes the generated tables to the Data_Archive as CSV, Parquet or Feather (Arrow IPC).
+      Columnar formats keep the column dtypes and carry schema metadata, and a table can be
+      written in several appended chunks while its file is open.
+      """
+      def __init__(self, output_dir, file_format = "csv", row_group_size = default_row_group_size, metadata = None, write_manifests = True):
+            """
+            Initialize the Archive_Writer object.
+            :param output_dir: Output folder.
+            :param file_format: One of archive_formats (default csv).
+            :param row_group_size: Rows per Parquet row group / Arrow record batch (default 100000).
+            :param metadata: Dictionary of key -> value stored in the schema metadata of columnar files.
+            :param write_manifests: Write the corruption manifest of each table next to it (default True).
+            """
+            if file_format not in archive_formats:
+                  raise ValueError(f"File format {file_format} is not one of {list(archive_formats)}")
+            if file_format != "csv" and pa is None:
+                  raise ImportError(f"File format {file_format} requires the pyarrow package")
+            if row_group_size < 1:
+                  raise ValueError(f"row_group_size value of {row_group_size} must be 1 or greater")
+            self.output_dir = output_dir
+            self.file_format = file_format
+            self.row_group_size = row_group_size
+            self.metadata = {str(key): str(value) for key, value in (metadata or {}).items()}
+            self.open_files = {}
+            self.write_manifests = write_manifests
+
+      def __getstate__(self):
+            # Open file handles stay in the process that opened them
+            state = self.__dict__.copy()
+            state['open_files'] = {}
+            return state
+
+      def file_path(self, file_name):
+            """
+            Path of a table in the output folder.
+            :param file_name: File name without extension.
+            :return: Path of the file.
+            """
+            return os.path.join(self.output_dir, file_name + archive_formats[self.file_format])
+
+      def manifest_path(self, file_name):
+            """
+            Path of the corruption manifest of a table in the output folder.
+            :param file_name: File name of the table without extension.
+            :return: Path of the manifest file.
+            """
+            return os.path.join(self.output_dir, file_name + manifest_extension)
+
+      def write_manifest(self, manifest, file_name):
+            """
+            Write the corruption manifest of a table next to it, unless manifests are turned off.
+            :param manifest: Corruption_Manifest of the table.
+            :param file_name: File name of the table without extension.
+            :return: Path of the written file, or None.
+            """
+            if not self.write_manifests:
+                  return None
+            return manifest.save(self.manifest_path(file_name))
+
+      def _arrow_schema(self, df, file_name):
+            schema = pa.Schema.from_pandas(df, preserve_index=False)
+            # A column that is all null in the first chunk is typed from later chunks as text
+            fields = [pa.field(field.name, pa.string()) if pa.types.is_null(field.type) else field for field in schema]
+            table_metadata = {**self.metadata, 'table': file_name, 'num_columns': str(len(fields))}
+            return pa.schema(fields).with_metadata({**(schema.metadata or {}), **{key.encode(): value.encode() for key, value in table_metadata.items()}})
+
+      def _arrow_table(self, df, schema):
+            try:
+                  return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                  # Data alterations can mix text into typed columns; those columns are stored as text
+                  df = df.copy()
+                  for field in schema:
+                        # pandas string columns are typed as large_string by pyarrow
+                        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+                              df[field.name] = df[field.name].astype("string")
+                  return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+
+      def _object_columns_as_text(self, df):
+            # Mixed-type object columns (e.g. numbers with inserted blanks) are typed as text up front,
+            # so every chunk of the table fits the same schema
+            mixed_columns = [column for column in df.columns if df[column].dtype == object and \
+                             df[column].dropna().map(type).nunique() > 1]
+            if not mixed_columns:
+                  return df
+            return df.astype({column: "string" for column in mixed_columns})
+
+      def write(self, df, file_name, append = False):
+            """
+            Write a table, or append a chunk to the table written by an earlier call. Columnar files stay
+            open for further chunks until close() is called.
+            :param df: DataFrame to write.
+            :param file_name: File name without extension.
+            :param append: Append the rows to the open file of an earlier chunk (default False).
+            :return: Path of the written file.
+            """
+            file_path = self.file_path(file_name)
+            if self.file_format == "csv":
+                  df.to_csv(file_path, index=False, mode="a" if append else "w", header=not append)
+                  return file_path
+            if not append or file_name not in self.open_files:
+                  self.close(file_name)
+                  schema = self._arrow_schema(self._object_columns_as_text(df), file_name)
+                  if self.file_format == "parquet":
+                        file_writer = pq.ParquetWriter(file_path, schema)
+                  else:
+                        file_writer = ipc.new_file(file_path, schema)
+                  self.open_files[file_name] = (file_writer, schema)
+            file_writer, schema = self.open_files[file_name]
+            table = self._arrow_table(df, schema)
+            if self.file_format == "parquet":
+                  file_writer.write_table(table, row_group_size=self.row_group_size)
+            else:
+                  file_writer.write_table(table, max_chunksize=self.row_group_size)
+            return file_path
+
+      def close(self, file_name = None):
+            """
+            Close the open file of a table, or every open file.
+            :param file_name: File name without extension (default None closes every open file).
+            """
+            file_names = list(self.open_files) if file_name is None else [file_name]
+            for open_name in file_names:
+                  open_file = self.open_files.pop(open_name, None)
+                  if open_file is not None:
+                        open_file[0].close()
+
+
+# Read a table written by an Archive_Writer, optionally only some of its columns
+def read_archive_table(file_path, columns = None):
+      """
+      Read a table from the Data_Archive in the format given by its extension.
+      :param file_path: Path of the file.
+      :param columns: List of columns to read (default None reads every column).
+      :return: DataFrame of the table.
+      """
+      file_extension = os.path.splitext(file_path)[1].lower()
+      if file_extension == archive_formats['csv']:
+            return pd.read_csv(file_path, usecols=columns)
+      if file_extension == archive_formats['parquet']:
+            return pd.read_parquet(file_path, columns=columns)
+      if file_extension == archive_formats['feather']:
+            return pd.read_feather(file_path, columns=columns)
+      raise ValueError(f"Unsupported archive file type: {file_extension}")
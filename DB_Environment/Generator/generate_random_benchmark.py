@@ -0,0 +1,397 @@
+import argparse
+import functools
+import gc
+import inspect
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+import generate_random_dataset_support_functions as grdfs
+import generate_random_dataset_business as grdb
+import generate_random_dataset_legal as grdle
+import generate_random_dataset_address as grda
+import generate_random_dataset_employee as grde
+import generate_random_dataset_tax as grdt
+import generate_random_dataset_financial as grdf
+import generate_random_dataset_log as grdlo
+import generate_random_data_relationship as grdr
+import generate_random_data_analysis_conditions as grdac
+import generate_random_corruption_plan as grdcp
+import generate_random_main as grdm
+
+#----------------------------------------------------------------------------------
+#----------------------------------------------------------------------------------
+#----------              Benchmark Settings and Registries                ---------
+#----------------------------------------------------------------------------------
+#----------------------------------------------------------------------------------
+
+# Default row counts every benchmark runs at (--sizes goes up to 1e7 and beyond)
+default_sizes = [1000, 10000, 100000]
+
+# Default number of timed runs per benchmark and size; the fastest run is reported
+default_repeat = 3
+
+# Default regression threshold: 0.2 flags a benchmark 20% slower (or using 20% more peak memory) than its baseline
+default_threshold = 0.2
+
+# Peak memory differences below this many MB are never flagged, so small benchmarks do not flag on allocator noise
+min_memory_regression_mb = 1.0
+
+# Benchmark groups
+benchmark_groups = ['field', 'table', 'relationship', 'analysis']
+
+# Dataset modules whose generate_*_field(s) functions are benchmarked, with the table that feeds their field inputs
+field_modules = {
+      'business': (grdb,  'business'),
+      'legal':    (grdle, 'legal'),
+      'address':  (grda,  'address'),
+      'employee': (grde,  'employee'),
+      'tax':      (grdt,  'tax'),
+      'finance':  (grdf,  'finance'),
+      'log':      (grdlo, 'log_general'),
+}
+
+# Field generators that take other fields as input: parameter -> column of the generated table
+field_benchmark_inputs = {
+      'generate_account_field':                  {'dict_list_id': 'ID_Record'},
+      'generate_random_modified_date_field':     {'created_date_list': 'Creation Date'},
+      'generate_random_closed_date_field':       {'status_list': 'Business Status', 'mod_date_list': 'Modified Date'},
+      'generate_legal_modified_date_field':      {'created_date_list': 'LE Creation Date'},
+      'generate_legal_closed_date_field':        {'status_list': 'Legal Status', 'mod_date_list': 'LE Modified Date'},
+      'generate_emp_email_field':                {'first_name': 'Emp First Name', 'last_name': 'Emp Last Name'},
+      'generate_emp_manager_fields':             {'emp_first_name': 'Emp First Name', 'emp_last_name': 'Emp Last Name', 'emp_job_title_list': 'Job Title'},
+      'generate_emp_termination_field':          {'status_list': 'Employee Status', 'hire_date_list': 'Hire Date'},
+      'generate_tax_type_desc_field':            {'tax_type_list': 'Tax Type'},
+      'generate_random_financial_ammount_field': {'financial_cat_list': 'Category'},
+      'generate_log_status_field':               {'severity_list': 'Log Level'},
+}
+
+# One operation per corruption type (grdcp.corruption_types), run on a generated table: (table, corruption plan operation)
+analysis_benchmarks = {
+      'duplicates':               ('business', {'field': 'External ID', 'perc': 35, 'dup_option_perc': 30}),
+      'override':                 ('business', {'field': 'Company Name', 'perc': 12, 'value': ""}),
+      'value_change':             ('address',  {'field': 'Original Country', 'perc': 11, 'target_value': 'RUS', 'change_value': 'GER'}),
+      'not_target_change':        ('address',  {'field': 'Original Country', 'perc': 15, 'not_target_record': 'RUS', 'change_record': 'RUS'}),
+      'predicate_change':         ('address',  {'field': 'Zip Code', 'perc': 20, 'change_value': "",
+                                                'predicate': grdac.Record_Predicate.contains('Original Country', 'RUS') & ~grdac.Record_Predicate.is_null('Address Street')}),
+      'abbreviation':             ('address',  {'field': 'Address Street', 'perc': 22}),
+      'closed_date_misalignment': ('business', {'field': 'Closed Date', 'perc': 15, 'open_date_field': 'Creation Date', 'modified_date_field': 'Modified Date'}),
+      'address_format':           ('address',  {'field': 'Address Street', 'perc': 15}),
+      'email_format':             ('employee', {'field': 'Employee Email', 'perc': 15}),
+      'malformation':             ('employee', {'field': 'Emp Phone Number', 'perc': 15, 'malformation': 'phone'}),
+}
+
+
+#----------------------------------------------------------------------------------
+#----------------------------------------------------------------------------------
+#----------              Benchmark Inputs                                 ---------
+#----------------------------------------------------------------------------------
+#----------------------------------------------------------------------------------
+
+# Generated tables are shared by the benchmarks of one size, and never timed
+@functools.lru_cache(maxsize=None)
+def benchmark_table(table_name, num_records, seed = grdm.default_master_seed):
+      """
+      Generate a registered table as benchmark input, once per table, size and seed.
+      :param table_name: Name of the table in the table_registry.
+      :param num_records: Number of rows.
+      :param seed: Master seed (default the generator's default master seed).
+      :return: DataFrame of the table (copy it before altering it).
+      """
+      return grdm.generate_table(table_name, num_records, grdfs.RNG_Context(seed))
+
+def field_benchmark(function, table_name, seed):
+      """
+      Build the setup and run functions of a field generator benchmark.
+      :param function: A generate_*_field(s) function.
+      :param table_name: Table whose generated columns feed the field inputs.
+      :param seed: Master seed.
+      :return: Tuple of (setup function of num_records, run function).
+      """
+      parameters = inspect.signature(function).parameters
+      field_inputs = field_benchmark_inputs.get(function.__name__, {})
+      def setup(num_records):
+            kwargs = {'num_records': num_records} if 'num_records' in parameters else {}
+            if field_inputs:
+                  df = benchmark_table(table_name, num_records, seed)
+                  kwargs.update({parameter: df[column].to_numpy() for parameter, column in field_inputs.items()})
+            if 'rng' in parameters:
+                  kwargs['rng'] = np.random.default_rng(seed)
+            return (kwargs,)
+      return setup, lambda kwargs: function(**kwargs)
+
+def build_benchmarks(seed = grdm.default_master_seed):
+      """
+      List every benchmark: each field generator, table generator, foreign key link, intermediary table
+      and corruption type.
+      :param seed: Master seed of the generated inputs.
+      :return: List of dictionaries with the 'name', 'group', 'setup' (num_records -> argument tuple, untimed)
+               and 'run' (timed) of each benchmark.
+      """
+      benchmarks = []
+      # Field generators
+      for module_name, (module, table_name) in field_modules.items():
+            for function_name, function in inspect.getmembers(module, inspect.isfunction):
+                  if function.__module__ == module.__name__ and function_name.startswith("generate_") and \
+                     not function_name.startswith("generate_table_") and function_name.endswith(("_field", "_fields")):
+                        setup, run = field_benchmark(function, table_name, seed)
+                        benchmarks.append({'name': f"field:{module_name}.{function_name}", 'group': 'field', 'setup': setup, 'run': run})
+      # Table generators, including the row ID generation
+      for table_name in grdm.table_registry:
+            benchmarks.append({'name': f"table:{table_name}", 'group': 'table',
+                               'setup': lambda num_records: (num_records,),
+                               'run': functools.partial(lambda table_name, num_records: grdm.generate_table(table_name, num_records, grdfs.RNG_Context(seed)), table_name)})
+      # Foreign key links, an extra skewed and conditional link, and the intermediary tables
+      fk_links = [(f"{parent_name}->{child_name}", parent_name, parent_key, child_name, fk_kwargs, col_placement) \
+                  for parent_name, parent_key, child_name, fk_kwargs, col_placement in grdm.foreign_key_links]
+      fk_links.append(("business->legal:zipf", 'business', 'External ID', 'legal', {'foreign_key_abbreviation_pre': "Bus ", 'distribution': 'zipf'}, 3))
+      fk_links.append(("legal->finance:conditions", 'legal', 'Legal Account', 'finance', {'foreign_key_abbreviation_post': " ID",
+                       'conditions': {'parent_filter': {'Legal Status': ['ACTIVE']}, 'date_rule': ('Financial Date', 'LE Creation Date')}}, 3))
+      for link_name, parent_name, parent_key, child_name, fk_kwargs, col_placement in fk_links:
+            def setup(num_records, parent_name = parent_name, child_name = child_name):
+                  return (benchmark_table(parent_name, num_records, seed), benchmark_table(child_name, num_records, seed).copy())
+            def run(parent_df, child_df, parent_key = parent_key, child_name = child_name, fk_kwargs = fk_kwargs, col_placement = col_placement):
+                  return grdm.link_foreign_key(parent_df, parent_key, child_name, child_df, fk_kwargs, col_placement, grdfs.RNG_Context(seed))
+            benchmarks.append({'name': f"relationship:foreign_key:{link_name}", 'group': 'relationship', 'setup': setup, 'run': run})
+      for table_name, intermediary_spec in grdm.intermediary_registry.items():
+            def setup(num_records, intermediary_spec = intermediary_spec):
+                  return ({source_name: benchmark_table(source_name, num_records, seed) for source_name in intermediary_spec['tables']},)
+            benchmarks.append({'name': f"relationship:intermediary:{table_name}", 'group': 'relationship', 'setup': setup,
+                               'run': functools.partial(lambda table_name, tables: grdm.build_intermediary_table(table_name, tables, grdfs.RNG_Context(seed)), table_name)})
+      def setup_fan_out(num_records):
+            return ([(benchmark_table('employee', num_records, seed), 'Employee ID'), (benchmark_table('legal', num_records, seed), 'Legal Account'),
+                     (benchmark_table('tax', num_records, seed), 'Tax Account', {'distribution': 'zipf'})],)
+      benchmarks.append({'name': "relationship:intermediary:3-way_poisson_fan_out", 'group': 'relationship', 'setup': setup_fan_out,
+                         'run': lambda tables: grdr.Intermediary_Data(rng_context=seed).create_relationship_df(tables, fan_out={'distribution': 'poisson', 'mean': 2})})
+      # Corruption types (every Data_Analysis method through the corruption plan), and the four-target change
+      for corruption_type, (table_name, operation) in analysis_benchmarks.items():
+            def setup(num_records, table_name = table_name):
+                  return (benchmark_table(table_name, num_records, seed).copy(),)
+            plan = grdcp.Corruption_Plan([{'type': corruption_type, **operation}])
+            benchmarks.append({'name': f"analysis:{corruption_type}", 'group': 'analysis', 'setup': setup,
+                               'run': functools.partial(lambda plan, df: plan.apply(df, grdfs.RNG_Context(seed)), plan)})
+      benchmarks.append({'name': "analysis:target_records_change_record_diff_fields", 'group': 'analysis',
+                         'setup': lambda num_records: (benchmark_table('address', num_records, seed).copy(),),
+                         'run': lambda df: grdac.Data_Analysis_Changes(df, rng_context=seed).target_records_change_record_diff_fields( \
+                                     'Original Country', 'RUS', 'Zip Code', "", target_field2='Address Street', target_value2='a', field_perc_to_dup=20)})
+      return benchmarks
+
+
+#----------------------------------------------------------------------------------
+#----------------------------------------------------------------------------------
+#----------              Measure, Store and Compare                       ---------
+#----------------------------------------------------------------------------------
+#----------------------------------------------------------------------------------
+
+def measure_benchmark(benchmark, num_records, repeat = default_repeat, track_memory = True):
+      """
+      Time a benchmark at one size and measure its peak memory.
+      :param benchmark: Benchmark dictionary from build_benchmarks.
+      :param num_records: Number of rows.
+      :param repeat: Number of timed runs; the fastest is reported (default 3).
+      :param track_memory: Measure the peak traced memory in one extra run (default True).
+      :return: Dictionary with the seconds, rows_per_sec and peak_mb (None without track_memory) of the benchmark.
+      """
+      if repeat < 1:
+            raise ValueError(f"repeat value of {repeat} must be 1 or greater")
+      run_times = []
+      for _ in range(repeat):
+            args = benchmark['setup'](num_records)
+            gc.collect()
+            start = time.perf_counter()
+            benchmark['run'](*args)
+            run_times.append(time.perf_counter() - start)
+      peak_mb = None
+      if track_memory:
+            # A separate run, since tracing slows the allocations down; only allocations of the run itself are counted
+            args = benchmark['setup'](num_records)
+            gc.collect()
+            tracemalloc.start()
+            try:
+                  benchmark['run'](*args)
+                  peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+            finally:
+                  tracemalloc.stop()
+      seconds = min(run_times)
+      return {'seconds': round(seconds, 6),
+              'rows_per_sec': round(num_records / seconds, 1) if seconds > 0 else float("inf"),
+              'peak_mb': round(peak_mb, 3) if peak_mb is not None else None}
+
+def run_benchmarks(benchmarks, sizes = None, repeat = default_repeat, track_memory = True, seed = grdm.default_master_seed, print_results = "Y"):
+      """
+      Run benchmarks at several sizes.
+      :param benchmarks: List of benchmark dictionaries from build_benchmarks.
+      :param sizes: List of row counts (default default_sizes).
+      :param repeat: Number of timed runs per benchmark and size (default 3).
+      :param track_memory: Measure the peak traced memory (default True).
+      :param seed: Master seed of the generated inputs, stored with the results.
+      :param print_results: Print a line per benchmark and size ("Y") or not (default "Y").
+      :return: Dictionary with the run 'meta' data and the 'results': benchmark name -> size (as text) -> measurement.
+      """
+      results = {}
+      for num_records in sizes or default_sizes:
+            for benchmark in benchmarks:
+                  result = measure_benchmark(benchmark, num_records, repeat, track_memory)
+                  results.setdefault(benchmark['name'], {})[str(num_records)] = result
+                  if print_results.upper() == "Y":
+                        peak_text = f"{result['peak_mb']:>10.1f} MB" if result['peak_mb'] is not None else ""
+                        print(f"{benchmark['name']:<75} {num_records:>11,} rows {result['rows_per_sec']:>16,.0f} rows/s {peak_text}")
+            # Inputs of one size are not needed at the next size
+            benchmark_table.cache_clear()
+      meta = {'created': time.strftime("%Y-%m-%dT%H:%M:%S"), 'python': platform.python_version(), 'numpy': np.__version__,
+              'pandas': pd.__version__, 'platform': platform.platform(), 'processor': platform.processor(),
+              'seed': seed, 'repeat': repeat, 'sizes': [int(num_records) for num_records in sizes or default_sizes]}
+      return {'meta': meta, 'results': results}
+
+def save_baseline(benchmark_run, path):
+      """
+      Store a benchmark run as a JSON baseline.
+      :param benchmark_run: Dictionary returned by run_benchmarks.
+      :param path: Path of the JSON file.
+      :return: Path of the written file.
+      """
+      with open(path, "w") as baseline_file:
+            json.dump(benchmark_run, baseline_file, indent=2, sort_keys=True)
+      return path
+
+def load_baseline(path):
+      """
+      Read a JSON baseline.
+      :param path: Path of the JSON file.
+      :return: Dictionary in the format of run_benchmarks.
+      """
+      with open(path) as baseline_file:
+            baseline = json.load(baseline_file)
+      if 'results' not in baseline:
+            raise ValueError(f"{path} is not a benchmark baseline")
+      return baseline
+
+def compare_to_baseline(benchmark_run, baseline, threshold = default_threshold, print_results = "Y"):
+      """
+      Flag the benchmarks slower, or using more peak memory, than their baseline by more than the threshold.
+      Benchmarks and sizes missing from the baseline are skipped.
+      :param benchmark_run: Dictionary returned by run_benchmarks.
+      :param baseline: Baseline dictionary (load_baseline).
+      :param threshold: Allowed relative change, e.g. 0.2 for 20% (default 0.2).
+      :param print_results: Print a line per regression and a summary ("Y") or not (default "Y").
+      :return: List of dictionaries with the benchmark, size, metric, baseline value, current value and relative change.
+      """
+      if threshold < 0:
+            raise ValueError(f"threshold value of {threshold} must be 0 or greater")
+      regressions = []
+      compared = 0
+      for benchmark_name, size_results in benchmark_run['results'].items():
+            for size, result in size_results.items():
+                  baseline_result = baseline['results'].get(benchmark_name, {}).get(size)
+                  if baseline_result is None:
+                        continue
+                  compared += 1
+                  if result['rows_per_sec'] < baseline_result['rows_per_sec'] * (1 - threshold):
+                        regressions.append({'benchmark': benchmark_name, 'size': int(size), 'metric': 'rows_per_sec',
+                                            'baseline': baseline_result['rows_per_sec'], 'current': result['rows_per_sec'],
+                                            'change': round(result['rows_per_sec'] / baseline_result['rows_per_sec'] - 1, 4)})
+                  if result.get('peak_mb') is not None and baseline_result.get('peak_mb') is not None and \
+                     result['peak_mb'] > baseline_result['peak_mb'] * (1 + threshold) and \
+                     result['peak_mb'] - baseline_result['peak_mb'] > min_memory_regression_mb:
+                        regressions.append({'benchmark': benchmark_name, 'size': int(size), 'metric': 'peak_mb',
+                                            'baseline': baseline_result['peak_mb'], 'current': result['peak_mb'],
+                                            'change': round(result['peak_mb'] / baseline_result['peak_mb'] - 1, 4) if baseline_result['peak_mb'] else float("inf")})
+      if print_results.upper() == "Y":
+            for regression in regressions:
+                  print(f"   Regression: {regression['benchmark']} at {regression['size']:,} rows, {regression['metric']} "
+                        f"{regression['baseline']:,} -> {regression['current']:,} ({regression['change']:+.1%})")
+            if regressions:
+                  print(f"...Benchmark baseline check: Failed, {len(regressions)} regressions in {compared} compared results (threshold {threshold:.0%})")
+            else:
+                  print(f"...Benchmark baseline check: Passed, {compared} compared results (threshold {threshold:.0%})")
+      return regressions
+
+
+#----------------------------------------------------------------------------------
+#----------------------------------------------------------------------------------
+#----------              Command Line Entry Point                         ---------
+#----------------------------------------------------------------------------------
+#----------------------------------------------------------------------------------
+
+def parse_size(size_arg):
+      """
+      Parse a --sizes value, allowing scientific notation (e.g. 1e6).
+      :param size_arg: Row count text.
+      :return: Row count.
+      """
+      try:
+            num_records = int(float(size_arg))
+      except ValueError:
+            raise argparse.ArgumentTypeError(f"--sizes value '{size_arg}' is not a number")
+      if num_records < 1:
+            raise argparse.ArgumentTypeError(f"--sizes value '{size_arg}' must be 1 or greater")
+      return num_records
+
+def build_arg_parser():
+      """
+      Build the command line parser of the benchmark suite.
+      :return: argparse.ArgumentParser.
+      """
+      parser = argparse.ArgumentParser(description="Benchmark the throughput (rows/sec) and peak memory of the field, table, "
+                                                   "relationship and data alteration generators.")
+      parser.add_argument("--sizes", nargs="+", type=parse_size, default=default_sizes, metavar="N",
+                          help=f"Row counts to run every benchmark at, e.g. 1e3 1e5 1e7 (default {' '.join(str(size) for size in default_sizes)}).")
+      parser.add_argument("--groups", nargs="+", choices=benchmark_groups, default=benchmark_groups,
+                          help="Benchmark groups to run (default all).")
+      parser.add_argument("--match", nargs="+", metavar="TEXT",
+                          help="Only run the benchmarks whose name contains one of these texts.")
+      parser.add_argument("--repeat", type=int, default=default_repeat,
+                          help=f"Timed runs per benchmark and size; the fastest is reported (default {default_repeat}).")
+      parser.add_argument("--no-memory", action="store_true",
+                          help="Skip the extra traced run that measures peak memory.")
+      parser.add_argument("--seed", type=int, default=grdm.default_master_seed,
+                          help=f"Master seed of the generated inputs (default {grdm.default_master_seed}).")
+      parser.add_argument("--baseline", metavar="PATH",
+                          help="JSON baseline to compare against; exits with status 1 when a benchmark regressed.")
+      parser.add_argument("--threshold", type=float, default=default_threshold,
+                          help=f"Relative slowdown or peak memory growth flagged as a regression (default {default_threshold}).")
+      parser.add_argument("--save-baseline", metavar="PATH",
+                          help="Store the results as a JSON baseline.")
+      parser.add_argument("--list", action="store_true",
+                          help="List the selected benchmarks without running them.")
+      return parser
+
+def main(argv = None):
+      """
+      Run the benchmark suite.
+      :param argv: Command line arguments (default sys.argv[1:]).
+      :return: Exit status: 1 when a benchmark regressed against the baseline, else 0.
+      """
+      parser = build_arg_parser()
+      args = parser.parse_args(argv)
+      if args.repeat < 1:
+            parser.error(f"--repeat value of {args.repeat} must be 1 or greater")
+      if args.threshold < 0:
+            parser.error(f"--threshold value of {args.threshold} must be 0 or greater")
+      baseline = None
+      if args.baseline:
+            try:
+                  baseline = load_baseline(args.baseline)
+            except (OSError, ValueError) as err:
+                  parser.error(str(err))
+
+      benchmarks = [benchmark for benchmark in build_benchmarks(args.seed) if benchmark['group'] in args.groups and \
+                    (not args.match or any(text in benchmark['name'] for text in args.match))]
+      if args.list:
+            for benchmark in benchmarks:
+                  print(benchmark['name'])
+            return 0
+      benchmark_run = run_benchmarks(benchmarks, args.sizes, args.repeat, not args.no_memory, args.seed)
+      if args.save_baseline:
+            save_baseline(benchmark_run, args.save_baseline)
+            print(f"...Benchmark baseline saved to {args.save_baseline}")
+      if baseline is not None and compare_to_baseline(benchmark_run, baseline, args.threshold):
+            return 1
+      return 0
+
+
+if __name__ == "__main__":
+      sys.exit(main())
@@ -0,0 +1,77 @@
+import numpy as np
+
+
+# File extension of a saved manifest, written next to its table (<file name>.manifest.npz)
+manifest_extension = ".manifest.npz"
+
+# Separator of the field and the corruption type in the array names of a saved manifest ("<field>::<corruption type>")
+manifest_key_separator = "::"
+
+
+# Sorted unique values of an array (a sort and a neighbour comparison, which is fast on already sorted positions)
+def sorted_unique(values):
+      """
+      Sort an array and drop its repeated values.
+      :param values: NumPy array.
+      :return: Sorted NumPy array of unique values.
+      """
+      values = np.sort(values)
+      if len(values) < 2:
+            return values
+      return values[np.concatenate(([True], values[1:] != values[:-1]))]
+
+
+class Corruption_Manifest:
+      """
+      Ground truth of the corruptions injected into one table: the row positions (within the whole table)
+      each (field, corruption type) altered. Saved as one .npz file of sorted, unique position arrays,
+      uint32 unless the table has more than 2**32 rows (4 bytes per altered row, read back without decoding).
+      """
+      def __init__(self, table_name):
+            """
+            Initialize the Corruption_Manifest object.
+            :param table_name: Name of the table the corruptions are injected into.
+            """
+            self.table_name = table_name
+            self.num_records = 0
+            self.recorded_positions = {}
+
+      def record(self, field_name, corruption_type, positions, record_offset = 0):
+            """
+            Record the row positions a corruption altered.
+            :param field_name: The name of the altered field.
+            :param corruption_type: Name of the corruption (the Data_Analysis method).
+            :param positions: NumPy array of row positions within the DataFrame (or chunk) that was altered.
+            :param record_offset: Position of the first row of the DataFrame (or chunk) within the table (default 0).
+            """
+            positions = np.asarray(positions, dtype=np.int64) + record_offset
+            self.recorded_positions.setdefault((field_name, corruption_type), []).append(positions)
+
+      def add_records(self, num_records):
+            """
+            Count the rows of a DataFrame (or chunk) the corruptions were injected into.
+            :param num_records: Number of rows.
+            """
+            self.num_records += int(num_records)
+
+      def entries(self):
+            """
+            Compact the recorded positions.
+            :return: Dictionary of (field, corruption type) -> sorted unique position array.
+            """
+            position_dtype = np.uint32 if self.num_records <= 2 ** 32 else np.uint64
+            return {key: sorted_unique(np.concatenate(position_arrays)).astype(position_dtype) \
+                    for key, position_arrays in self.recorded_positions.items()}
+
+      def save(self, path):
+            """
+            Write the manifest to an .npz file.
+            :param path: Path of the file.
+            :return: Path of the written file.
+            """
+            arrays = {f"{field_name}{manifest_key_separator}{corruption_type}": positions \
+                      for (field_name, corruption_type), positions in self.entries().items()}
+            np.savez(path, __table__=np.array(self.table_name), __num_records__=np.array(self.num_records, dtype=np.int64),
+                     __key_separator__=np.array(manifest_key_separator), **arrays)
+            return path
+
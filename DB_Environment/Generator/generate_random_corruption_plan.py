@@ -0,0 +1,67 @@
+import generate_random_data_analysis_conditions as grdac
+
+
+# Corruption types a plan can list: (Data_Analysis class, method, keyword of the field, keyword of the percentage)
+corruption_types = {
+      'duplicates':               (grdac.Data_Analysis_Inserts,        'create_duplicates_within_field_random', 'field_name',        'field_perc_to_dup'),
+      'override':                 (grdac.Data_Analysis_Inserts,        'insert_value_by_override_perc',         'field_name',        'field_perc_to_dup'),
+      'value_change':             (grdac.Data_Analysis_Changes,        'target_value_change_value',             'field_name',        'field_perc_to_dup'),
+      'not_target_change':        (grdac.Data_Analysis_Changes,        'not_target_record_change_record',       'field_name',        'field_perc_to_dup'),
+      'predicate_change':         (grdac.Data_Analysis_Changes,        'change_records_by_predicate',           'change_field',      'field_perc_to_dup'),
+      'abbreviation':             (grdac.Data_Analysis_Changes,        'address_abbreviation_change',           'field_name',        'field_perc_to_dup'),
+      'closed_date_misalignment': (grdac.Data_Analysis_Err_Conditions, 'closed_date_misalignment',              'closed_date_field', 'apply_perc'),
+      'address_format':           (grdac.Data_Analysis_Err_Conditions, 'address_incorrect_format',              'field_name',        'apply_perc'),
+      'email_format':             (grdac.Data_Analysis_Err_Conditions, 'email_incorrect_format',                'field_name',        'apply_perc'),
+      'malformation':             (grdac.Data_Analysis_Err_Conditions, 'inject_malformation',                   'field_name',        'apply_perc'),
+}
+
+
+class Corruption_Plan:
+      """
+      Declarative list of the data alterations and error conditions of a table, e.g.
+            [{'field': 'Company Name', 'type': 'override', 'perc': 12, 'value': ""},
+             {'field': 'Closed Date', 'type': 'closed_date_misalignment', 'perc': 15, 'open_date_field': 'Creation Date'}]
+      Each operation names its field (or a list of fields, run as one call), a corruption_types type, its percentage
+      and any further keyword arguments of the method. Operations run one by one in plan order, each as the vectorized
+      pass of its Data_Analysis method, and one Data_Analysis object of each class serves the whole table.
+      An operation reading other fields (e.g. closed_date_misalignment) should be listed after the operations changing them.
+      """
+      def __init__(self, operations):
+            """
+            Initialize the Corruption_Plan object.
+            :param operations: List of operation dictionaries with 'field', 'type', optional 'perc' and method keyword arguments.
+            """
+            self.operations = []
+            for operation in operations:
+                  if 'field' not in operation or 'type' not in operation:
+                        raise ValueError(f"Corruption operation {operation} needs a 'field' and a 'type'")
+                  if operation['type'] not in corruption_types:
+                        raise ValueError(f"Corruption type {operation['type']} is not one of {list(corruption_types)}")
+                  self.operations.append(dict(operation))
+
+      def apply(self, df, rng_context = None, manifest = None):
+            """
+            Run the plan on a table, or on one chunk of a streamed table.
+            :param df: DataFrame of the table (or chunk), altered in place.
+            :param rng_context: Optional RNG_Context (or master seed) of the table (or chunk) the method streams are derived from;
+                                its record_offset places the rows of a chunk within the table.
+            :param manifest: Optional Corruption_Manifest the altered row positions are recorded in.
+            :return: The altered DataFrame.
+            """
+            if manifest is not None:
+                  manifest.add_records(len(df))
+            # The method streams are numbered per class, in the order the operations call them
+            analysis_objects = {}
+            for operation in self.operations:
+                  analysis_class, method_name, field_keyword, perc_keyword = corruption_types[operation['type']]
+                  if analysis_class not in analysis_objects:
+                        analysis_objects[analysis_class] = analysis_class(df, rng_context=rng_context, manifest=manifest)
+                  analysis_object = analysis_objects[analysis_class]
+                  # Every object alters the same DataFrame in place, so a replaced field is seen by the next operation
+                  analysis_object.df = df
+                  method_kwargs = {key: value for key, value in operation.items() if key not in ('field', 'type', 'perc')}
+                  method_kwargs[field_keyword] = operation['field'] if isinstance(operation['field'], str) else list(operation['field'])
+                  if 'perc' in operation:
+                        method_kwargs[perc_keyword] = operation['perc']
+                  df = getattr(analysis_object, method_name)(**method_kwargs)
+            return df
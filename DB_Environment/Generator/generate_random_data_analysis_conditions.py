@@ -1,132 +1,419 @@
+import numpy as np
 import pandas as pd
-import random
 from generate_random_dataset_address import addr_abbr_dict
 import generate_random_dataset_support_functions as grdsf
-import datetime
 import re
 
+
+# Lowercase address type -> abbreviation, one dictionary per abbreviation choice of the address types with several
+addr_abbr_variants = [{full.lower(): (abbr[variant_num % len(abbr)] if isinstance(abbr, list) else abbr).lower() \
+                       for full, abbr in addr_abbr_dict.items()} \
+                      for variant_num in range(max(len(abbr) if isinstance(abbr, list) else 1 for abbr in addr_abbr_dict.values()))]
+# Combined pattern of every lowercase address type, longest first so a type is never matched by a shorter one inside it
+addr_abbr_pattern = re.compile("|".join(re.escape(full) for full in sorted(addr_abbr_variants[0], key=len, reverse=True)))
+
+
+# Malformations the Data_Analysis_Err_Conditions can inject, looked up by inject_malformation
+#   well_formed: pattern a record has to match to be malformed
+#   errors: error types, each one regex replacement (pattern, replacement, max replacements per record, -1 for all)
+# Adding an entry plugs a new malformation type in
+malformation_types = {
+      'address': {'well_formed': r'^\d+\s[A-Za-z\s]+$',
+                  'errors': [(r'^(\d)\d*', r'\1', 1),                         # keep only the first digit of the street number
+                             (r'^\d+\s*', '', 1)]},                           # remove the street number
+      'email':   {'well_formed': r'^[a-zA-Z0-9._-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$',
+                  'errors': [(r'\.com', '', -1),                              # remove .com
+                             (r'@', '', -1),                                  # remove @
+                             (r'@.*$', '', 1),                                # remove everything after @
+                             (r'^[^@]*@', '', 1)]},                           # remove everything before @
+      'phone':   {'well_formed': r'^\d{10}$',
+                  'errors': [(r'^(\d{7})\d+$', r'\1', 1),                     # drop the last three digits
+                             (r'^(\d{3})(\d+)$', r'\1--\2', 1),               # broken area code separator
+                             (r'\d', 'O', 1)]},                               # letter O instead of the first digit
+      'zip':     {'well_formed': r'^\d{5}$',
+                  'errors': [(r'^\d', '', 1),                                 # drop the first digit
+                             (r'^(\d{5})$', r'\1-', 1)]},                     # dangling ZIP+4 separator
+      'ip':      {'well_formed': r'^(\d{1,3}\.){3}\d{1,3}$',
+                  'errors': [(r'\.\d{1,3}$', '', 1),                          # drop the last octet
+                             (r'^\d{1,3}', '999', 1)]},                       # out of range first octet
+      'domain':  {'well_formed': r'^[A-Za-z0-9-]+(\.[A-Za-z0-9-]+)+$',
+                  'errors': [(r'\.[A-Za-z]+$', '', 1),                        # drop the top level domain
+                             (r'\.', '..', 1)]},                              # double dot
+}
+
+# Add values to the categories of a categorical field, so they can be assigned to its records
+def add_field_categories(df, field_name, values):
+      """
+      Extend the categories of a categorical field with any of the values it does not have yet.
+      Fields that are not categorical are left as they are.
+      :param df: The DataFrame holding the field.
+      :param field_name: The name of the field.
+      :param values: Values that are about to be assigned to the field.
+      """
+      if not isinstance(df[field_name].dtype, pd.CategoricalDtype):
+            return
+      new_values = [value for value in pd.unique(pd.Series(list(values), dtype=object).dropna()) \
+                    if value not in df[field_name].cat.categories]
+      if new_values:
+            df[field_name] = df[field_name].cat.add_categories(new_values)
+
+# Fields a method is applied to, given one field name or a list of them
+def field_list(df, field_name):
+      """
+      Normalize a field name or list of field names and check they are in the DataFrame.
+      :param df: The DataFrame holding the fields.
+      :param field_name: A field name or a list of field names.
+      :return: List of field names.
+      """
+      field_names = [field_name] if isinstance(field_name, str) else list(field_name)
+      for field in field_names:
+            if field not in df.columns:
+                  raise ValueError(f"{field} not in DataFrame")
+      return field_names
+
+# Records of a field matching a vectorized text condition
+def field_match_mask(df, field_name, match):
+      """
+      Evaluate a text condition against every record of a field.
+      Categorical fields are matched once per category instead of once per record.
+      :param df: The DataFrame holding the field.
+      :param field_name: The name of the field.
+      :param match: Function taking a text Series and returning a boolean Series (e.g. lambda text: text.str.contains("x")).
+      :return: NumPy boolean array, True where the record matches (null records are False).
+      """
+      field = df[field_name]
+      if isinstance(field.dtype, pd.CategoricalDtype):
+            category_mask = match(pd.Series(field.cat.categories.astype(str), dtype="string")).fillna(False).to_numpy(dtype=bool)
+            codes = field.cat.codes.to_numpy()
+            return (codes >= 0) & np.append(category_mask, False)[codes]
+      return match(field.astype("string")).fillna(False).to_numpy(dtype=bool)
+
+# Records of a field that contain a value, ignoring case
+def field_contains_mask(df, field_name, value):
+      """
+      Case-insensitive substring match of a value against every record of a field.
+      :param df: The DataFrame holding the field.
+      :param field_name: The name of the field.
+      :param value: The value to look for.
+      :return: NumPy boolean array, True where the record contains the value (null records are False).
+      """
+      return field_match_mask(df, field_name, lambda text: text.str.contains(value, case=False, regex=False))
+
+# Override the records of a field at row positions in one bulk assignment
+def override_field_positions(df, field_name, positions, values):
+      """
+      Assign values to a field at row positions (not index labels), so any index and streamed chunks work.
+      :param df: The DataFrame holding the field.
+      :param field_name: The name of the field.
+      :param positions: NumPy array of row positions.
+      :param values: A single value or an array of values, one per position.
+      """
+      if len(positions) == 0:
+            return
+      field_loc = df.columns.get_loc(field_name)
+      try:
+            df.iloc[positions, field_loc] = values
+      except (TypeError, ValueError):
+            # Values of another type (e.g. blanks in a numeric field) make it an object field
+            df[field_name] = df[field_name].astype(object)
+            df.iloc[positions, field_loc] = values
+
+# Conditions on the records of a DataFrame, compiled to one vectorized boolean mask
+class Record_Predicate:
+      """
+      A condition on the records of a DataFrame. Field conditions (contains, equals, is_in, between, is_null)
+      are combined with & (and), | (or) and ~ (not), or all_of / any_of for any number of conditions.
+      mask() evaluates the whole condition as one vectorized pass over the fields it uses.
+      e.g. Record_Predicate.contains('Address State', 'ny') & ~Record_Predicate.is_null('Zip Code')
+      """
+      def __init__(self, operator, operands):
+            """
+            Initialize the Record_Predicate object. Use the field condition and combining methods instead.
+            :param operator: One of the field conditions, or 'and', 'or', 'not'.
+            :param operands: Field name and arguments of a field condition, or the combined Record_Predicate objects.
+            """
+            self.operator = operator
+            self.operands = tuple(operands)
+
+      # - - - Field conditions - - -
+      @classmethod
+      def contains(cls, field_name, value):
+            """Records of the field containing the value, ignoring case."""
+            return cls('contains', (field_name, value))
+
+      @classmethod
+      def equals(cls, field_name, value):
+            """Records of the field equal to the value."""
+            return cls('equals', (field_name, value))
+
+      @classmethod
+      def is_in(cls, field_name, values):
+            """Records of the field equal to one of the values."""
+            return cls('is_in', (field_name, list(values)))
+
+      @classmethod
+      def between(cls, field_name, low = None, high = None, inclusive = "both"):
+            """Records of the field from low to high (either bound can be None); inclusive is both, neither, left or right."""
+            if inclusive not in ("both", "neither", "left", "right"):
+                  raise ValueError(f"inclusive value of {inclusive} is not one of both, neither, left, right")
+            return cls('between', (field_name, low, high, inclusive))
+
+      @classmethod
+      def is_null(cls, field_name):
+            """Null or blank records of the field."""
+            return cls('is_null', (field_name,))
+
+      # - - - Combining conditions - - -
+      @classmethod
+      def all_of(cls, *predicates):
+            """Records matching every predicate (all records when none are given)."""
+            return cls('and', predicates)
+
+      @classmethod
+      def any_of(cls, *predicates):
+            """Records matching at least one predicate (no records when none are given)."""
+            return cls('or', predicates)
+
+      def __and__(self, other):
+            return Record_Predicate.all_of(self, other)
+
+      def __or__(self, other):
+            return Record_Predicate.any_of(self, other)
+
+      def __invert__(self):
+            return Record_Predicate('not', (self,))
+
+      def fields(self):
+            """
+            Fields the predicate reads.
+            :return: Set of field names.
+            """
+            if self.operator in ('and', 'or', 'not'):
+                  return set().union(*[predicate.fields() for predicate in self.operands])
+            return {self.operands[0]}
+
+      def mask(self, df):
+            """
+            Evaluate the predicate over every record of a DataFrame.
+            :param df: The DataFrame to evaluate.
+            :return: NumPy boolean array, True for each matching record (null records never match a field condition).
+            """
+            missing_fields = sorted(self.fields() - set(df.columns))
+            if missing_fields:
+                  raise ValueError(f"{missing_fields} not in DataFrame")
+            return self._evaluate(df, {})
+
+      def _evaluate(self, df, field_masks):
+            if self.operator == 'and':
+                  result = np.ones(len(df), dtype=bool)
+                  for predicate in self.operands:
+                        result &= predicate._evaluate(df, field_masks)
+                  return result
+            if self.operator == 'or':
+                  result = np.zeros(len(df), dtype=bool)
+                  for predicate in self.operands:
+                        result |= predicate._evaluate(df, field_masks)
+                  return result
+            if self.operator == 'not':
+                  return ~self.operands[0]._evaluate(df, field_masks)
+            # A field condition used several times in one predicate is only evaluated once
+            key = (self.operator, repr(self.operands))
+            if key not in field_masks:
+                  field_masks[key] = self._field_mask(df)
+            return field_masks[key]
+
+      def _field_mask(self, df):
+            field_name = self.operands[0]
+            field = df[field_name]
+            if self.operator == 'contains':
+                  return field_contains_mask(df, field_name, self.operands[1])
+            if self.operator == 'is_null':
+                  return (field.isna() | (field.astype("string") == "").fillna(False)).to_numpy(dtype=bool)
+            if self.operator == 'equals':
+                  result = field == self.operands[1]
+            elif self.operator == 'is_in':
+                  result = field.isin(self.operands[1])
+            else:
+                  low, high, inclusive = self.operands[1:]
+                  if isinstance(field.dtype, pd.CategoricalDtype):
+                        # Ranges compare the values of a categorical field, not its category order
+                        field = field.astype(field.cat.categories.dtype)
+                  result = pd.Series(True, index=field.index)
+                  if low is not None:
+                        result &= (field >= low) if inclusive in ("both", "left") else (field > low)
+                  if high is not None:
+                        result &= (field <= high) if inclusive in ("both", "right") else (field < high)
+                  result &= field.notna()
+            return result.fillna(False).to_numpy(dtype=bool)
+
 class Data_Analysis_Inserts:
       """
       This class provides methods for inserting specific types of data alterations into a pandas DataFrame. 
       It includes functions to create duplicates within a field and insert specific values into a DataFrame.
       """
-      def __init__(self, df):
+      def __init__(self, df, rng_context = None, manifest = None):
             """
             Initialize the Data_Analysis_Inserts object with a DataFrame.
             :param df: The DataFrame to be manipulated.
+            :param rng_context: Optional RNG_Context (or master seed) the method streams are derived from.
+            :param manifest: Optional Corruption_Manifest the altered row positions are recorded in.
             """
             self.df = df
+            self.rng_context = grdsf.get_rng_context(rng_context).table(type(self).__name__)
+            self.call_count = 0
+            self.manifest = manifest
+
+      def _stream(self, method_name):
+            """
+            Create the random stream of one method call; each call gets its own stream so the
+            sequence of calls on the object replays identically for the same master seed.
+            :param method_name: Name of the calling method.
+            :return: numpy.random.Generator for the call.
+            """
+            self.call_count += 1
+            return self.rng_context.column(f"{method_name}:{self.call_count}")
 
-      def create_duplicates_within_field_random(self, field_name, dup_option_perc = random.randint(10,30), field_perc_to_dup = random.randint(10,30)):
+      def _record(self, field_name, corruption_type, positions):
+            """
+            Record the row positions a method altered in the manifest, offset to their position in the whole table.
+            :param field_name: The name of the altered field.
+            :param corruption_type: Name of the calling method.
+            :param positions: NumPy array of the altered row positions.
             """
-            Create duplicates within a specified field in the DataFrame.
-            :param field_name: The name of the field where duplicates are to be created.
+            if self.manifest is not None:
+                  self.manifest.record(field_name, corruption_type, positions, self.rng_context.record_offset)
+
+      def create_duplicates_within_field_random(self, field_name, dup_option_perc = None, field_perc_to_dup = None):
+            """
+            Create duplicates within one or more fields in the DataFrame.
+            :param field_name: The name of the field (or a list of fields) where duplicates are to be created.
             :param dup_option_perc: Percentage of unique values to be duplicated (default random 10-30%).
             :param field_perc_to_dup: Percentage of the field to be duplicated (default random 10-30%).
             """
-            if field_name not in self.df.columns:
-                  raise ValueError(f"{field_name} not in DataFrame")
+            rng = self._stream('create_duplicates_within_field_random')
+            if dup_option_perc is None:
+                  dup_option_perc = int(rng.integers(10, 30, endpoint=True))
+            if field_perc_to_dup is None:
+                  field_perc_to_dup = int(rng.integers(10, 30, endpoint=True))
+            field_names = field_list(self.df, field_name)
             if dup_option_perc > 100 or dup_option_perc < 0.1:
                   raise Exception(f"dup_option_perc value of {dup_option_perc} is not between 0.1% - 100%")
             if field_perc_to_dup > 100 or field_perc_to_dup < 0.1:
                   raise Exception(f"field_perc_to_dup value of {field_perc_to_dup} is not between 0.1% - 100%")
             
-            # Duplication option
-            unique_values = list(set(self.df[field_name]))
-            duplication_option_perc_num = round(len(unique_values) * (dup_option_perc/100))
-            values_to_duplicate = random.sample(unique_values, duplication_option_perc_num)
-            
-            # Override values at the selected positions with the duplicated values
-            duplication_field_perc_num = round(len(self.df[field_name]) * (field_perc_to_dup/100))
-            index_positions_to_override = random.sample(range(len(self.df)), duplication_field_perc_num)
-            for index in index_positions_to_override:
-                  self.df.at[index, field_name] = random.choice(values_to_duplicate)
+            for field in field_names:
+                  # Duplication option: the first position of each unique value
+                  unique_positions = np.flatnonzero(~self.df[field].duplicated().to_numpy())
+                  if len(unique_positions) == 0:
+                        continue
+                  # At least one value is duplicated, so a low-cardinality field (or small chunk) still gets its duplicates
+                  duplication_option_perc_num = max(1, round(len(unique_positions) * (dup_option_perc/100)))
+                  positions_to_duplicate = unique_positions[rng.choice(len(unique_positions), duplication_option_perc_num, replace=False)]
+                  
+                  # Override values at the selected positions with the duplicated values
+                  duplication_field_perc_num = round(len(self.df) * (field_perc_to_dup/100))
+                  index_positions_to_override = rng.choice(len(self.df), duplication_field_perc_num, replace=False)
+                  source_positions = positions_to_duplicate[rng.integers(len(positions_to_duplicate), size=len(index_positions_to_override))]
+                  override_field_positions(self.df, field, index_positions_to_override, self.df[field].array.take(source_positions))
+                  self._record(field, 'create_duplicates_within_field_random', index_positions_to_override)
             return self.df
 
       
-      def insert_value_by_override_perc(self, field_name, field_perc_to_dup = random.randint(10,20), value = ""):
+      def insert_value_by_override_perc(self, field_name, field_perc_to_dup = None, value = ""):
             """
-            Insert a specific value into a field by overriding a percentage of its values.
-            :param field_name: The name of the field to be modified.
+            Insert a specific value into one or more fields by overriding a percentage of their values.
+            :param field_name: The name of the field (or a list of fields) to be modified.
             :param field_perc_to_dup: Percentage of the field to be overridden (default random 10-20%).
             :param value: The value to be inserted (default empty).
             """
-            if field_name not in self.df.columns:
-                  raise ValueError(f"{field_name} not in DataFrame")
+            rng = self._stream('insert_value_by_override_perc')
+            if field_perc_to_dup is None:
+                  field_perc_to_dup = int(rng.integers(10, 20, endpoint=True))
+            field_names = field_list(self.df, field_name)
             if field_perc_to_dup > 100 or field_perc_to_dup < 0.1:
                   raise Exception(f"field_perc_to_dup value of {field_perc_to_dup} is not between 0.1% - 100%")
             
-            # Override values at the selected positions with Null
-            duplication_field_perc_num = round(len(self.df[field_name]) * (field_perc_to_dup/100))
-            index_positions_to_override = random.sample(range(len(self.df)), duplication_field_perc_num)
-            for index in index_positions_to_override:
-                  self.df.at[index, field_name] = value
+            for field in field_names:
+                  # Override values at the selected positions with the value
+                  duplication_field_perc_num = round(len(self.df) * (field_perc_to_dup/100))
+                  index_positions_to_override = rng.choice(len(self.df), duplication_field_perc_num, replace=False)
+                  add_field_categories(self.df, field, [value])
+                  override_field_positions(self.df, field, index_positions_to_override, value)
+                  self._record(field, 'insert_value_by_override_perc', index_positions_to_override)
             return self.df
             
       
 
 class Data_Analysis_Changes:
-      def __init__(self, df):
+      def __init__(self, df, rng_context = None, manifest = None):
             self.df = df
+            self.rng_context = grdsf.get_rng_context(rng_context).table(type(self).__name__)
+            self.call_count = 0
+            self.manifest = manifest
+
+      def _stream(self, method_name):
+            self.call_count += 1
+            return self.rng_context.column(f"{method_name}:{self.call_count}")
+
+      def _record(self, field_name, corruption_type, positions):
+            if self.manifest is not None:
+                  self.manifest.record(field_name, corruption_type, positions, self.rng_context.record_offset)
             
-      def target_value_change_value(self, field_name, field_perc_to_dup = random.randint(10,20), target_value="", change_value = ""):
+      def target_value_change_value(self, field_name, field_perc_to_dup = None, target_value="", change_value = ""):
+            rng = self._stream('target_value_change_value')
             if field_perc_to_dup is None:
-                  field_perc_to_dup = random.randint(10, 20)
+                  field_perc_to_dup = int(rng.integers(10, 20, endpoint=True))
             if field_name not in self.df.columns:
                   raise ValueError(f"{field_name} not in DataFrame")
             if field_perc_to_dup > 100 or field_perc_to_dup < 0.1:
                   raise Exception(f"field_perc_to_dup value of {field_perc_to_dup} is not between 0.1% - 100%")
             
-            # Generate index list for each record the targeted value occurs
-            index_loc = []  
-            for index in range(len(self.df)):
-                  if target_value.lower() in self.df.at[index, field_name].lower():
-                        index_loc.append(index)
+            # Positions of each record the targeted value occurs in
+            index_loc = np.flatnonzero(field_contains_mask(self.df, field_name, target_value))
             
-            # Apply the percentage operator on the index list
-            random.shuffle(index_loc)
+            # Apply the percentage operator on the positions
+            rng.shuffle(index_loc)
             duplication_field_perc_num = round(len(index_loc) * (field_perc_to_dup/100))  
             index_positions_to_override = index_loc[:duplication_field_perc_num]
-            # Remove duplicates
-            index_positions_to_override = list(set(index_positions_to_override))
-            # Override targeted values at the percentaged index positions with the change value
-            for index in index_positions_to_override:
-                  self.df.at[index, field_name] = self.df.at[index, field_name].replace(target_value, change_value)
+            # Override targeted values at the percentaged positions with the change value
+            changed_values = self.df[field_name].iloc[index_positions_to_override].astype(str).str.replace(target_value, change_value, regex=False).to_numpy(dtype=object)
+            add_field_categories(self.df, field_name, changed_values)
+            override_field_positions(self.df, field_name, index_positions_to_override, changed_values)
+            self._record(field_name, 'target_value_change_value', index_positions_to_override)
             return self.df
       
-      def not_target_record_change_record(self, field_name, field_perc_to_dup = random.randint(10,20), not_target_record="", change_record = ""):
+      def not_target_record_change_record(self, field_name, field_perc_to_dup = None, not_target_record="", change_record = ""):
+            rng = self._stream('not_target_record_change_record')
             if field_perc_to_dup is None:
-                  field_perc_to_dup = random.randint(10, 20)
+                  field_perc_to_dup = int(rng.integers(10, 20, endpoint=True))
             if field_name not in self.df.columns:
                   raise ValueError(f"{field_name} not in DataFrame")
             if field_perc_to_dup > 100 or field_perc_to_dup < 0.1:
                   raise Exception(f"field_perc_to_dup value of {field_perc_to_dup} is not between 0.1% - 100%")
             
-            # Generate index list for each record the targeted value occurs
-            index_loc = []  
-            for index in range(len(self.df)):
-                  if not_target_record.lower() not in self.df.at[index, field_name].lower():
-                        index_loc.append(index)
-
-            # Apply the percentage operator on the index list
-            random.shuffle(index_loc)
+            # Positions of each record the targeted value does not occur in
+            field_mask = ~field_contains_mask(self.df, field_name, not_target_record) & self.df[field_name].notna().to_numpy()
+            index_loc = np.flatnonzero(field_mask)
+
+            # Apply the percentage operator on the positions
+            rng.shuffle(index_loc)
             duplication_field_perc_num = round(len(index_loc) * (field_perc_to_dup/100))  
             index_positions_to_override = index_loc[:duplication_field_perc_num]
-            # Remove duplicates
-            index_positions_to_override = list(set(index_positions_to_override))
-            # Override targeted values at the percentaged index positions with the change value
-            for index in index_positions_to_override:
-                  self.df.at[index, field_name] = change_record
+            # Override the records at the percentaged positions with the change record
+            add_field_categories(self.df, field_name, [change_record])
+            override_field_positions(self.df, field_name, index_positions_to_override, change_record)
+            self._record(field_name, 'not_target_record_change_record', index_positions_to_override)
             return self.df
       
       def target_records_change_record_diff_fields(self, target_field1, target_value1, change_field, change_value,\
                                                          target_field2 = "-----", target_value2 = "-----", \
                                                          target_field3 = "-----", target_value3 = "-----", \
                                                          target_field4 = "-----", target_value4 = "-----", \
-                                                         field_perc_to_dup = random.randint(10,20)):
+                                                         field_perc_to_dup = None):
             # Required argument checks  
+            rng = self._stream('target_records_change_record_diff_fields')
             if field_perc_to_dup is None:
-                  field_perc_to_dup = random.randint(10, 20)
+                  field_perc_to_dup = int(rng.integers(10, 20, endpoint=True))
             if target_field1 not in self.df.columns:
                   raise ValueError(f"{target_field1} not in DataFrame")
             if change_field not in self.df.columns:
@@ -148,91 +435,92 @@ class Data_Analysis_Changes:
             if target_field2 == "-----" and target_field3 == "-----" and target_field4 != "-----":
                   raise ValueError(f"Target fields 1 '{target_field1}' and 4 '{target_field4}' were entered, however Target Field 2 and 3 are missing")
 
-            # Determine case
-            if target_field4 == "-----":
-                  if target_field3 == "-----":
-                        if target_field2 == "-----":
-                              case_degree = 1
-                        else:
-                              case_degree = 2
-                  else:
-                        case_degree = 3
-            else:
-                  case_degree = 4
-            
-            # Generate index list for each record the targeted value occurs
-            index_loc = [] 
-            if case_degree == 4: 
-                  for index in range(len(self.df)):
-                        if target_value1.lower() in self.df.at[index, target_field1].lower() and \
-                           target_value2.lower() in self.df.at[index, target_field2].lower() and \
-                           target_value3.lower() in self.df.at[index, target_field3].lower() and \
-                           target_value4.lower() in self.df.at[index, target_field4].lower():
-                              index_loc.append(index) 
-            elif case_degree == 3:
-                  for index in range(len(self.df)):
-                        if target_value1.lower() in self.df.at[index, target_field1].lower() and \
-                           target_value2.lower() in self.df.at[index, target_field2].lower() and \
-                           target_value3.lower() in self.df.at[index, target_field3].lower():
-                              index_loc.append(index)
-            elif case_degree == 2:
-                  for index in range(len(self.df)):
-                        if target_value1.lower() in self.df.at[index, target_field1].lower() and \
-                           target_value2.lower() in self.df.at[index, target_field2].lower():
-                              index_loc.append(index)
-            else:
-                  for index in range(len(self.df)):
-                        if target_value1.lower() in self.df.at[index, target_field1].lower():
-                              index_loc.append(index)
-            # Apply the percentage operator on the index list
-            random.shuffle(index_loc)
+            # Every entered target field has to contain its target value
+            predicate = Record_Predicate.all_of(*[Record_Predicate.contains(target_field, target_value) for target_field, target_value in \
+                                                  [(target_field1, target_value1), (target_field2, target_value2), (target_field3, target_value3), (target_field4, target_value4)] \
+                                                  if target_field != "-----"])
+            return self._change_records(rng, predicate, change_field, change_value, field_perc_to_dup, 'target_records_change_record_diff_fields')
+
+      def change_records_by_predicate(self, predicate, change_field, change_value, field_perc_to_dup = None):
+            """
+            Change a field to a value on a percentage of the records matching a Record_Predicate.
+            :param predicate: Record_Predicate the records have to match (any number of and/or/not conditions).
+            :param change_field: The name of the field to be changed.
+            :param change_value: The value the field is changed to.
+            :param field_perc_to_dup: Percentage of the matching records to be changed (default random 10-20%).
+            """
+            rng = self._stream('change_records_by_predicate')
+            if field_perc_to_dup is None:
+                  field_perc_to_dup = int(rng.integers(10, 20, endpoint=True))
+            if change_field not in self.df.columns:
+                  raise ValueError(f"{change_field} not in DataFrame")
+            if field_perc_to_dup > 100 or field_perc_to_dup < 0.1:
+                  raise Exception(f"field_perc_to_dup value of {field_perc_to_dup} is not between 0.1% - 100%")
+            return self._change_records(rng, predicate, change_field, change_value, field_perc_to_dup, 'change_records_by_predicate')
+
+      def _change_records(self, rng, predicate, change_field, change_value, field_perc_to_dup, corruption_type):
+            # Positions of each record matching the predicate, from one combined mask
+            index_loc = np.flatnonzero(predicate.mask(self.df))
+            # Apply the percentage operator on the positions
+            rng.shuffle(index_loc)
             duplication_field_perc_num = round(len(index_loc) * (field_perc_to_dup/100))  
             index_positions_to_override = index_loc[:duplication_field_perc_num]
-            # Override change field at the percentaged index positions with the change value
-            for index in index_positions_to_override:
-                  self.df.at[index, change_field] = change_value
+            # Override change field at the percentaged positions with the change value
+            add_field_categories(self.df, change_field, [change_value])
+            override_field_positions(self.df, change_field, index_positions_to_override, change_value)
+            self._record(change_field, corruption_type, index_positions_to_override)
             return self.df
             
-      def address_abbreviation_change(self, field_name, field_perc_to_dup = random.randint(10,20)):
+      def address_abbreviation_change(self, field_name, field_perc_to_dup = None):
+            rng = self._stream('address_abbreviation_change')
+            if field_perc_to_dup is None:
+                  field_perc_to_dup = int(rng.integers(10, 20, endpoint=True))
             if field_name not in self.df.columns:
                   raise ValueError(f"{field_name} not in DataFrame")
             if field_perc_to_dup > 100 or field_perc_to_dup < 0.1:
                   raise Exception(f"field_perc_to_dup value of {field_perc_to_dup} is not between 0.1% - 100%")
             
-            index_loc = []
-            addr_list = list(addr_abbr_dict.keys())
-            addr_list = [value.lower() for value in addr_list]
-            for index in range(len(self.df)):
-                  df_value = self.df.at[index, field_name].lower()
-                  for addr_type in addr_list:
-                        if addr_type in df_value:
-                              index_loc.append(index)
+            # Positions of each record holding an address type, each record once
+            index_loc = np.flatnonzero(field_match_mask(self.df, field_name, lambda text: text.str.lower().str.contains(addr_abbr_pattern)))
             
             # Override values at the selected positions with address abbreviations
-            random.shuffle(index_loc)
+            rng.shuffle(index_loc)
             duplication_field_perc_num = round(len(index_loc) * (field_perc_to_dup/100))
             index_positions_to_override = index_loc[:duplication_field_perc_num]
-            index_positions_to_override = list(set(index_positions_to_override))
-            for index in index_positions_to_override:
-                  original_value = self.df.at[index, field_name]
-                  for full, abbr in addr_abbr_dict.items():
-                        # If abbreviation is a list, choose the first one or randomly
-                        abbr_value = abbr[0] if isinstance(abbr, list) else abbr
-                        # Replace with abbreviation (both lowercase for case-insensitive matching)
-                        self.df.at[index, field_name] = original_value.lower().replace(full.lower(), abbr_value.lower())
-                        original_value = self.df.at[index, field_name]
-                  self.df.at[index, field_name] = self.df.at[index, field_name].title()
-                  
+            changed_values = self.df[field_name].iloc[index_positions_to_override].astype(str).str.lower().to_numpy(dtype=object)
+            # Address types with several abbreviations get one chosen at random per record
+            abbr_variants = rng.integers(len(addr_abbr_variants), size=len(changed_values))
+            for variant_num, abbr_variant in enumerate(addr_abbr_variants):
+                  variant_positions = np.flatnonzero(abbr_variants == variant_num)
+                  if len(variant_positions):
+                        # One pass of the combined pattern replaces every address type of the record
+                        changed_values[variant_positions] = pd.Series(changed_values[variant_positions], dtype=object) \
+                              .str.replace(addr_abbr_pattern, lambda match: abbr_variant[match.group(0)], regex=True).str.title().to_numpy(dtype=object)
+            add_field_categories(self.df, field_name, changed_values)
+            override_field_positions(self.df, field_name, index_positions_to_override, changed_values)
+            self._record(field_name, 'address_abbreviation_change', index_positions_to_override)
             return self.df
             
       
 class Data_Analysis_Err_Conditions:
-      def __init__(self, df):
+      def __init__(self, df, rng_context = None, manifest = None):
             self.df = df
+            self.rng_context = grdsf.get_rng_context(rng_context).table(type(self).__name__)
+            self.call_count = 0
+            self.manifest = manifest
+
+      def _stream(self, method_name):
+            self.call_count += 1
+            return self.rng_context.column(f"{method_name}:{self.call_count}")
+
+      def _record(self, field_name, corruption_type, positions):
+            if self.manifest is not None:
+                  self.manifest.record(field_name, corruption_type, positions, self.rng_context.record_offset)
       
       def closed_date_misalignment(self, closed_date_field, open_date_field=None, modified_date_field=None, apply_perc=None, cond_between_open_mod="Y"):
+            rng = self._stream('closed_date_misalignment')
             if apply_perc is None:
-                  apply_perc = random.randint(10, 20)
+                  apply_perc = int(rng.integers(10, 20, endpoint=True))
             if not (0.1 <= apply_perc <= 100):
                         raise ValueError(f"apply_perc value of {apply_perc} is not between 0.1% - 100%")
             date_fields = []
@@ -243,189 +531,92 @@ class Data_Analysis_Err_Conditions:
                         date_fields.append(open_date_field)     
                   if field == modified_date_field and field != None and field != "":
                         date_fields.append(modified_date_field)
+            # Date fields as day resolution datetime64 arrays; blanks and other non-dates are NaT
+            date_values = {field: pd.to_datetime(self.df[field], errors="coerce").to_numpy().astype("datetime64[D]") for field in date_fields}
+            today = np.datetime64(self.rng_context.reference_date, "D")
             # Determine the earliest date to be used as the start date
-            min_date = self.df[date_fields].min().min()
-            # Check if the result is NaT (Not a Time) or pd.isnull(min_dates) to handle both NaT and None
-            if pd.isnull(min_date):
-                  min_date = pd.to_datetime(datetime.date.today())
-            else:
-                  min_date = pd.to_datetime(min_date)
+            field_min_dates = [np.min(values[~np.isnat(values)]) for values in date_values.values() if (~np.isnat(values)).any()]
+            min_date = min(field_min_dates) if field_min_dates else today
 
             # Calculate the number of records to modify
             num_records_to_modify = round(len(self.df) * (apply_perc / 100))
-            # Select random indices to modify
-            indices_to_modify = random.sample(range(len(self.df)), num_records_to_modify)
+            # Select random positions to modify
+            indices_to_modify = rng.choice(len(self.df), num_records_to_modify, replace=False)
+            
+            open_case = open_date_field != "" and open_date_field != None
+            mod_case = modified_date_field != "" and modified_date_field != None
+            open_dates = date_values[open_date_field][indices_to_modify] if open_case else np.full(len(indices_to_modify), np.datetime64("NaT"), dtype="datetime64[D]")
+            mod_dates = date_values[modified_date_field][indices_to_modify] if mod_case else np.full(len(indices_to_modify), np.datetime64("NaT"), dtype="datetime64[D]")
+            open_valid = ~np.isnat(open_dates)
+            mod_valid = ~np.isnat(mod_dates)
             
-            open_case = 0
-            mod_case = 0
-            if open_date_field != "" and open_date_field != None:
-                  open_case = 1
-            if modified_date_field != "" and modified_date_field != None:
-                  mod_case = 1
-            for index in indices_to_modify:      
-                  start_date = min_date
-                  if open_case == 1 and mod_case == 1:
-                        # Prep df index iff argument conditions
-                        open_val_case = 0
-                        mod_val_case = 0
-                        if self.df.at[index, open_date_field] != "" and not pd.isna(self.df.at[index, open_date_field]) and self.df.at[index, open_date_field] != pd.NaT: 
-                              open_val_case = 1
-                        if self.df.at[index, modified_date_field] != "" and not pd.isna(self.df.at[index, modified_date_field]) and self.df.at[index, modified_date_field] != pd.NaT: 
-                              mod_val_case = 1
-                        # Prepare end date
-                        # (only for first iff condition: modify start date to be between open date field and modified date field)
-                        if cond_between_open_mod == "Y" and open_val_case == 1 and mod_val_case == 1: 
-                              start_date = pd.to_datetime(self.df.at[index, open_date_field])
-                              end_date = pd.to_datetime(self.df.at[index, modified_date_field])
-                        elif open_val_case == 1 and mod_val_case == 1:
-                              end_date = pd.to_datetime(self.df.at[index, modified_date_field or open_date_field])
-                        elif open_val_case == 0 and mod_val_case == 1:
-                              end_date = pd.to_datetime(self.df.at[index, modified_date_field])
-                        else:
-                              end_date = pd.to_datetime(self.df.at[index, open_date_field])
-                        
-                        # Correcting equal dates condition   
-                        if start_date == end_date:
-                              start_date = start_date - pd.Timedelta(days=10)   
-                        generated_date = grdsf.random_date(start_date, end_date)
-                         # Convert the generated date to datetime64[ns] type
-                        compatible_date = pd.to_datetime(generated_date)
-                        # Assign the converted date to the DataFrame
-                        self.df.at[index, closed_date_field] = compatible_date
-                        #self.df.at[index, closed_date_field] = grdsf.random_date(start_date, end_date)
-                        
-                  elif open_case == 1 and mod_case != 1:
-                        # Check if open date record is populated
-                        open_val_case = 0
-                        if self.df.at[index, open_date_field] != "" and not pd.isna(self.df.at[index, open_date_field]) and self.df.at[index, open_date_field] != pd.NaT: 
-                              open_val_case = 1
-                        # Generate end date
-                        if open_val_case == 1:      
-                              end_date = pd.to_datetime(self.df.at[index, open_date_field])
-                        else:
-                              end_date = datetime.date.today()
-                        
-                        # Generate the random date    
-                        if start_date == end_date:
-                              start_date = start_date - pd.Timedelta(days=10)
-                              
-                        generated_date = grdsf.random_date(start_date, end_date)
-                         # Convert the generated date to datetime64[ns] type
-                        compatible_date = pd.to_datetime(generated_date)
-                        # Assign the converted date to the DataFrame
-                        self.df.at[index, closed_date_field] = compatible_date
-                        #self.df.at[index, closed_date_field] = grdsf.random_date(start_date, end_date)
-                  elif open_case != 1 and mod_case == 1:
-                        # Check if open date record is populated
-                        open_val_case = 0
-                        if self.df.at[index, modified_date_field] != "" and not pd.isna(self.df.at[index, modified_date_field]) and self.df.at[index, modified_date_field] != pd.NaT: 
-                              open_val_case = 1
-                        # Generate end date
-                        if open_val_case == 1:      
-                              end_date = pd.to_datetime(self.df.at[index, modified_date_field])
-                        else:
-                              end_date = datetime.date.today()
-                              
-                        # Generate the random date    
-                        if start_date == end_date:
-                              start_date = start_date - pd.Timedelta(days=10)
-                              
-                        generated_date = grdsf.random_date(start_date, end_date)
-                         # Convert the generated date to datetime64[ns] type
-                        compatible_date = pd.to_datetime(generated_date)
-                        # Assign the converted date to the DataFrame
-                        self.df.at[index, closed_date_field] = compatible_date
-                        #self.df.at[index, closed_date_field] = grdsf.random_date(start_date, end_date)
-                  else:
-                        end_date = datetime.date.today()
-                        # Generate the random date    
-                        generated_date = grdsf.random_date(start_date, end_date)
-                         # Convert the generated date to datetime64[ns] type
-                        compatible_date = pd.to_datetime(generated_date)
-                        # Assign the converted date to the DataFrame
-                        self.df.at[index, closed_date_field] = compatible_date
-                        #self.df.at[index, closed_date_field] = grdsf.random_date(start_date, end_date)
+            # Closed dates are drawn before the modified date, else before the open date, else before today
+            start_dates = np.full(len(indices_to_modify), min_date, dtype="datetime64[D]")
+            end_dates = np.where(mod_valid, mod_dates, np.where(open_valid, open_dates, today))
+            if open_case and mod_case and cond_between_open_mod == "Y":
+                  # Between the open date and the modified date when both are populated
+                  between_open_mod = open_valid & mod_valid
+                  start_dates[between_open_mod] = open_dates[between_open_mod]
+            # Correcting equal dates condition
+            start_dates[start_dates == end_dates] -= np.timedelta64(10, "D")
+            if (start_dates > end_dates).any():
+                  raise ValueError("start_date must be before end_date")
+            
+            # Draw every misaligned closed date at once and assign them in one operation
+            days_between_dates = (end_dates - start_dates).astype(np.int64)
+            generated_dates = start_dates + rng.integers(0, days_between_dates - 1, endpoint=True)
+            override_field_positions(self.df, closed_date_field, indices_to_modify, generated_dates.astype("datetime64[ns]"))
+            self._record(closed_date_field, 'closed_date_misalignment', indices_to_modify)
             return self.df
       
-      def address_incorrect_format(self, field_name, apply_perc=None):
+      def inject_malformation(self, field_name, malformation, apply_perc=None):
+            """
+            Malform a percentage of the populated records of a field. Sampled records that are well formed get one
+            error type of the malformation drawn at random, and each error type is applied to its records as one
+            column-level regex replacement.
+            :param field_name: The name of the field to be malformed.
+            :param malformation: Name of a malformation_types entry, or a dictionary in the same format.
+            :param apply_perc: Percentage of the populated records sampled (default random 10-20%).
+            """
+            corruption_type = f"inject_malformation:{malformation}" if isinstance(malformation, str) else 'inject_malformation'
+            return self._inject_malformation(self._stream('inject_malformation'), field_name, malformation, apply_perc, corruption_type)
+
+      def _inject_malformation(self, rng, field_name, malformation, apply_perc, corruption_type):
             if field_name not in self.df.columns:
                   raise ValueError(f"{field_name} not in DataFrame")
             if apply_perc is None:
-                  apply_perc = random.randint(10, 20)
+                  apply_perc = int(rng.integers(10, 20, endpoint=True))
             if not (0.1 <= apply_perc <= 100):
                         raise ValueError(f"apply_perc value of {apply_perc} is not between 0.1% - 100%")
+            if isinstance(malformation, str):
+                  if malformation not in malformation_types:
+                        raise ValueError(f"Malformation {malformation} is not one of {list(malformation_types)}")
+                  malformation = malformation_types[malformation]
             
-
-            indexes = self.df.index[self.df[field_name].notnull()].tolist()
-            num_records_to_modify = round(len(indexes) * (apply_perc / 100))
-            # Ensure that num_records_to_modify is not greater than the length of indexes
-            num_records_to_modify = min(num_records_to_modify, len(indexes))
-            # Select random indices to modify
-            indices_to_modify = random.sample(indexes, num_records_to_modify)
-
-            pattern = r'^\d+\s[A-Za-z\s]+$'
-            for index in indices_to_modify:
-                  # Check if variable is in basic street format
-                  if not re.match(pattern, self.df.at[index, field_name]):
-                        pass
-                  else:
-                        addr_err_code = random.randint(1,2)
-                        if addr_err_code == 1:
-                              # Regular expression to find the digit part of the address, and replace it with only the first digit
-                              # ^\d+\s* matches the beginning of the string, one or more digits, followed by zero or more spaces
-                              match = re.search(r'^\d+', self.df.at[index, field_name])
-                              street_number = match.group()
-                              shortened_street_number = street_number[:1]
-                              self.df.at[index, field_name] = re.sub(r'^\d+', shortened_street_number, self.df.at[index, field_name])
-                        elif addr_err_code == 2:
-                              # Regular expression to remove the numeric part at the beginning of the address
-                              # ^\d+\s* matches the beginning of the string, one or more digits, followed by zero or more spaces
-                              self.df.at[index, field_name] = re.sub(r'^\d+\s*', '', self.df.at[index, field_name])
-                        else:
-                              pass
+            positions = np.flatnonzero(self.df[field_name].notna().to_numpy())
+            num_records_to_modify = round(len(positions) * (apply_perc / 100))
+            # Ensure that num_records_to_modify is not greater than the number of populated records
+            num_records_to_modify = min(num_records_to_modify, len(positions))
+            # Select random positions to modify
+            positions_to_modify = positions[rng.choice(len(positions), num_records_to_modify, replace=False)]
             
+            # Only records in the well formed format are malformed, each with one error code
+            values = self.df[field_name].iloc[positions_to_modify].astype(str).reset_index(drop=True)
+            well_formed = values.str.match(malformation['well_formed']).to_numpy(dtype=bool)
+            values = values[well_formed]
+            positions_to_modify = positions_to_modify[well_formed]
+            err_codes = rng.integers(1, len(malformation['errors']), size=len(values), endpoint=True)
+            for err_code, (pattern, replacement, count) in enumerate(malformation['errors'], start=1):
+                  err_records = err_codes == err_code
+                  if err_records.any():
+                        changed_values = values[err_records].str.replace(pattern, replacement, n=count, regex=True).to_numpy(dtype=object)
+                        add_field_categories(self.df, field_name, changed_values)
+                        override_field_positions(self.df, field_name, positions_to_modify[err_records], changed_values)
+                        self._record(field_name, corruption_type, positions_to_modify[err_records])
             return self.df
-                  
-            
+
+      def address_incorrect_format(self, field_name, apply_perc=None):
+            return self._inject_malformation(self._stream('address_incorrect_format'), field_name, 'address', apply_perc, 'address_incorrect_format')
       
       def email_incorrect_format(self, field_name, apply_perc=None):
-            if field_name not in self.df.columns:
-                  raise ValueError(f"{field_name} not in DataFrame")
-            if apply_perc is None:
-                  apply_perc = random.randint(10, 20)
-            if not (0.1 <= apply_perc <= 100):
-                        raise ValueError(f"apply_perc value of {apply_perc} is not between 0.1% - 100%")
-            
-            indexes = self.df.index[self.df[field_name].notnull()].tolist()
-            num_records_to_modify = round(len(indexes) * (apply_perc / 100))
-            # Ensure that num_records_to_modify is not greater than the length of indexes
-            num_records_to_modify = min(num_records_to_modify, len(indexes))
-            # Select random indices to modify
-            indices_to_modify = random.sample(indexes, num_records_to_modify)
-            
-            pattern = r'^[a-zA-Z0-9._-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            for index in indices_to_modify:
-                  # Check if variable is in basic street format
-                  if not re.match(pattern, self.df.at[index, field_name]):
-                        pass
-                  else:
-                        err_code = random.randint(1, 4)
-                        email = self.df.at[index, field_name]
-                        if err_code == 1:
-                              # remove .com
-                              self.df.at[index, field_name] = email.replace('.com', '')
-                        elif err_code == 2:
-                              # remove @
-                              self.df.at[index, field_name] = email.replace('@', '')
-                        elif err_code == 3:
-                              # remove everything after @
-                              at_index = email.find('@')
-                              if at_index != -1:
-                                    self.df.at[index, field_name] = email[:at_index]
-                        else:
-                              # remove everything before @
-                              at_index = email.find('@')
-                              if at_index != -1:
-                                    self.df.at[index, field_name] = email[at_index+1:]
-                                    
-            return self.df
\ No newline at end of file
+            return self._inject_malformation(self._stream('email_incorrect_format'), field_name, 'email', apply_perc, 'email_incorrect_format')
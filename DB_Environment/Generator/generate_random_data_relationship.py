@@ -1,20 +1,38 @@
 import pandas as pd
-import random
+import numpy as np
+import generate_random_dataset_support_functions as grdsf
 
 
 class Foreign_Keys:
-      def __init__(self, df, db_fk_field_name, foreign_key_abbreviation_pre = "", foreign_key_abbreviation_post = ""):
+      def __init__(self, df, db_fk_field_name, foreign_key_abbreviation_pre = "", foreign_key_abbreviation_post = "", rng_context = None):
             self.df = df
             self.db_fk_field_name = db_fk_field_name
             self.foreign_key_abbreviation_pre = foreign_key_abbreviation_pre
             self.foreign_key_abbreviation_post = foreign_key_abbreviation_post
+            self.rng_context = grdsf.get_rng_context(rng_context).table(f"foreign_key:{db_fk_field_name}")
+            self.call_count = 0
+
+      def _stream(self, method_name):
+            self.call_count += 1
+            return self.rng_context.column(f"{method_name}:{self.call_count}")
       
-      def add_foreignkey_random(self, df2, col_placement = 3):
+      def add_foreignkey_random(self, df2, col_placement = 3, distribution = 'uniform', **distribution_kwargs):
+            """
+            Insert a foreign key into df2, each record drawing a key of the parent DataFrame in one vectorized call.
+            :param df2: The child DataFrame receiving the foreign key.
+            :param col_placement: Column position of the foreign key in df2 (default 3).
+            :param distribution: How child records spread over the parent keys, one of grdsf.skewed_index_distributions:
+                                 'uniform' (default), 'zipf', 'hot_key' or 'at_least_once'.
+            :param distribution_kwargs: zipf_exponent, hot_value_perc or hot_record_perc (see grdsf.generate_skewed_index_array).
+            :return: df2 with the foreign key inserted.
+            """
             if self.db_fk_field_name not in self.df.columns:
                   raise ValueError(f"{self.db_fk_field_name} not in first DataFrame")
             
-            db_fk_list = self.df[self.db_fk_field_name].tolist()
-            random_fk_values = [random.choice(db_fk_list) for _ in range(len(df2))]
+            rng = self._stream('add_foreignkey_random')
+            db_fk_list = self.df[self.db_fk_field_name].to_numpy()
+            fk_index = grdsf.generate_skewed_index_array(len(df2), len(db_fk_list), distribution, rng, **distribution_kwargs)
+            random_fk_values = db_fk_list[fk_index]
             
             if self.db_fk_field_name in df2.columns:
                   df2 = df2.drop(columns=self.db_fk_field_name)
@@ -23,56 +41,166 @@ class Foreign_Keys:
             return df2
             
       
-      def add_foreignkey_conditions(self):
-            pass
+      def add_foreignkey_conditions(self, df2, col_placement = 3, parent_filter = None, match_fields = None, date_rule = None):
+            """
+            Insert a foreign key into df2 where each record only draws among the parent keys that satisfy the rules.
+            The parent table is indexed once: eligible parents are sorted by (match partition, date), so each child
+            record finds its range of eligible parents with two vectorized binary searches and draws uniformly in it.
+            Child records without any eligible parent get a null key.
+            :param df2: The child DataFrame receiving the foreign key.
+            :param col_placement: Column position of the foreign key in df2 (default 3).
+            :param parent_filter: Dictionary of parent field -> allowed value or list of values, e.g. {'Legal Status': ['ACTIVE']}.
+            :param match_fields: Dictionary of parent field -> child field whose values must be equal, e.g. {'Currency': 'Currency'}.
+            :param date_rule: Tuple (child date field, parent date field): the child date must be on or after the parent date.
+                              Parents without a date are not eligible; children without a date may use any parent.
+            :return: df2 with the foreign key inserted.
+            """
+            if self.db_fk_field_name not in self.df.columns:
+                  raise ValueError(f"{self.db_fk_field_name} not in first DataFrame")
+            parent_filter = parent_filter or {}
+            match_fields = match_fields or {}
+            for parent_field in list(parent_filter) + list(match_fields) + ([date_rule[1]] if date_rule else []):
+                  if parent_field not in self.df.columns:
+                        raise ValueError(f"{parent_field} not in first DataFrame")
+            for child_field in list(match_fields.values()) + ([date_rule[0]] if date_rule else []):
+                  if child_field not in df2.columns:
+                        raise ValueError(f"{child_field} not in second DataFrame")
+
+            rng = self._stream('add_foreignkey_conditions')
+            num_parents = len(self.df)
+            num_children = len(df2)
+
+            # Parent rows passing the filter
+            eligible = np.ones(num_parents, dtype=bool)
+            for parent_field, allowed_values in parent_filter.items():
+                  allowed_values = allowed_values if isinstance(allowed_values, (list, tuple, set)) else [allowed_values]
+                  eligible &= np.isin(np.asarray(self.df[parent_field]), list(allowed_values))
+
+            # Partition code of every parent and child row: the position of its match values among the parent combinations
+            parent_codes = np.zeros(num_parents, dtype=np.int64)
+            child_codes = np.zeros(num_children, dtype=np.int64)
+            if match_fields:
+                  parent_match = pd.MultiIndex.from_arrays([np.asarray(self.df[field], dtype=object) for field in match_fields])
+                  child_match = pd.MultiIndex.from_arrays([np.asarray(df2[field], dtype=object) for field in match_fields.values()])
+                  match_codes, match_values = pd.factorize(parent_match)
+                  parent_codes = match_codes.astype(np.int64)
+                  child_codes = pd.Index(match_values).get_indexer(child_match).astype(np.int64)
+
+            # Date rank of every parent and child row on one shared scale (0 when there is no date rule)
+            parent_ranks = np.zeros(num_parents, dtype=np.int64)
+            child_ranks = np.zeros(num_children, dtype=np.int64)
+            num_ranks = 1
+            if date_rule:
+                  child_dates = pd.to_datetime(pd.Series(np.asarray(df2[date_rule[0]], dtype=object)), errors='coerce').to_numpy('datetime64[ns]')
+                  parent_dates = pd.to_datetime(pd.Series(np.asarray(self.df[date_rule[1]], dtype=object)), errors='coerce').to_numpy('datetime64[ns]')
+                  eligible &= ~np.isnat(parent_dates)
+                  date_values, date_ranks = np.unique(np.concatenate([parent_dates, child_dates]), return_inverse=True)
+                  num_ranks = len(date_values) + 1
+                  parent_ranks = date_ranks[:num_parents].astype(np.int64)
+                  # A child without a date ranks above every parent date
+                  child_ranks = np.where(np.isnat(child_dates), num_ranks - 1, date_ranks[num_parents:]).astype(np.int64)
+
+            # Sorted index over the eligible parents by (partition, date)
+            parent_positions = np.flatnonzero(eligible)
+            parent_index_keys = parent_codes[parent_positions] * num_ranks + parent_ranks[parent_positions]
+            index_order = np.argsort(parent_index_keys, kind='stable')
+            parent_positions = parent_positions[index_order]
+            parent_index_keys = parent_index_keys[index_order]
+
+            # Range of eligible parents of every child: its partition, up to its date
+            lower = np.searchsorted(parent_index_keys, child_codes * num_ranks, side='left')
+            upper = np.searchsorted(parent_index_keys, child_codes * num_ranks + child_ranks, side='right')
+            num_eligible = np.where(child_codes < 0, 0, upper - lower)
+            matched = num_eligible > 0
+            offsets = np.floor(rng.random(num_children) * np.maximum(num_eligible, 1)).astype(np.int64)
+            fk_positions = np.full(num_children, -1, dtype=np.int64)
+            fk_positions[matched] = parent_positions[lower[matched] + offsets[matched]]
+            fk_values = pd.array(self.df[self.db_fk_field_name].to_numpy()).take(fk_positions, allow_fill=True)
+
+            if self.db_fk_field_name in df2.columns:
+                  df2 = df2.drop(columns=self.db_fk_field_name)
+
+            df2.insert(col_placement - 1, self.foreign_key_abbreviation_pre + self.db_fk_field_name + self.foreign_key_abbreviation_post, fk_values)
+            return df2
       
 
 class Intermediary_Data:
-      def __init__(self, relationship_id_field_name = "Relationship ID"):
+      def __init__(self, relationship_id_field_name = "Relationship ID", rng_context = None):
             self.rel_id_name = relationship_id_field_name
+            self.rng_context = grdsf.get_rng_context(rng_context).table(f"intermediary:{relationship_id_field_name}")
+            self.call_count = 0
+
+      def _stream(self, method_name):
+            self.call_count += 1
+            return self.rng_context.column(f"{method_name}:{self.call_count}")
       
+      # Relationship builder: any number of tables, fan-out per record of the first table, cardinality per linked table
+      def create_relationship_df(self, tables, traits = None, fan_out = 1):
+            """
+            Build an intermediary (bridge) table linking any number of tables in one vectorized pass.
+            Each record of the first table gets fan_out bridge records; every other table contributes one ID per bridge record.
+            :param tables: List of (df, id_field_name) or (df, id_field_name, link_rules) entries, the first one being the
+                           table the bridge records follow. link_rules is a dictionary with
+                           'cardinality': 'M:N' (default, IDs can repeat) or '1:N' (each ID is used at most once), and for
+                           'M:N' the 'distribution' / 'distribution_kwargs' of grdsf.generate_skewed_index_array.
+            :param traits: Dictionary of trait field name -> vocabulary list, or (vocabulary list, weight list), drawn per bridge record.
+            :param fan_out: Bridge records per record of the first table: an int (default 1), or a dictionary
+                            {'distribution': 'uniform', 'min': 1, 'max': 5}, {'distribution': 'poisson', 'mean': 2}
+                            or {'distribution': 'zipf', 'max': 50, 'zipf_exponent': 2} (see grdsf.generate_fan_out_array).
+            :return: DataFrame with the relationship ID, one ID field per table and the trait fields.
+            """
+            return self._build_relationship_df(self._stream('create_relationship_df'), tables, traits, fan_out)
+
+      def _build_relationship_df(self, rng, tables, traits = None, fan_out = 1):
+            if len(tables) < 2:
+                  raise ValueError(f"At least two tables are needed for a relationship, {len(tables)} given")
+            tables = [table if len(table) == 3 else (table[0], table[1], {}) for table in tables]
+            for df, id_field_name, _ in tables:
+                  if id_field_name not in df.columns:
+                        raise ValueError(f"{id_field_name} not in DataFrame")
+            id_field_names = [id_field_name for _, id_field_name, _ in tables]
+            if len(set(id_field_names + [self.rel_id_name] + list(traits or {}))) != len(id_field_names) + 1 + len(traits or {}):
+                  raise ValueError(f"Relationship fields {id_field_names + [self.rel_id_name] + list(traits or {})} are not distinct")
+
+            df1, df1_id_field_name, _ = tables[0]
+            df1_ids = df1[df1_id_field_name].to_numpy()
+            if fan_out == 1:
+                  anchor_ids = df1_ids
+            else:
+                  anchor_ids = np.repeat(df1_ids, grdsf.generate_fan_out_array(len(df1_ids), fan_out, rng))
+            num_records = len(anchor_ids)
+
+            new_relationship_df = pd.DataFrame({self.rel_id_name: 1 + rng.permutation(num_records), df1_id_field_name: anchor_ids})
+            for df, id_field_name, link_rules in tables[1:]:
+                  linked_ids = df[id_field_name].to_numpy()
+                  cardinality = link_rules.get('cardinality', 'M:N')
+                  if cardinality == '1:N':
+                        if num_records > len(linked_ids):
+                              raise ValueError(f"1:N link to {id_field_name} needs {num_records} IDs but the table has {len(linked_ids)}")
+                        linked_index = rng.permutation(len(linked_ids))[:num_records]
+                  elif cardinality == 'M:N':
+                        linked_index = grdsf.generate_skewed_index_array(num_records, len(linked_ids), link_rules.get('distribution', 'uniform'), \
+                                                                         rng, **link_rules.get('distribution_kwargs', {}))
+                  else:
+                        raise ValueError(f"cardinality {cardinality} is not one of ['1:N', 'M:N']")
+                  new_relationship_df[id_field_name] = linked_ids[linked_index]
+            for trait_field_name, trait_vocabulary in (traits or {}).items():
+                  trait_list, weight_list = trait_vocabulary if isinstance(trait_vocabulary, tuple) else (trait_vocabulary, None)
+                  new_relationship_df[trait_field_name] = grdsf.generate_random_categorical_array(num_records, trait_list, weight_list, rng)
+            return new_relationship_df
+
       # Two databases establishing a data relationship where the db1 IDs - db2 IDs are randomized 
       def create_2db_relationship_df_random(self, df1, df1_id_field_name, df2, df2_id_field_name):
-            new_relationship_df = pd.DataFrame()
-            new_relationship_df[df1_id_field_name] = df1[df1_id_field_name]
-            
-            random_rel_id = random.sample(range(1, len(df1) + 1), len(df1))
-            new_relationship_df.insert(0, self.rel_id_name, random_rel_id)
-            
-            random_df2_id_list = [random.choice(df2[df2_id_field_name]) for _ in range(len(df1))]
-            new_relationship_df[df2_id_field_name] = random_df2_id_list
-            
-            return new_relationship_df
+            return self._build_relationship_df(self._stream('create_2db_relationship_df_random'), \
+                                               [(df1, df1_id_field_name), (df2, df2_id_field_name)])
             
       
       # Three databases establishing a data relationship where the db1 IDs - db2 IDs - db3 IDs are randomized 
       def create_3db_relationship_df_random(self, df1, df1_id_field_name, df2, df2_id_field_name, df3, df3_id_field_name):
-            new_relationship_df = pd.DataFrame()
-            new_relationship_df[df1_id_field_name] = df1[df1_id_field_name]
-            
-            random_rel_id = [random.randint(1,len(df1)) for _ in range(len(df1))]
-            new_relationship_df.insert(0, self.rel_id_name, random_rel_id)
-            
-            random_df2_id_list = [random.choice(df2[df2_id_field_name]) for _ in range(len(df1))]
-            new_relationship_df[df2_id_field_name] = random_df2_id_list
-            
-            random_df3_id_list = [random.choice(df3[df3_id_field_name]) for _ in range(len(df1))]
-            new_relationship_df[df3_id_field_name] = random_df3_id_list
-            
-            return new_relationship_df
+            return self._build_relationship_df(self._stream('create_3db_relationship_df_random'), \
+                                               [(df1, df1_id_field_name), (df2, df2_id_field_name), (df3, df3_id_field_name)])
       
       # Two databases establishing a data relationship with a trait category where the db1 IDs - db2 IDs are randomized 
       def create_2db_relationship_df_random_trait(self, df1, df1_id_field_name, df2, df2_id_field_name, trait):
-            new_relationship_df = pd.DataFrame()
-            new_relationship_df[df1_id_field_name] = df1[df1_id_field_name]
-            
-            random_rel_id = random.sample(range(1, len(df1) + 1), len(df1))
-            new_relationship_df.insert(0, self.rel_id_name, random_rel_id)
-            
-            random_df2_id_list = [random.choice(df2[df2_id_field_name]) for _ in range(len(df1))]
-            new_relationship_df[df2_id_field_name] = random_df2_id_list
-            
-            random_trait_list = [random.choice(trait) for _ in range(len(df1))]
-            new_relationship_df['Relationship Trait'] = random_trait_list
-            
-            return new_relationship_df
\ No newline at end of file
+            return self._build_relationship_df(self._stream('create_2db_relationship_df_random_trait'), \
+                                               [(df1, df1_id_field_name), (df2, df2_id_field_name)], traits={'Relationship Trait': trait})
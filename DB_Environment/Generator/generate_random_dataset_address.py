@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 import random
 from datetime import datetime, timedelta
 import generate_random_dataset_support_functions as gtsf
@@ -114,14 +115,15 @@ def generate_random_address(street_names, city_names, states):
 #----------------------------------------------------------------------------------
 
 # Generate the Address Account field
-def generate_address_account_field(num_records, len_id_char = 8):
+def generate_address_account_field(num_records, len_id_char = 8, rng = None, id_offset = 0):
       """
       Generate a list of random integers representing address account fields.
       :param num_records: Number of records to generate.
       :param len_id_char: Length of each integer in characters (default is 8).
-      :return: List of random integers representing address accounts.
+      :param rng: Optional numpy.random.Generator the ID permutation key is drawn from (default module generator).
+      :param id_offset: Position of the first ID in the permutation, for chunks of a table (default 0).
+      :return: Array of random integers representing address accounts.
       """
-      dict_list = []
       if type(len_id_char) == str:
             if len_id_char.isdigit():
                   zeros_req = int(len_id_char)-1
@@ -130,59 +132,50 @@ def generate_address_account_field(num_records, len_id_char = 8):
       else:
             zeros_req = len_id_char - 1
             
-      zeros = "0" * zeros_req
-      min = int("1"+zeros)
-      max = int("9"*len_id_char) 
-      for _ in range(num_records):
-            dict_list.append(random.randint(min, max))
-      return dict_list
+      return gtsf.generate_unique_id_array(num_records, zeros_req + 1, rng, id_offset)
 
 # Generate the Address line fields
-def generate_address_fields(num_records):
+def generate_address_fields(num_records, rng = None):
       """
       Generate address components for a specified number of records.
       :param num_records: Number of records to generate address components for.
-      :return: Four lists containing address street, city, state, and zipcode.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Four arrays containing address street, city, state, and zipcode.
       """
-      dict_addr_street_list = []
-      dict_addr_city_list = []
-      dict_addr_state_list = []
-      dict_addr_zipcode_list = []
-  
-      for _ in range(num_records):
-            addr = generate_random_address(street_names, city_names, states).split(", ")
-            dict_addr_street_list.append(addr[0])
-            dict_addr_city_list.append(addr[1])
-            dict_addr_state_list.append(addr[2])
-            dict_addr_zipcode_list.append(addr[3])
+      street_number = gtsf.generate_random_int_array(num_records, 100, 9999, rng)
+      street_name = gtsf.generate_random_choice_array(num_records, street_names, rng)
+      street_type = gtsf.generate_random_choice_array(num_records, addr_street_type_list, rng)
+      dict_addr_street_list = gtsf.join_string_arrays([street_number, street_name, street_type], " ")
+      dict_addr_city_list = gtsf.generate_random_choice_array(num_records, city_names, rng)
+      dict_addr_state_list = gtsf.generate_random_choice_array(num_records, states, rng)
+      # Half of the zip codes are 5 digits, the other half use the 5+4 digit format
+      zip_cond = gtsf.generate_random_int_array(num_records, 1, 2, rng)
+      zip_code = gtsf.generate_random_int_array(num_records, 10000, 99999, rng).astype(str)
+      zip_code_ext = gtsf.join_string_arrays([zip_code, gtsf.generate_random_int_array(num_records, 1000, 9999, rng)], "-")
+      dict_addr_zipcode_list = np.where(zip_cond == 1, zip_code, zip_code_ext)
       return dict_addr_street_list, dict_addr_city_list, dict_addr_state_list, dict_addr_zipcode_list
 
 # Generate the Address Original Country field
-def generate_address_original_country_field(num_records, priority_item = 'US', weight_us = 10, weight_oth = 1):
+def generate_address_original_country_field(num_records, priority_item = 'US', weight_us = 10, weight_oth = 1, rng = None):
       """
       Generate a list of country abbreviations with a weighted priority for a specific country.
       :param num_records: Number of records to generate.
       :param priority_item: Country abbreviation to prioritize (default 'US').
       :param weight_us: Weight for the priority country (default 10).
       :param weight_oth: Weight for other countries (default 1).
-      :return: List of country abbreviations.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Categorical of country abbreviations.
       """
-      dict_list = [] 
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_random_unique_weighted_list(country_abbreviations, priority_item, weight_us, weight_oth))
-      return dict_list
+      return gtsf.generate_random_unique_weighted_categorical(num_records, country_abbreviations, priority_item, weight_us, weight_oth, rng)
      
 # Generate the Address Registered Country field 
 def generate_address_registered_country_field(num_records):
       """
       Generate a list of 'US' country abbreviations for a specified number of records.
       :param num_records: Number of records to generate.
-      :return: List of 'US' country abbreviations.
+      :return: Categorical of 'US' country abbreviations.
       """
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append('US')
-      return dict_list
+      return pd.Categorical(np.full(num_records, 'US'), categories=country_abbreviations)
 
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
@@ -191,18 +184,21 @@ def generate_address_registered_country_field(num_records):
 #----------------------------------------------------------------------------------
 
 # Function to run each field to build the address table
-def generate_table_address_general(dict, id_field_name = 'ID_Record'):
+def generate_table_address_general(dict, id_field_name = 'ID_Record', rng_context = None, total_records = None):
       """
       Build an address table by generating various address-related fields.
       :param dict: Dictionary to populate with address data.
       :param num_records: Number of records to generate for the table.
+      :param rng_context: Optional RNG_Context (or master seed) the table's column streams are derived from.
+      :param total_records: Rows of the whole table when dict holds one chunk of it (default the rows in dict).
       :return: Dictionary populated with generated address data.
       """
-      num_records = len(dict[id_field_name])
-      dict['Address ID'] = generate_address_account_field(num_records)
-      dict['Address Street'], dict['City'], dict['State'], dict['Zip Code'] = generate_address_fields(num_records)
+      num_records = gtsf.resolve_id_records(dict, id_field_name)
+      rng_context = gtsf.get_rng_context(rng_context).table('address_general')
+      dict['Address ID'] = generate_address_account_field(num_records, gtsf.unique_id_width(8, num_records if total_records is None else total_records), rng=rng_context.table_column('Address ID'), id_offset=rng_context.record_offset)
+      dict['Address Street'], dict['City'], dict['State'], dict['Zip Code'] = generate_address_fields(num_records, rng=rng_context.column('Address Street'))
       dict['Registered Country'] = generate_address_registered_country_field(num_records)
-      dict['Original Country'] = generate_address_original_country_field(num_records, weight_us=20)
+      dict['Original Country'] = generate_address_original_country_field(num_records, weight_us=20, rng=rng_context.column('Original Country'))
       return dict
 
 #----------------------------------------------------------------------------------
@@ -1,5 +1,5 @@
 import pandas as pd
-import random
+import numpy as np
 from datetime import datetime, timedelta
 import generate_random_dataset_support_functions as gtsf
 
@@ -54,14 +54,14 @@ dict_jobs = {
 #----------------------------------------------------------------------------------
 
 # Generate the Employee ID field
-def generate_emp_id_field(num_records, len_id_char = 7):
+def generate_emp_id_field(num_records, len_id_char = 7, rng = None):
       """
       Generate a list of unique employee IDs with a specified character length.
       :param num_records: Number of IDs to generate.
       :param len_id_char: Length of each ID in characters (default is 7).
-      :return: List of employee IDs.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of employee IDs.
       """
-      dict_list = []
       if type(len_id_char) == str:
             if len_id_char.isdigit():
                   zeros_req = int(len_id_char)-1
@@ -73,58 +73,47 @@ def generate_emp_id_field(num_records, len_id_char = 7):
       zeros = "0" * zeros_req
       min = int("1"+zeros)
       max = int("9"*len_id_char) 
-      for _ in range(num_records):
-            dict_list.append(random.randint(min, max))
-      return dict_list
+      return gtsf.generate_random_int_array(num_records, min, max, rng)
 
 # Generate the Employee First Name field
-def generate_emp_first_name_field(num_records):
+def generate_emp_first_name_field(num_records, rng = None):
       """
       Generate a list of random employee first names from a predefined list.
       :param num_records: Number of first names to generate.
-      :return: List of employee first names.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of employee first names.
       """
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(random.choice(first_names))
-      return dict_list
+      return gtsf.generate_random_choice_array(num_records, first_names, rng)
 
 # Generate the Employee First Name field
-def generate_emp_last_name_field(num_records):
+def generate_emp_last_name_field(num_records, rng = None):
       """
       Generate a list of random employee last names from a predefined list.
       :param num_records: Number of last names to generate.
-      :return: List of employee last names.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of employee last names.
       """
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(random.choice(last_names))
-      return dict_list
+      return gtsf.generate_random_choice_array(num_records, last_names, rng)
 
 # Generate the Employee Phone Number field
-def generate_emp_phone_number_field(num_records):
+def generate_emp_phone_number_field(num_records, rng = None):
       """
       Generate a list of random employee phone numbers.
       :param num_records: Number of phone numbers to generate.
-      :return: List of employee phone numbers.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of employee phone numbers.
       """
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_phone_number())
-      return dict_list
+      return gtsf.generate_phone_number_array(num_records, rng)
 
 # Generate the Employee Job Title field
-def generate_emp_job_title_field(num_records):
+def generate_emp_job_title_field(num_records, rng = None):
       """
       Generate a list of random employee job titles from a predefined dictionary.
       :param num_records: Number of job titles to generate.
-      :return: List of employee job titles.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of employee job titles.
       """
-      dict_list = []
-      job_titles = list(dict_jobs.keys())
-      for _ in range(num_records):
-            dict_list.append(random.choice(job_titles))
-      return dict_list
+      return gtsf.generate_random_choice_array(num_records, list(dict_jobs.keys()), rng)
 
 # Generate the Employee Email field
 def generate_emp_email_field(num_records, first_name, last_name):
@@ -133,106 +122,81 @@ def generate_emp_email_field(num_records, first_name, last_name):
       :param num_records: Number of email addresses to generate.
       :param first_name: List of employee first names.
       :param last_name: List of employee last names.
-      :return: List of employee email addresses.
+      :return: Array of employee email addresses.
       """
-      dict_list = []
-      for x in range(num_records):
-            dict_list.append(f'{last_name[x]}.{first_name[x]}@fakemail.com')
-      return dict_list
+      return gtsf.join_string_arrays([last_name[:num_records], ".", first_name[:num_records], "@fakemail.com"])
 
 # Generate the Employee Status field
-def generate_emp_status_field(num_records, weightY = 90, weightN = 10):
+def generate_emp_status_field(num_records, weightY = 90, weightN = 10, rng = None):
       """
       Generate a list of random employee statuses with specified weighting.
       :param num_records: Number of statuses to generate.
       :param weightY: Weight for 'EMPLOYEED' status.
       :param weightN: Weight for 'TERMINATED' status.
-      :return: List of employee statuses.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of employee statuses.
       """
-      dict_list = []
       status_list = ['EMPLOYEED', 'TERMINATED']
       weight_list = [weightY, weightN]
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_random_weighted_string_list(status_list, weight_list))
-      return dict_list
+      return gtsf.generate_random_weighted_string_array(num_records, status_list, weight_list, rng)
 
 # Generate the Employee Hire Date field
-def generate_emp_hire_date_field(num_records, min_date = datetime(1990,1,1), max_date = datetime.now()):
+def generate_emp_hire_date_field(num_records, min_date = datetime(1990,1,1), max_date = gtsf.default_reference_date, rng = None):
       """
-      Generate a list of random employee hire dates within a specified date range.
+      Generate an array of random employee hire dates within a specified date range.
       :param num_records: Number of dates to generate.
       :param min_date: Minimum date in the range.
       :param max_date: Maximum date in the range.
-      :return: List of hire dates.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: datetime64 array of hire dates.
       """
       min_date = gtsf.function_date_int_to_datetime(min_date)
       max_date = gtsf.function_date_int_to_datetime(max_date)
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_date(min_date, max_date))
-      return dict_list
+      return gtsf.generate_date_array(num_records, min_date, max_date, rng)
 
 # Generate the Employee Termination field
-def generate_emp_termination_field(num_records, status_list, hire_date_list, max_date = datetime.now()):
+def generate_emp_termination_field(num_records, status_list, hire_date_list, max_date = gtsf.default_reference_date, rng = None):
       """
-      Generate a list of random employee termination dates based on their status and hire dates.
+      Generate an array of random employee termination dates based on their status and hire dates.
       :param num_records: Number of termination dates to generate.
       :param status_list: List of employee statuses.
       :param hire_date_list: List of employee hire dates.
       :param max_date: Maximum date for termination.
-      :return: List of termination dates.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: datetime64 array of termination dates (NaT where the status does not apply).
       """
       max_date = gtsf.function_date_int_to_datetime(max_date)
-      dict_list = []
-      for x in range(0, num_records):
-            if status_list[x] == 'TERMINATED':
-                  dict_list.append(gtsf.generate_date(hire_date_list[x], max_date))
-            else:
-                  dict_list.append(None)
-      return dict_list
+      status_mask = np.isin(np.asarray(status_list), ['TERMINATED'])
+      return gtsf.generate_date_array(num_records, hire_date_list, max_date, rng, mask=status_mask)
 
 # Generate the Employee Manager First name Field
-def generate_emp_manager_fields(num_records, emp_first_name, emp_last_name, emp_job_title_list):
+def generate_emp_manager_fields(num_records, emp_first_name, emp_last_name, emp_job_title_list, rng = None):
       """
       Generate lists of manager names and positions for employees based on their job titles.
       :param num_records: Number of records to generate.
       :param emp_first_name: List of employee first names.
       :param emp_last_name: List of employee last names.
       :param emp_job_title_list: List of employee job titles.
-      :return: Lists of manager first names, last names, and positions.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Arrays of manager first names, last names, and positions.
       """
-      dict_list_firstname = []
-      dict_list_lastname = []
-      dict_list_manager = []
-      
-      for x in range(num_records):
-            mang_first_name = random.choice(first_names)
-            while mang_first_name == emp_first_name[x]:
-                  mang_first_name = random.choice(first_names)        
-            dict_list_firstname.append(mang_first_name)
-            
-            mang_last_name = random.choice(last_names)
-            while mang_last_name == emp_last_name[x]:
-                  mang_last_name = random.choice(last_names)        
-            dict_list_lastname.append(mang_last_name)
-            
-            dict_list_manager.append(random.choice(dict_jobs[emp_job_title_list[x]]))
-            
+      # A manager never shares the first or last name of the employee
+      dict_list_firstname = gtsf.generate_random_choice_excluding_array(emp_first_name[:num_records], first_names, rng)
+      dict_list_lastname = gtsf.generate_random_choice_excluding_array(emp_last_name[:num_records], last_names, rng)
+      dict_list_manager = gtsf.generate_mapped_choice_array(emp_job_title_list[:num_records], dict_jobs, rng)
       return dict_list_firstname, dict_list_lastname, dict_list_manager
 
 # Generate the Employee Manager Security Clearance field
-def generate_emp_security_clearance_field(num_records, min = 1, max = 5):
+def generate_emp_security_clearance_field(num_records, min = 1, max = 5, rng = None):
       """
       Generate a list of random employee security clearance levels within a specified range.
       :param num_records: Number of clearance levels to generate.
       :param min: Minimum clearance level.
       :param max: Maximum clearance level.
-      :return: List of security clearance levels.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of security clearance levels.
       """
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_random_int(min, max))
-      return dict_list
+      return gtsf.generate_random_int_array(num_records, min, max, rng)
 
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
@@ -241,27 +205,29 @@ def generate_emp_security_clearance_field(num_records, min = 1, max = 5):
 #----------------------------------------------------------------------------------
 
 # Function to run each field to build the employee table
-def generate_table_employee_general(dict, id_field_name = 'ID_Record'): 
+def generate_table_employee_general(dict, id_field_name = 'ID_Record', rng_context = None): 
       """
       Populate a dictionary with various employee-related data fields to build an employee table.
       :param dict: Dictionary to populate with employee data.
       :param num_records: Number of records to generate for each field.
+      :param rng_context: Optional RNG_Context (or master seed) the table's column streams are derived from.
       :return: Dictionary populated with employee data fields.
       """
-      num_records = len(dict[id_field_name])
-      dict['Employee ID'] = generate_emp_id_field(num_records)
-      dict['Emp First Name'] = generate_emp_first_name_field(num_records)
-      dict['Emp Last Name'] = generate_emp_last_name_field(num_records)
-      dict['Emp Phone Number'] = generate_emp_phone_number_field(num_records)
-      dict['Job Title'] = generate_emp_job_title_field(num_records)
+      num_records = gtsf.resolve_id_records(dict, id_field_name)
+      rng_context = gtsf.get_rng_context(rng_context).table('employee_general')
+      dict['Employee ID'] = generate_emp_id_field(num_records, rng=rng_context.column('Employee ID'))
+      dict['Emp First Name'] = generate_emp_first_name_field(num_records, rng=rng_context.column('Emp First Name'))
+      dict['Emp Last Name'] = generate_emp_last_name_field(num_records, rng=rng_context.column('Emp Last Name'))
+      dict['Emp Phone Number'] = generate_emp_phone_number_field(num_records, rng=rng_context.column('Emp Phone Number'))
+      dict['Job Title'] = generate_emp_job_title_field(num_records, rng=rng_context.column('Job Title'))
       dict['Employee Email'] = generate_emp_email_field(num_records, dict['Emp First Name'], dict['Emp Last Name'])
-      dict['Employee Status'] = generate_emp_status_field(num_records)
+      dict['Employee Status'] = generate_emp_status_field(num_records, rng=rng_context.column('Employee Status'))
       # - - - Date Format: YYYYMMDD - - -
-      dict['Hire Date'] = generate_emp_hire_date_field(num_records)
+      dict['Hire Date'] = generate_emp_hire_date_field(num_records, max_date=rng_context.reference_date, rng=rng_context.column('Hire Date'))
       # - - - - - - - - - - - - - - - - -
-      dict['Termination Date'] = generate_emp_termination_field(num_records, dict['Employee Status'], dict['Hire Date'])
-      dict['Manager First Name'], dict['Manager Last Name'], dict['Manager Position'] = generate_emp_manager_fields(num_records, dict['Emp First Name'], dict['Emp Last Name'], dict['Job Title'])
-      dict['Security Clearance'] = generate_emp_security_clearance_field(num_records)
+      dict['Termination Date'] = generate_emp_termination_field(num_records, dict['Employee Status'], dict['Hire Date'], max_date=rng_context.reference_date, rng=rng_context.column('Termination Date'))
+      dict['Manager First Name'], dict['Manager Last Name'], dict['Manager Position'] = generate_emp_manager_fields(num_records, dict['Emp First Name'], dict['Emp Last Name'], dict['Job Title'], rng=rng_context.column('Manager First Name'))
+      dict['Security Clearance'] = generate_emp_security_clearance_field(num_records, rng=rng_context.column('Security Clearance'))
       return dict
 
 #----------------------------------------------------------------------------------
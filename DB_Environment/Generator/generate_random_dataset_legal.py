@@ -1,5 +1,5 @@
 import pandas as pd
-import random
+import numpy as np
 import string
 from datetime import datetime, timedelta
 import generate_random_dataset_support_functions as gtsf
@@ -54,14 +54,15 @@ money until the person it is intended for comes of an age to receive it',
 #----------------------------------------------------------------------------------
 
 # Generate the Legal ID field
-def generate_legal_account_field(num_records, len_id_char = 8):
+def generate_legal_account_field(num_records, len_id_char = 8, rng = None, id_offset = 0):
       """
       Generate a list of legal account IDs with a specified character length.
       :param num_records: Number of account IDs to generate.
       :param len_id_char: Length of each ID in characters (default is 8).
-      :return: List of legal account IDs.
+      :param rng: Optional numpy.random.Generator the ID permutation key is drawn from (default module generator).
+      :param id_offset: Position of the first ID in the permutation, for chunks of a table (default 0).
+      :return: Array of legal account IDs.
       """
-      dict_list = []
       if type(len_id_char) == str:
             if len_id_char.isdigit():
                   zeros_req = int(len_id_char)-1
@@ -70,129 +71,106 @@ def generate_legal_account_field(num_records, len_id_char = 8):
       else:
             zeros_req = len_id_char - 1
             
-      zeros = "0" * zeros_req
-      min = int("1"+zeros)
-      max = int("9"*len_id_char) 
-      for _ in range(num_records):
-            dict_list.append(random.randint(min, max))
-      return dict_list
+      return gtsf.generate_unique_id_array(num_records, zeros_req + 1, rng, id_offset)
 
 # Generate the Legal firm field
-def generate_legal_firm_field(num_records):
+def generate_legal_firm_field(num_records, rng = None):
       """
       Generate a list of legal firm names.
       :param num_records: Number of firm names to generate.
-      :return: List of legal firm names.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of legal firm names.
       """
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_legal_firm_name(legal_list_surnames, legal_list_terms))
-      return dict_list
+      return gtsf.generate_legal_firm_name_array(num_records, legal_list_surnames, legal_list_terms, rng)
 
 # Generate the Legal type and definition fields
-def generate_legal_type_and_def_field(num_records):
+def generate_legal_type_and_def_field(num_records, rng = None):
       """
       Generate lists of legal types and their definitions.
       :param num_records: Number of records to generate.
-      :return: Two lists, one for legal types and one for their definitions.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Two arrays, one for legal types and one for their definitions.
       """
-      dict_list_type = []
-      dict_list_def = []
-      for _ in range(num_records):
-            le_type, le_type_def = gtsf.generate_legal_type_and_def(dict_leg_type)
-            dict_list_type.append(le_type)
-            dict_list_def.append(le_type_def)
-      return dict_list_type, dict_list_def
+      return gtsf.generate_dict_key_and_value_array(num_records, dict_leg_type, rng)
 
 # Generate the Legal Status field
-def generate_legal_status_field(num_records, weightAct = 60, weightCls = 10, weightHis = 10):
+def generate_legal_status_field(num_records, weightAct = 60, weightCls = 10, weightHis = 10, rng = None):
       """
       Generate a list of legal statuses with specified weighting.
       :param num_records: Number of statuses to generate.
       :param weightAct: Weight for 'ACTIVE' status.
       :param weightCls: Weight for 'CLOSED' status.
       :param weightHis: Weight for 'HISTORY' status.
-      :return: List of legal statuses.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of legal statuses.
       """
-      dict_list = []
       status_list = ['ACTIVE', 'CLOSED', 'HISTORY']
       weight_list = [weightAct, weightCls, weightHis]
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_random_weighted_string_list(status_list, weight_list))
-      return dict_list
+      return gtsf.generate_random_weighted_string_array(num_records, status_list, weight_list, rng)
 
 # Generate the Legal Creation Date field
-def generate_legal_creation_date_field(num_records, min_date = datetime(1990,1,1), max_date = datetime.now()):
+def generate_legal_creation_date_field(num_records, min_date = datetime(1990,1,1), max_date = gtsf.default_reference_date, rng = None):
       """
-      Generate a list of legal creation dates within a specified date range.
+      Generate an array of legal creation dates within a specified date range.
       :param num_records: Number of dates to generate.
       :param min_date: Minimum date for the range.
       :param max_date: Maximum date for the range.
-      :return: List of legal creation dates.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: datetime64 array of legal creation dates.
       """
       min_date = gtsf.function_date_int_to_datetime(min_date)
       max_date = gtsf.function_date_int_to_datetime(max_date)
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_date(min_date, max_date))
-      return dict_list
+      return gtsf.generate_date_array(num_records, min_date, max_date, rng)
 
 # Generate the Legal Modified Date field
-def generate_legal_modified_date_field(num_records, created_date_list, max_date = datetime.now()):
+def generate_legal_modified_date_field(num_records, created_date_list, max_date = gtsf.default_reference_date, rng = None):
       """
-      Generate a list of legal modified dates based on creation dates and a maximum date.
+      Generate an array of legal modified dates based on creation dates and a maximum date.
       :param num_records: Number of dates to generate.
       :param created_date_list: List of creation dates.
       :param max_date: Maximum date for modification.
-      :return: List of legal modified dates.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: datetime64 array of legal modified dates.
       """
       max_date = gtsf.function_date_int_to_datetime(max_date)
-      dict_list = []
-      for x in range(0, num_records):
-            dict_list.append(gtsf.generate_date(created_date_list[x], max_date))
-      return dict_list
+      return gtsf.generate_date_array(num_records, created_date_list, max_date, rng)
 
 # Generate the Legal Closed Date field
-def generate_legal_closed_date_field(num_records, status_list, mod_date_list, max_date = datetime.now()):
+def generate_legal_closed_date_field(num_records, status_list, mod_date_list, max_date = gtsf.default_reference_date, rng = None):
       """
-      Generate a list of legal closed dates for firms, based on their status and modification dates.
+      Generate an array of legal closed dates for firms, based on their status and modification dates.
       :param num_records: Number of dates to generate.
       :param status_list: List of legal statuses.
       :param mod_date_list: List of modification dates.
       :param max_date: Maximum date for closing.
-      :return: List of legal closed dates.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: datetime64 array of legal closed dates (NaT where the status does not apply).
       """
       max_date = gtsf.function_date_int_to_datetime(max_date)
-      dict_list = []
-      for x in range(0, num_records):
-            if status_list[x] == 'CLOSED' or status_list[x] == 'HISTORY':
-                  dict_list.append(gtsf.generate_date(mod_date_list[x], max_date))
-            else:
-                  dict_list.append(None)
-      return dict_list
+      status_mask = np.isin(np.asarray(status_list), ['CLOSED', 'HISTORY'])
+      return gtsf.generate_date_array(num_records, mod_date_list, max_date, rng, mask=status_mask)
 
 # Generate the Legal Tax Category Field
-def generate_legal_tax_cat_field(num_records):
+def generate_legal_tax_cat_field(num_records, rng = None):
       """
       Generate a list of legal tax categories.
       :param num_records: Number of tax categories to generate.
-      :return: List of legal tax categories.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of legal tax categories.
       """
-      dict_list=[]
       le_tax_cat_list = ['G','M','N','I','D','Ba', 'Bt']
-      for _ in range(num_records):
-            dict_list.append(random.choice(le_tax_cat_list))
-      return dict_list
+      return gtsf.generate_random_choice_array(num_records, le_tax_cat_list, rng)
 
 # Generate the Legal IRS TIN ID field
-def generate_legal_irs_tin_id_field(num_records, len_id_char = 7):
+def generate_legal_irs_tin_id_field(num_records, len_id_char = 7, rng = None, id_offset = 0):
       """
       Generate a list of IRS TIN IDs for legal entities.
       :param num_records: Number of IRS TIN IDs to generate.
       :param len_id_char: Length of each ID in characters (default is 7).
-      :return: List of IRS TIN IDs.
+      :param rng: Optional numpy.random.Generator the ID permutation key is drawn from (default module generator).
+      :param id_offset: Position of the first ID in the permutation, for chunks of a table (default 0).
+      :return: Array of IRS TIN IDs.
       """
-      dict_list = []
       if type(len_id_char) == str:
             if len_id_char.isdigit():
                   zeros_req = int(len_id_char)-1
@@ -201,22 +179,18 @@ def generate_legal_irs_tin_id_field(num_records, len_id_char = 7):
       else:
             zeros_req = len_id_char - 1
             
-      zeros = "0" * zeros_req
-      min = int("1"+zeros)
-      max = int("9"*len_id_char) 
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_random_int(min, max))
-      return dict_list
+      return gtsf.generate_unique_id_array(num_records, zeros_req + 1, rng, id_offset)
 
 # Generate the Legal MPID field
-def generate_legal_mpid_field(num_records, len_id_char = 7):
+def generate_legal_mpid_field(num_records, len_id_char = 7, rng = None, id_offset = 0):
       """
       Generate a list of MPID (Market Participant Identifier) for legal entities.
       :param num_records: Number of MPID to generate.
       :param len_id_char: Length of each ID in characters (default is 7).
-      :return: List of MPID.
+      :param rng: Optional numpy.random.Generator the ID permutation key is drawn from (default module generator).
+      :param id_offset: Position of the first ID in the permutation, for chunks of a table (default 0).
+      :return: Array of MPID.
       """
-      dict_list = []
       if type(len_id_char) == str:
             if len_id_char.isdigit():
                   zeros_req = int(len_id_char)-1
@@ -225,22 +199,18 @@ def generate_legal_mpid_field(num_records, len_id_char = 7):
       else:
             zeros_req = len_id_char - 1
             
-      zeros = "0" * zeros_req
-      min = int("1"+zeros)
-      max = int("9"*len_id_char) 
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_random_int(min, max))
-      return dict_list
+      return gtsf.generate_unique_id_array(num_records, zeros_req + 1, rng, id_offset)
 
 # Generate the Legal GIIN ID field
-def generate_legal_giin_id_field(num_records, len_id_char = 7):
+def generate_legal_giin_id_field(num_records, len_id_char = 7, rng = None, id_offset = 0):
       """
       Generate a list of GIIN (Global Intermediary Identification Number) for legal entities.
       :param num_records: Number of GIIN IDs to generate.
       :param len_id_char: Length of each ID in characters (default is 7).
-      :return: List of GIIN IDs.
+      :param rng: Optional numpy.random.Generator the ID permutation key is drawn from (default module generator).
+      :param id_offset: Position of the first ID in the permutation, for chunks of a table (default 0).
+      :return: Array of GIIN IDs.
       """
-      dict_list = []
       if type(len_id_char) == str:
             if len_id_char.isdigit():
                   zeros_req = int(len_id_char)-1
@@ -249,22 +219,18 @@ def generate_legal_giin_id_field(num_records, len_id_char = 7):
       else:
             zeros_req = len_id_char - 1
             
-      zeros = "0" * zeros_req
-      min = int("1"+zeros)
-      max = int("9"*len_id_char) 
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_random_int(min, max))
-      return dict_list
+      return gtsf.generate_unique_id_array(num_records, zeros_req + 1, rng, id_offset)
 
 # Generate the Legal FACTA ID field
-def generate_legal_facta_id_field(num_records, len_id_char = 7):
+def generate_legal_facta_id_field(num_records, len_id_char = 7, rng = None, id_offset = 0):
       """
       Generate a list of FACTA IDs for legal entities.
       :param num_records: Number of FACTA IDs to generate.
       :param len_id_char: Length of each ID in characters (default is 7).
-      :return: List of FACTA IDs.
+      :param rng: Optional numpy.random.Generator the ID permutation key is drawn from (default module generator).
+      :param id_offset: Position of the first ID in the permutation, for chunks of a table (default 0).
+      :return: Array of FACTA IDs.
       """
-      dict_list = []
       if type(len_id_char) == str:
             if len_id_char.isdigit():
                   zeros_req = int(len_id_char)-1
@@ -273,22 +239,18 @@ def generate_legal_facta_id_field(num_records, len_id_char = 7):
       else:
             zeros_req = len_id_char - 1
             
-      zeros = "0" * zeros_req
-      min = int("1"+zeros)
-      max = int("9"*len_id_char) 
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_random_int(min, max))
-      return dict_list
+      return gtsf.generate_unique_id_array(num_records, zeros_req + 1, rng, id_offset)
 
 # Generate the Legal WCIS field
-def generate_legal_wcis_id_field(num_records, len_id_char = 7):
+def generate_legal_wcis_id_field(num_records, len_id_char = 7, rng = None, id_offset = 0):
       """
       Generate a list of WCIS (Worldwide Common Identifier System) for legal entities.
       :param num_records: Number of WCIS IDs to generate.
       :param len_id_char: Length of each ID in characters (default is 7).
-      :return: List of WCIS IDs.
+      :param rng: Optional numpy.random.Generator the ID permutation key is drawn from (default module generator).
+      :param id_offset: Position of the first ID in the permutation, for chunks of a table (default 0).
+      :return: Array of WCIS IDs.
       """
-      dict_list = []
       if type(len_id_char) == str:
             if len_id_char.isdigit():
                   zeros_req = int(len_id_char)-1
@@ -297,22 +259,18 @@ def generate_legal_wcis_id_field(num_records, len_id_char = 7):
       else:
             zeros_req = len_id_char - 1
             
-      zeros = "0" * zeros_req
-      min = int("1"+zeros)
-      max = int("9"*len_id_char) 
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_random_int(min, max))
-      return dict_list
+      return gtsf.generate_unique_id_array(num_records, zeros_req + 1, rng, id_offset)
 
 # Generate the Legal TEFRA ID field
-def generate_legal_tefra_id_field(num_records, len_id_char = 7):
+def generate_legal_tefra_id_field(num_records, len_id_char = 7, rng = None, id_offset = 0):
       """
       Generate a list of TEFRA (Tax Equity and Fiscal Responsibility Act) IDs for legal entities.
       :param num_records: Number of TEFRA IDs to generate.
       :param len_id_char: Length of each ID in characters (default is 7).
-      :return: List of TEFRA IDs.
+      :param rng: Optional numpy.random.Generator the ID permutation key is drawn from (default module generator).
+      :param id_offset: Position of the first ID in the permutation, for chunks of a table (default 0).
+      :return: Array of TEFRA IDs.
       """
-      dict_list = []
       if type(len_id_char) == str:
             if len_id_char.isdigit():
                   zeros_req = int(len_id_char)-1
@@ -321,12 +279,7 @@ def generate_legal_tefra_id_field(num_records, len_id_char = 7):
       else:
             zeros_req = len_id_char - 1
             
-      zeros = "0" * zeros_req
-      min = int("1"+zeros)
-      max = int("9"*len_id_char) 
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_random_int(min, max))
-      return dict_list
+      return gtsf.generate_unique_id_array(num_records, zeros_req + 1, rng, id_offset)
 
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
@@ -335,30 +288,36 @@ def generate_legal_tefra_id_field(num_records, len_id_char = 7):
 #----------------------------------------------------------------------------------
 
 # Function to run each field to build the legal table
-def generate_table_legal_general(dict, id_field_name = 'ID_Record'): 
+def generate_table_legal_general(dict, id_field_name = 'ID_Record', rng_context = None, total_records = None): 
       """
       Populate a dictionary with various legal-related data fields to build a legal table.
       :param dict: Dictionary to populate with legal data.
       :param num_records: Number of records to generate for each field.
+      :param rng_context: Optional RNG_Context (or master seed) the table's column streams are derived from.
+      :param total_records: Rows of the whole table when dict holds one chunk of it (default the rows in dict).
       :return: Dictionary populated with legal data fields.
       """
-      num_records = len(dict[id_field_name])
-      dict['Legal Account'] = generate_legal_account_field(num_records, 8)
-      dict['Legal Firm'] = generate_legal_firm_field(num_records)
-      dict['Legal Type'], dict['Legal Type Def'] = generate_legal_type_and_def_field(num_records)
-      dict['Legal Status'] = generate_legal_status_field(num_records)
+      num_records = gtsf.resolve_id_records(dict, id_field_name)
+      rng_context = gtsf.get_rng_context(rng_context).table('legal_general')
+      # Unique IDs share one permutation per column across the chunks of the table, and widen when the table outgrows them
+      total_records = num_records if total_records is None else total_records
+      id_offset = rng_context.record_offset
+      dict['Legal Account'] = generate_legal_account_field(num_records, gtsf.unique_id_width(8, total_records), rng=rng_context.table_column('Legal Account'), id_offset=id_offset)
+      dict['Legal Firm'] = generate_legal_firm_field(num_records, rng=rng_context.column('Legal Firm'))
+      dict['Legal Type'], dict['Legal Type Def'] = generate_legal_type_and_def_field(num_records, rng=rng_context.column('Legal Type'))
+      dict['Legal Status'] = generate_legal_status_field(num_records, rng=rng_context.column('Legal Status'))
       # - - - Date Format: YYYYMMDD - - -
-      dict['LE Creation Date'] = generate_legal_creation_date_field(num_records)
-      dict['LE Modified Date'] = generate_legal_modified_date_field(num_records, dict['LE Creation Date'])
-      dict['LE Closed Date'] = generate_legal_closed_date_field(num_records, dict['Legal Status'], dict['LE Modified Date'])
+      dict['LE Creation Date'] = generate_legal_creation_date_field(num_records, max_date=rng_context.reference_date, rng=rng_context.column('LE Creation Date'))
+      dict['LE Modified Date'] = generate_legal_modified_date_field(num_records, dict['LE Creation Date'], max_date=rng_context.reference_date, rng=rng_context.column('LE Modified Date'))
+      dict['LE Closed Date'] = generate_legal_closed_date_field(num_records, dict['Legal Status'], dict['LE Modified Date'], max_date=rng_context.reference_date, rng=rng_context.column('LE Closed Date'))
       # - - - - - - - - - - - - - - - - -
-      dict['Legal Tax Category'] = generate_legal_tax_cat_field(num_records)
-      dict['IRS TIN ID'] = generate_legal_irs_tin_id_field(num_records)
-      dict['MPID'] = generate_legal_mpid_field(num_records, 6)
-      dict['GIIN ID'] = generate_legal_giin_id_field(num_records, 6)
-      dict['FACTA ID'] = generate_legal_facta_id_field(num_records, 9)
-      dict['WCIS ID'] = generate_legal_wcis_id_field(num_records, 5)
-      dict['TEFRA ID'] = generate_legal_tefra_id_field(num_records)
+      dict['Legal Tax Category'] = generate_legal_tax_cat_field(num_records, rng=rng_context.column('Legal Tax Category'))
+      dict['IRS TIN ID'] = generate_legal_irs_tin_id_field(num_records, gtsf.unique_id_width(7, total_records), rng=rng_context.table_column('IRS TIN ID'), id_offset=id_offset)
+      dict['MPID'] = generate_legal_mpid_field(num_records, gtsf.unique_id_width(6, total_records), rng=rng_context.table_column('MPID'), id_offset=id_offset)
+      dict['GIIN ID'] = generate_legal_giin_id_field(num_records, gtsf.unique_id_width(6, total_records), rng=rng_context.table_column('GIIN ID'), id_offset=id_offset)
+      dict['FACTA ID'] = generate_legal_facta_id_field(num_records, gtsf.unique_id_width(9, total_records), rng=rng_context.table_column('FACTA ID'), id_offset=id_offset)
+      dict['WCIS ID'] = generate_legal_wcis_id_field(num_records, gtsf.unique_id_width(5, total_records), rng=rng_context.table_column('WCIS ID'), id_offset=id_offset)
+      dict['TEFRA ID'] = generate_legal_tefra_id_field(num_records, gtsf.unique_id_width(7, total_records), rng=rng_context.table_column('TEFRA ID'), id_offset=id_offset)
       return dict
 
 #----------------------------------------------------------------------------------
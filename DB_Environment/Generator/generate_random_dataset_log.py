@@ -1,4 +1,5 @@
-import random
+import pandas as pd
+import numpy as np
 from datetime import datetime
 import generate_random_dataset_support_functions as gtsf
 
@@ -181,14 +182,15 @@ log_dict_source = {
 #----------------------------------------------------------------------------------
 
 # Generate the Log ID field
-def generate_log_id_field(num_records, len_id_char = 9):
+def generate_log_id_field(num_records, len_id_char = 9, rng = None, id_offset = 0):
       """
       Generate a list of unique log IDs with a specified character length.
       :param num_records: Number of log IDs to generate.
       :param len_id_char: Length of each log ID in characters (default is 9).
-      :return: List of log IDs.
+      :param rng: Optional numpy.random.Generator the ID permutation key is drawn from (default module generator).
+      :param id_offset: Position of the first ID in the permutation, for chunks of a table (default 0).
+      :return: Array of log IDs.
       """
-      dict_list = []
       if type(len_id_char) == str:
             if len_id_char.isdigit():
                   zeros_req = int(len_id_char)-1
@@ -197,474 +199,419 @@ def generate_log_id_field(num_records, len_id_char = 9):
       else:
             zeros_req = len_id_char - 1
             
-      zeros = "0" * zeros_req
-      min = int("1"+zeros)
-      max = int("9"*len_id_char) 
-      for _ in range(num_records):
-            dict_list.append(random.randint(min, max))
-      return dict_list
+      return gtsf.generate_unique_id_array(num_records, zeros_req + 1, rng, id_offset)
 
 # Generate the Log Time Stamp field
-def generate_log_timestamp_field(num_records, min_date = datetime(2010,1,1), max_date = datetime.now()):
+def generate_log_timestamp_field(num_records, min_date = datetime(2010,1,1), max_date = gtsf.default_reference_date, rng = None):
       """
-      Generate a list of timestamps for log entries within a specified date range.
+      Generate an array of timestamps for log entries within a specified date range.
       :param num_records: Number of timestamps to generate.
       :param min_date: Minimum date for the range.
       :param max_date: Maximum date for the range.
+      :param rng: Optional numpy.random.Generator (default module generator).
       :return: List of timestamps.
       """
       min_date = gtsf.function_date_int_to_datetime(min_date)
       max_date = gtsf.function_date_int_to_datetime(max_date)
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_date(min_date, max_date))
-      return dict_list
+      return gtsf.generate_date_array(num_records, min_date, max_date, rng)
 
 # Generate the Log User ID field
-def generate_log_userid_field(num_records, min_dig_id = 1, max_dig_id = 100000):
+def generate_log_userid_field(num_records, min_dig_id = 1, max_dig_id = 100000, rng = None):
       """
       Generate a list of user IDs for log entries.
       :param num_records: Number of user IDs to generate.
       :param min_dig_id: Minimum value for user ID.
       :param max_dig_id: Maximum value for user ID.
-      :return: List of user IDs.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of user IDs.
       """
-      dict_list = []
-      for _ in range(num_records):
-            temp_dig_id = str(random.randint(min_dig_id,max_dig_id))
-            zero_count = len(str(max_dig_id))-len(temp_dig_id)
-            dict_list.append("U" + "0"*zero_count + temp_dig_id)
-      return dict_list
+      return gtsf.generate_prefixed_id_array(num_records, "U", min_dig_id, max_dig_id, rng)
 
 # Generate the Log IP Address Field
-def generate_log_ip_address_field(num_records):
+def generate_log_ip_address_field(num_records, rng = None):
       """
       Generate a list of IP addresses for log entries.
       :param num_records: Number of IP addresses to generate.
-      :return: List of IP addresses.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of IP addresses.
       """
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_log_ip_address())
-      return dict_list
+      return gtsf.generate_log_ip_address_array(num_records, rng)
 
 # Generate the Log Hostname field
-def generate_log_hostname_field(num_records):
+def generate_log_hostname_field(num_records, rng = None):
       """
-      Generate a list of hostnames for log entries.
+      Generate an array of hostnames for log entries.
       :param num_records: Number of hostnames to generate.
-      :return: List of hostnames.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of hostnames.
       """
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_log_hostname())
-      return dict_list
+      return gtsf.generate_log_hostname_array(num_records, rng)
 
 # Generate the Log Severity Level field
-def generate_log_severity_field(num_records, priority_item = 'NORMAL', weight_main = 10, weight_oth = 1):
+def generate_log_severity_field(num_records, priority_item = 'NORMAL', weight_main = 10, weight_oth = 1, rng = None):
       """
       Generate a list of severity levels for log entries with weighted preference for a specific level.
       :param num_records: Number of severity levels to generate.
       :param priority_item: Severity level to prioritize (default 'NORMAL').
       :param weight_main: Weight for the prioritized severity level (default 10).
       :param weight_oth: Weight for other severity levels (default 1).
-      :return: List of severity levels.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Categorical of severity levels.
       """
-      dict_list = []
       sev_list = list(log_dict_severity_level.keys())
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_random_unique_weighted_list(sev_list, priority_item, weight_main, weight_oth))
-      return dict_list
+      return gtsf.generate_random_unique_weighted_categorical(num_records, sev_list, priority_item, weight_main, weight_oth, rng)
 
 # Generate the Log Status  field
-def generate_log_status_field(num_records, severity_list):
+def generate_log_status_field(num_records, severity_list, rng = None):
       """
       Generate a list of statuses for log entries based on the severity level.
       :param num_records: Number of statuses to generate.
       :param severity_list: List of severity levels associated with each status.
-      :return: List of statuses.
-      """
-      dict_list = []
-      status_nonissue_list = list(log_dict_status_nonissue.keys())
-      status_issue_list = list(log_dict_status_issue.keys())
-      for x in range(num_records):
-            if severity_list[x] == "NORMAL" or severity_list[x] == "INFO":
-                  dict_list.append(random.choice(status_nonissue_list))
-            else:
-                  dict_list.append(random.choice(status_issue_list))
-      return dict_list
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Categorical of statuses.
+      """
+      nonissue_mask = np.isin(np.asarray(severity_list[:num_records]), ["NORMAL", "INFO"])
+      nonissue_status = gtsf.generate_random_categorical_array(num_records, list(log_dict_status_nonissue.keys()), rng=rng)
+      issue_status = gtsf.generate_random_categorical_array(num_records, list(log_dict_status_issue.keys()), rng=rng)
+      # Both vocabularies share one set of categories, the issue codes follow the non-issue codes
+      status_codes = np.where(nonissue_mask, nonissue_status.codes, len(nonissue_status.categories) + issue_status.codes)
+      return pd.Categorical.from_codes(status_codes, categories=nonissue_status.categories.append(issue_status.categories))
 
 # Generate the Log Reference ID field
-def generate_log_referenceid_field(num_records, min_dig_id = 1, max_dig_id = 100000):
+def generate_log_referenceid_field(num_records, min_dig_id = 1, max_dig_id = 100000, rng = None):
       """
       Generate a list of reference IDs for log entries.
       :param num_records: Number of reference IDs to generate.
       :param min_dig_id: Minimum value for reference ID.
       :param max_dig_id: Maximum value for reference ID.
-      :return: List of reference IDs.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of reference IDs.
       """
-      dict_list = []
-      for _ in range(num_records):
-            temp_dig_id = str(random.randint(min_dig_id,max_dig_id))
-            zero_count = len(str(max_dig_id))-len(temp_dig_id)
-            dict_list.append("R" + "0"*zero_count + temp_dig_id)
-      return dict_list
+      return gtsf.generate_prefixed_id_array(num_records, "R", min_dig_id, max_dig_id, rng)
 
 # Generate the Log Module field
-def generate_log_source_field(num_records):
+def generate_log_source_field(num_records, rng = None):
       """
       Generate a list of sources for log entries.
       :param num_records: Number of sources to generate.
-      :return: List of sources.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Categorical of sources.
       """
-      dict_list = []
-      list_source = list(log_dict_source.keys())
-      for _ in range(num_records):
-            dict_list.append(random.choice(list_source))
-      return dict_list
+      return gtsf.generate_random_categorical_array(num_records, list(log_dict_source.keys()), rng=rng)
 
 # Generate the Log Event Fields
-def generate_log_event_fields(num_records):
+def generate_log_event_fields(num_records, rng = None):
       """
       Generate lists of log events and their descriptions.
       :param num_records: Number of log events to generate.
-      :return: Two lists, one for log events and one for their descriptions.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Two arrays, one for log events and one for their descriptions.
       """
-      dict_list_event = []
-      dict_list_desc = []
-      list_event = list(log_dict_event.keys())
-      for x in range(num_records):
-            temp_key = random.choice(list_event)
-            dict_list_event.append(temp_key)
-            dict_list_desc.append(log_dict_event[temp_key])
-      return dict_list_event, dict_list_desc
+      return gtsf.generate_dict_key_and_value_array(num_records, log_dict_event, rng)
 
 # Generate the Log Data Change Fields
-def generate_log_datachange_fields(num_records):
+def generate_log_datachange_fields(num_records, rng = None):
       """
       Generate lists of data change events and their descriptions.
       :param num_records: Number of data change events to generate.
-      :return: Lists for data change events, descriptions, old values, and new values.
-      """
-      dict_list_event = []
-      dict_list_desc = []
-      list_dc = list(log_dict_data_change.keys())
-      list_old = []
-      list_new = []
-      for x in range(num_records):
-            temp_key = random.choice(list_dc)
-            dict_list_event.append(temp_key)
-            dict_list_desc.append(log_dict_data_change[temp_key])
-            list_new.append("--New value--")
-            list_old.append("--Old value--")
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Arrays for data change events, descriptions, old values, and new values.
+      """
+      dict_list_event, dict_list_desc = gtsf.generate_dict_key_and_value_array(num_records, log_dict_data_change, rng)
+      list_old = np.full(num_records, "--Old value--")
+      list_new = np.full(num_records, "--New value--")
       return dict_list_event, dict_list_desc, list_old, list_new
 
 # Generate the Log File Change Fields
-def generate_log_filechange_fields(num_records):
+def generate_log_filechange_fields(num_records, rng = None):
       """
       Generate lists of file change events and their descriptions.
       :param num_records: Number of file change events to generate.
-      :return: Lists for file change events, descriptions, old values, and new values.
-      """
-      dict_list_event = []
-      dict_list_desc = []
-      list_fc = list(log_dict_file_change.keys())
-      list_old = []
-      list_new = []
-      for x in range(num_records):
-            temp_key = random.choice(list_fc)
-            dict_list_event.append(temp_key)
-            dict_list_desc.append(log_dict_file_change[temp_key])
-            list_new.append("--New value--")
-            list_old.append("--Old value--")
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Arrays for file change events, descriptions, old values, and new values.
+      """
+      dict_list_event, dict_list_desc = gtsf.generate_dict_key_and_value_array(num_records, log_dict_file_change, rng)
+      list_old = np.full(num_records, "--Old value--")
+      list_new = np.full(num_records, "--New value--")
       return dict_list_event, dict_list_desc, list_old, list_new
 
 # Generate the Log Security Fields
-def generate_log_security_fields(num_records):
+def generate_log_security_fields(num_records, rng = None):
       """
       Generate lists of security events and their descriptions.
       :param num_records: Number of security events to generate.
-      :return: Two lists, one for security events and one for their descriptions.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Two arrays, one for security events and one for their descriptions.
       """
-      dict_list_event = []
-      dict_list_desc = []
-      list_sec = list(log_dict_security.keys())
-      for x in range(num_records):
-            temp_key = random.choice(list_sec)
-            dict_list_event.append(temp_key)
-            dict_list_desc.append(log_dict_security[temp_key])
-      return dict_list_event, dict_list_desc
+      return gtsf.generate_dict_key_and_value_array(num_records, log_dict_security, rng)
 
 # Generate the Log User Web Activity Fields
-def generate_log_user_web_fields(num_records):
+def generate_log_user_web_fields(num_records, rng = None):
       """
       Generate lists of user web activities and their descriptions.
       :param num_records: Number of user web activities to generate.
-      :return: Two lists, one for user web activities and one for their descriptions.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Two arrays, one for user web activities and one for their descriptions.
       """
-      dict_list_event = []
-      dict_list_desc = []
-      list_u = list(log_dict_user_web.keys())
-      for x in range(num_records):
-            temp_key = random.choice(list_u)
-            dict_list_event.append(temp_key)
-            dict_list_desc.append(log_dict_user_web[temp_key])
-      return dict_list_event, dict_list_desc
+      return gtsf.generate_dict_key_and_value_array(num_records, log_dict_user_web, rng)
 
 # Generate the Log User Server Activity Fields
-def generate_log_user_server_fields(num_records):
+def generate_log_user_server_fields(num_records, rng = None):
       """
       Generate lists of user server activities and their descriptions.
       :param num_records: Number of user server activities to generate.
-      :return: Two lists, one for user server activities and one for their descriptions.
-      """
-      dict_list_event = []
-      dict_list_desc = []
-      list_u = list(log_dict_user_server.keys())
-      for x in range(num_records):
-            temp_key = random.choice(list_u)
-            dict_list_event.append(temp_key)
-            dict_list_desc.append(log_dict_user_server[temp_key])
-      return dict_list_event, dict_list_desc
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Two arrays, one for user server activities and one for their descriptions.
+      """
+      return gtsf.generate_dict_key_and_value_array(num_records, log_dict_user_server, rng)
             
 # Generate the Log User Account Activity Fields
-def generate_log_user_account_fields(num_records):
+def generate_log_user_account_fields(num_records, rng = None):
       """
       Generate lists of user account activities and their descriptions.
       :param num_records: Number of user account activities to generate.
-      :return: Two lists, one for user account activities and one for their descriptions.
-      """
-      dict_list_event = []
-      dict_list_desc = []
-      list_u = list(log_dict_user_accout.keys())
-      for x in range(num_records):
-            temp_key = random.choice(list_u)
-            dict_list_event.append(temp_key)
-            dict_list_desc.append(log_dict_user_accout[temp_key])
-      return dict_list_event, dict_list_desc
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Two arrays, one for user account activities and one for their descriptions.
+      """
+      return gtsf.generate_dict_key_and_value_array(num_records, log_dict_user_accout, rng)
                     
 # Generate the Log Error Activity Fields
-def generate_log_errors_fields(num_records):
+def generate_log_errors_fields(num_records, rng = None):
       """
       Generate lists of error events and their descriptions.
       :param num_records: Number of error events to generate.
-      :return: Two lists, one for error events and one for their descriptions.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Two arrays, one for error events and one for their descriptions.
       """
-      dict_list_event = []
-      dict_list_desc = []
-      list_u = list(log_dict_errors.keys())
-      for x in range(num_records):
-            temp_key = random.choice(list_u)
-            dict_list_event.append(temp_key)
-            dict_list_desc.append(log_dict_errors[temp_key])
-      return dict_list_event, dict_list_desc
+      return gtsf.generate_dict_key_and_value_array(num_records, log_dict_errors, rng)
 
 # Generate the Log Error Activity Fields
-def generate_log_error_codes_fields(num_records):
+def generate_log_error_codes_fields(num_records, rng = None):
       """
       Generate lists of error code events and their descriptions.
       :param num_records: Number of error code events to generate.
-      :return: Two lists, one for error code events and one for their descriptions.
-      """
-      dict_list_event = []
-      dict_list_desc = []
-      list_u = list(log_dict_error_codes.keys())
-      for x in range(num_records):
-            temp_key = random.choice(list_u)
-            dict_list_event.append(temp_key)
-            dict_list_desc.append(log_dict_error_codes[temp_key])
-      return dict_list_event, dict_list_desc
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Two arrays, one for error code events and one for their descriptions.
+      """
+      return gtsf.generate_dict_key_and_value_array(num_records, log_dict_error_codes, rng)
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
 #----------              Generate the Log Table                     ---------- 
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
 
-def generate_table_log_general(dict, id_field_name = 'ID_Record'): 
+def generate_table_log_general(dict, id_field_name = 'ID_Record', rng_context = None, total_records = None): 
       """
       Populate a dictionary with various general log data fields to build a log table.
       :param dict: Dictionary to populate with log data.
       :param num_records: Number of records to generate for each field.
+      :param rng_context: Optional RNG_Context (or master seed) the table's column streams are derived from.
+      :param total_records: Rows of the whole table when dict holds one chunk of it (default the rows in dict).
       :return: Dictionary populated with general log data fields.
       """
-      num_records = len(dict[id_field_name])
-      dict['Log ID'] = generate_log_id_field(num_records)
-      dict['Time Stamp'] = generate_log_timestamp_field(num_records)
-      dict['User ID'] = generate_log_userid_field(num_records)
-      dict['IP Address'] = generate_log_ip_address_field(num_records)
-      dict['Hostname'] = generate_log_hostname_field(num_records)
-      dict['Log Level'] = generate_log_severity_field(num_records)
-      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'])
-      dict['Reference ID'] = generate_log_referenceid_field(num_records)
-      dict['Source'] = generate_log_source_field(num_records)
-      dict['Log Event'], dict['Log Event Description']  = generate_log_event_fields(num_records)
+      num_records = gtsf.resolve_id_records(dict, id_field_name)
+      rng_context = gtsf.get_rng_context(rng_context).table('log_general')
+      dict['Log ID'] = generate_log_id_field(num_records, gtsf.unique_id_width(9, num_records if total_records is None else total_records), rng=rng_context.table_column('Log ID'), id_offset=rng_context.record_offset)
+      dict['Time Stamp'] = generate_log_timestamp_field(num_records, max_date=rng_context.reference_date, rng=rng_context.column('Time Stamp'))
+      dict['User ID'] = generate_log_userid_field(num_records, rng=rng_context.column('User ID'))
+      dict['IP Address'] = generate_log_ip_address_field(num_records, rng=rng_context.column('IP Address'))
+      dict['Hostname'] = generate_log_hostname_field(num_records, rng=rng_context.column('Hostname'))
+      dict['Log Level'] = generate_log_severity_field(num_records, rng=rng_context.column('Log Level'))
+      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'], rng=rng_context.column('Status'))
+      dict['Reference ID'] = generate_log_referenceid_field(num_records, rng=rng_context.column('Reference ID'))
+      dict['Source'] = generate_log_source_field(num_records, rng=rng_context.column('Source'))
+      dict['Log Event'], dict['Log Event Description']  = generate_log_event_fields(num_records, rng=rng_context.column('Log Event'))
       return dict
 
-def generate_table_log_datachange(dict, id_field_name = 'ID_Record'):  
+def generate_table_log_datachange(dict, id_field_name = 'ID_Record', rng_context = None, total_records = None):  
       """
       Populate a dictionary with log data fields related to data changes.
       :param dict: Dictionary to populate with log data.
       :param num_records: Number of records to generate for each field.
+      :param rng_context: Optional RNG_Context (or master seed) the table's column streams are derived from.
+      :param total_records: Rows of the whole table when dict holds one chunk of it (default the rows in dict).
       :return: Dictionary populated with log data fields related to data changes.
       """
-      num_records = len(dict[id_field_name])
-      dict['Log ID'] = generate_log_id_field(num_records)
-      dict['Time Stamp'] = generate_log_timestamp_field(num_records)
-      dict['User ID'] = generate_log_userid_field(num_records)
-      dict['IP Address'] = generate_log_ip_address_field(num_records)
-      dict['Hostname'] = generate_log_hostname_field(num_records)
-      dict['Log Level'] = generate_log_severity_field(num_records)
-      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'])
-      dict['Reference ID'] = generate_log_referenceid_field(num_records)
-      dict['Source'] = generate_log_source_field(num_records)
+      num_records = gtsf.resolve_id_records(dict, id_field_name)
+      rng_context = gtsf.get_rng_context(rng_context).table('log_datachange')
+      dict['Log ID'] = generate_log_id_field(num_records, gtsf.unique_id_width(9, num_records if total_records is None else total_records), rng=rng_context.table_column('Log ID'), id_offset=rng_context.record_offset)
+      dict['Time Stamp'] = generate_log_timestamp_field(num_records, max_date=rng_context.reference_date, rng=rng_context.column('Time Stamp'))
+      dict['User ID'] = generate_log_userid_field(num_records, rng=rng_context.column('User ID'))
+      dict['IP Address'] = generate_log_ip_address_field(num_records, rng=rng_context.column('IP Address'))
+      dict['Hostname'] = generate_log_hostname_field(num_records, rng=rng_context.column('Hostname'))
+      dict['Log Level'] = generate_log_severity_field(num_records, rng=rng_context.column('Log Level'))
+      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'], rng=rng_context.column('Status'))
+      dict['Reference ID'] = generate_log_referenceid_field(num_records, rng=rng_context.column('Reference ID'))
+      dict['Source'] = generate_log_source_field(num_records, rng=rng_context.column('Source'))
       dict['Log Data Change'], dict['Log Data Change Description'], dict['Old Value'], \
-      dict['New Value'] = generate_log_datachange_fields(num_records)
+      dict['New Value'] = generate_log_datachange_fields(num_records, rng=rng_context.column('Log Data Change'))
       return dict
 
-def generate_table_log_filechange(dict, id_field_name = 'ID_Record'):  
+def generate_table_log_filechange(dict, id_field_name = 'ID_Record', rng_context = None, total_records = None):  
       """
       Populate a dictionary with log data fields related to file changes.
       :param dict: Dictionary to populate with log data.
       :param num_records: Number of records to generate for each field.
+      :param rng_context: Optional RNG_Context (or master seed) the table's column streams are derived from.
+      :param total_records: Rows of the whole table when dict holds one chunk of it (default the rows in dict).
       :return: Dictionary populated with log data fields related to file changes.
       """
-      num_records = len(dict[id_field_name])
-      dict['Log ID'] = generate_log_id_field(num_records)
-      dict['Time Stamp'] = generate_log_timestamp_field(num_records)
-      dict['User ID'] = generate_log_userid_field(num_records)
-      dict['IP Address'] = generate_log_ip_address_field(num_records)
-      dict['Hostname'] = generate_log_hostname_field(num_records)
-      dict['Log Level'] = generate_log_severity_field(num_records)
-      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'])
-      dict['Reference ID'] = generate_log_referenceid_field(num_records)
-      dict['Source'] = generate_log_source_field(num_records)
+      num_records = gtsf.resolve_id_records(dict, id_field_name)
+      rng_context = gtsf.get_rng_context(rng_context).table('log_filechange')
+      dict['Log ID'] = generate_log_id_field(num_records, gtsf.unique_id_width(9, num_records if total_records is None else total_records), rng=rng_context.table_column('Log ID'), id_offset=rng_context.record_offset)
+      dict['Time Stamp'] = generate_log_timestamp_field(num_records, max_date=rng_context.reference_date, rng=rng_context.column('Time Stamp'))
+      dict['User ID'] = generate_log_userid_field(num_records, rng=rng_context.column('User ID'))
+      dict['IP Address'] = generate_log_ip_address_field(num_records, rng=rng_context.column('IP Address'))
+      dict['Hostname'] = generate_log_hostname_field(num_records, rng=rng_context.column('Hostname'))
+      dict['Log Level'] = generate_log_severity_field(num_records, rng=rng_context.column('Log Level'))
+      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'], rng=rng_context.column('Status'))
+      dict['Reference ID'] = generate_log_referenceid_field(num_records, rng=rng_context.column('Reference ID'))
+      dict['Source'] = generate_log_source_field(num_records, rng=rng_context.column('Source'))
       dict['Log File Change'], dict['Log File Change Description'], dict['Old Value'], \
-      dict['New Value'] = generate_log_filechange_fields(num_records)
+      dict['New Value'] = generate_log_filechange_fields(num_records, rng=rng_context.column('Log File Change'))
       return dict
 
-def generate_table_log_security(dict, id_field_name = 'ID_Record'):  
+def generate_table_log_security(dict, id_field_name = 'ID_Record', rng_context = None, total_records = None):  
       """
       Populate a dictionary with log data fields related to security events.
       :param dict: Dictionary to populate with log data.
       :param num_records: Number of records to generate for each field.
+      :param rng_context: Optional RNG_Context (or master seed) the table's column streams are derived from.
+      :param total_records: Rows of the whole table when dict holds one chunk of it (default the rows in dict).
       :return: Dictionary populated with log data fields related to security events.
       """
-      num_records = len(dict[id_field_name])
-      dict['Log ID'] = generate_log_id_field(num_records)
-      dict['Time Stamp'] = generate_log_timestamp_field(num_records)
-      dict['User ID'] = generate_log_userid_field(num_records)
-      dict['IP Address'] = generate_log_ip_address_field(num_records)
-      dict['Hostname'] = generate_log_hostname_field(num_records)
-      dict['Log Level'] = generate_log_severity_field(num_records)
-      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'])
-      dict['Reference ID'] = generate_log_referenceid_field(num_records)
-      dict['Source'] = generate_log_source_field(num_records)
-      dict['Log Security'], dict['Log Security Description'] = generate_log_security_fields(num_records)
+      num_records = gtsf.resolve_id_records(dict, id_field_name)
+      rng_context = gtsf.get_rng_context(rng_context).table('log_security')
+      dict['Log ID'] = generate_log_id_field(num_records, gtsf.unique_id_width(9, num_records if total_records is None else total_records), rng=rng_context.table_column('Log ID'), id_offset=rng_context.record_offset)
+      dict['Time Stamp'] = generate_log_timestamp_field(num_records, max_date=rng_context.reference_date, rng=rng_context.column('Time Stamp'))
+      dict['User ID'] = generate_log_userid_field(num_records, rng=rng_context.column('User ID'))
+      dict['IP Address'] = generate_log_ip_address_field(num_records, rng=rng_context.column('IP Address'))
+      dict['Hostname'] = generate_log_hostname_field(num_records, rng=rng_context.column('Hostname'))
+      dict['Log Level'] = generate_log_severity_field(num_records, rng=rng_context.column('Log Level'))
+      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'], rng=rng_context.column('Status'))
+      dict['Reference ID'] = generate_log_referenceid_field(num_records, rng=rng_context.column('Reference ID'))
+      dict['Source'] = generate_log_source_field(num_records, rng=rng_context.column('Source'))
+      dict['Log Security'], dict['Log Security Description'] = generate_log_security_fields(num_records, rng=rng_context.column('Log Security'))
       return dict
 
 # Log Table Generator: user web activity
-def generate_table_log_user_web_activity(dict, id_field_name = 'ID_Record'):  
+def generate_table_log_user_web_activity(dict, id_field_name = 'ID_Record', rng_context = None, total_records = None):  
       """
       Populate a dictionary with log data fields related to user web activity.
       :param dict: Dictionary to populate with log data.
       :param num_records: Number of records to generate for each field.
+      :param rng_context: Optional RNG_Context (or master seed) the table's column streams are derived from.
+      :param total_records: Rows of the whole table when dict holds one chunk of it (default the rows in dict).
       :return: Dictionary populated with log data fields related to user web activity.
       """
-      num_records = len(dict[id_field_name])
-      dict['Log ID'] = generate_log_id_field(num_records)
-      dict['Time Stamp'] = generate_log_timestamp_field(num_records)
-      dict['User ID'] = generate_log_userid_field(num_records)
-      dict['IP Address'] = generate_log_ip_address_field(num_records)
-      dict['Hostname'] = generate_log_hostname_field(num_records)
-      dict['Log Level'] = generate_log_severity_field(num_records)
-      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'])
-      dict['Reference ID'] = generate_log_referenceid_field(num_records)
-      dict['Source'] = generate_log_source_field(num_records)
-      dict['Log User Activity'], dict['Log User Description'] = generate_log_user_web_fields(num_records)
+      num_records = gtsf.resolve_id_records(dict, id_field_name)
+      rng_context = gtsf.get_rng_context(rng_context).table('log_user_web_activity')
+      dict['Log ID'] = generate_log_id_field(num_records, gtsf.unique_id_width(9, num_records if total_records is None else total_records), rng=rng_context.table_column('Log ID'), id_offset=rng_context.record_offset)
+      dict['Time Stamp'] = generate_log_timestamp_field(num_records, max_date=rng_context.reference_date, rng=rng_context.column('Time Stamp'))
+      dict['User ID'] = generate_log_userid_field(num_records, rng=rng_context.column('User ID'))
+      dict['IP Address'] = generate_log_ip_address_field(num_records, rng=rng_context.column('IP Address'))
+      dict['Hostname'] = generate_log_hostname_field(num_records, rng=rng_context.column('Hostname'))
+      dict['Log Level'] = generate_log_severity_field(num_records, rng=rng_context.column('Log Level'))
+      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'], rng=rng_context.column('Status'))
+      dict['Reference ID'] = generate_log_referenceid_field(num_records, rng=rng_context.column('Reference ID'))
+      dict['Source'] = generate_log_source_field(num_records, rng=rng_context.column('Source'))
+      dict['Log User Activity'], dict['Log User Description'] = generate_log_user_web_fields(num_records, rng=rng_context.column('Log User Activity'))
       return dict
 
 # Log Table Generator: user server activity
-def generate_table_log_user_server_activity(dict, id_field_name = 'ID_Record'):  
+def generate_table_log_user_server_activity(dict, id_field_name = 'ID_Record', rng_context = None, total_records = None):  
       """
       Populate a dictionary with log data fields related to user server activity.
       :param dict: Dictionary to populate with log data.
       :param num_records: Number of records to generate for each field.
+      :param rng_context: Optional RNG_Context (or master seed) the table's column streams are derived from.
+      :param total_records: Rows of the whole table when dict holds one chunk of it (default the rows in dict).
       :return: Dictionary populated with log data fields related to user server activity.
       """
-      num_records = len(dict[id_field_name])
-      dict['Log ID'] = generate_log_id_field(num_records)
-      dict['Time Stamp'] = generate_log_timestamp_field(num_records)
-      dict['User ID'] = generate_log_userid_field(num_records)
-      dict['IP Address'] = generate_log_ip_address_field(num_records)
-      dict['Hostname'] = generate_log_hostname_field(num_records)
-      dict['Log Level'] = generate_log_severity_field(num_records)
-      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'])
-      dict['Reference ID'] = generate_log_referenceid_field(num_records)
-      dict['Source'] = generate_log_source_field(num_records)
-      dict['Log User Activity'], dict['Log User Description'] = generate_log_user_server_fields(num_records)
+      num_records = gtsf.resolve_id_records(dict, id_field_name)
+      rng_context = gtsf.get_rng_context(rng_context).table('log_user_server_activity')
+      dict['Log ID'] = generate_log_id_field(num_records, gtsf.unique_id_width(9, num_records if total_records is None else total_records), rng=rng_context.table_column('Log ID'), id_offset=rng_context.record_offset)
+      dict['Time Stamp'] = generate_log_timestamp_field(num_records, max_date=rng_context.reference_date, rng=rng_context.column('Time Stamp'))
+      dict['User ID'] = generate_log_userid_field(num_records, rng=rng_context.column('User ID'))
+      dict['IP Address'] = generate_log_ip_address_field(num_records, rng=rng_context.column('IP Address'))
+      dict['Hostname'] = generate_log_hostname_field(num_records, rng=rng_context.column('Hostname'))
+      dict['Log Level'] = generate_log_severity_field(num_records, rng=rng_context.column('Log Level'))
+      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'], rng=rng_context.column('Status'))
+      dict['Reference ID'] = generate_log_referenceid_field(num_records, rng=rng_context.column('Reference ID'))
+      dict['Source'] = generate_log_source_field(num_records, rng=rng_context.column('Source'))
+      dict['Log User Activity'], dict['Log User Description'] = generate_log_user_server_fields(num_records, rng=rng_context.column('Log User Activity'))
       return dict
 
 # Log Table Generator: user account activity
-def generate_table_log_user_account_activity(dict, id_field_name = 'ID_Record'):  
+def generate_table_log_user_account_activity(dict, id_field_name = 'ID_Record', rng_context = None, total_records = None):  
       """
       Populate a dictionary with log data fields related to user account activity.
       :param dict: Dictionary to populate with log data.
       :param num_records: Number of records to generate for each field.
+      :param rng_context: Optional RNG_Context (or master seed) the table's column streams are derived from.
+      :param total_records: Rows of the whole table when dict holds one chunk of it (default the rows in dict).
       :return: Dictionary populated with log data fields related to user server activity.
       """
-      num_records = len(dict[id_field_name])
-      dict['Log ID'] = generate_log_id_field(num_records)
-      dict['Time Stamp'] = generate_log_timestamp_field(num_records)
-      dict['User ID'] = generate_log_userid_field(num_records)
-      dict['IP Address'] = generate_log_ip_address_field(num_records)
-      dict['Hostname'] = generate_log_hostname_field(num_records)
-      dict['Log Level'] = generate_log_severity_field(num_records)
-      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'])
-      dict['Reference ID'] = generate_log_referenceid_field(num_records)
-      dict['Source'] = generate_log_source_field(num_records)
-      dict['Log User Activity'], dict['Log User Description'] = generate_log_user_account_fields(num_records)
+      num_records = gtsf.resolve_id_records(dict, id_field_name)
+      rng_context = gtsf.get_rng_context(rng_context).table('log_user_account_activity')
+      dict['Log ID'] = generate_log_id_field(num_records, gtsf.unique_id_width(9, num_records if total_records is None else total_records), rng=rng_context.table_column('Log ID'), id_offset=rng_context.record_offset)
+      dict['Time Stamp'] = generate_log_timestamp_field(num_records, max_date=rng_context.reference_date, rng=rng_context.column('Time Stamp'))
+      dict['User ID'] = generate_log_userid_field(num_records, rng=rng_context.column('User ID'))
+      dict['IP Address'] = generate_log_ip_address_field(num_records, rng=rng_context.column('IP Address'))
+      dict['Hostname'] = generate_log_hostname_field(num_records, rng=rng_context.column('Hostname'))
+      dict['Log Level'] = generate_log_severity_field(num_records, rng=rng_context.column('Log Level'))
+      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'], rng=rng_context.column('Status'))
+      dict['Reference ID'] = generate_log_referenceid_field(num_records, rng=rng_context.column('Reference ID'))
+      dict['Source'] = generate_log_source_field(num_records, rng=rng_context.column('Source'))
+      dict['Log User Activity'], dict['Log User Description'] = generate_log_user_account_fields(num_records, rng=rng_context.column('Log User Activity'))
       return dict
 
 # Log Table Generator: log errors
-def generate_table_log_errors(dict, id_field_name = 'ID_Record'): 
+def generate_table_log_errors(dict, id_field_name = 'ID_Record', rng_context = None, total_records = None): 
       """
       Populate a dictionary with log data fields related to log errors.
       :param dict: Dictionary to populate with log data.
       :param num_records: Number of records to generate for each field.
+      :param rng_context: Optional RNG_Context (or master seed) the table's column streams are derived from.
+      :param total_records: Rows of the whole table when dict holds one chunk of it (default the rows in dict).
       :return: Dictionary populated with log data fields related to user server activity.
       """
-      num_records = len(dict[id_field_name])
-      dict['Log ID'] = generate_log_id_field(num_records)
-      dict['Time Stamp'] = generate_log_timestamp_field(num_records)
-      dict['User ID'] = generate_log_userid_field(num_records)
-      dict['IP Address'] = generate_log_ip_address_field(num_records)
-      dict['Hostname'] = generate_log_hostname_field(num_records)
-      dict['Log Level'] = generate_log_severity_field(num_records)
-      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'])
-      dict['Reference ID'] = generate_log_referenceid_field(num_records)
-      dict['Source'] = generate_log_source_field(num_records)
-      dict['Log Errors'], dict['Log Error Description'] = generate_log_errors_fields(num_records)
+      num_records = gtsf.resolve_id_records(dict, id_field_name)
+      rng_context = gtsf.get_rng_context(rng_context).table('log_errors')
+      dict['Log ID'] = generate_log_id_field(num_records, gtsf.unique_id_width(9, num_records if total_records is None else total_records), rng=rng_context.table_column('Log ID'), id_offset=rng_context.record_offset)
+      dict['Time Stamp'] = generate_log_timestamp_field(num_records, max_date=rng_context.reference_date, rng=rng_context.column('Time Stamp'))
+      dict['User ID'] = generate_log_userid_field(num_records, rng=rng_context.column('User ID'))
+      dict['IP Address'] = generate_log_ip_address_field(num_records, rng=rng_context.column('IP Address'))
+      dict['Hostname'] = generate_log_hostname_field(num_records, rng=rng_context.column('Hostname'))
+      dict['Log Level'] = generate_log_severity_field(num_records, rng=rng_context.column('Log Level'))
+      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'], rng=rng_context.column('Status'))
+      dict['Reference ID'] = generate_log_referenceid_field(num_records, rng=rng_context.column('Reference ID'))
+      dict['Source'] = generate_log_source_field(num_records, rng=rng_context.column('Source'))
+      dict['Log Errors'], dict['Log Error Description'] = generate_log_errors_fields(num_records, rng=rng_context.column('Log Errors'))
       return dict
 
 # Log Table Generator: log error codes
-def generate_table_log_error_codes(dict, id_field_name = 'ID_Record'):  
+def generate_table_log_error_codes(dict, id_field_name = 'ID_Record', rng_context = None, total_records = None):  
       """
       Populate a dictionary with log data fields related to log error codes.
       :param dict: Dictionary to populate with log data.
       :param num_records: Number of records to generate for each field.
+      :param rng_context: Optional RNG_Context (or master seed) the table's column streams are derived from.
+      :param total_records: Rows of the whole table when dict holds one chunk of it (default the rows in dict).
       :return: Dictionary populated with log data fields related to user server activity.
       """
-      num_records = len(dict[id_field_name])
-      dict['Log ID'] = generate_log_id_field(num_records)
-      dict['Time Stamp'] = generate_log_timestamp_field(num_records)
-      dict['User ID'] = generate_log_userid_field(num_records)
-      dict['IP Address'] = generate_log_ip_address_field(num_records)
-      dict['Hostname'] = generate_log_hostname_field(num_records)
-      dict['Log Level'] = generate_log_severity_field(num_records)
-      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'])
-      dict['Reference ID'] = generate_log_referenceid_field(num_records)
-      dict['Source'] = generate_log_source_field(num_records)
-      dict['Log Error Code'], dict['Log Error Code Description'] = generate_log_error_codes_fields(num_records)
+      num_records = gtsf.resolve_id_records(dict, id_field_name)
+      rng_context = gtsf.get_rng_context(rng_context).table('log_error_codes')
+      dict['Log ID'] = generate_log_id_field(num_records, gtsf.unique_id_width(9, num_records if total_records is None else total_records), rng=rng_context.table_column('Log ID'), id_offset=rng_context.record_offset)
+      dict['Time Stamp'] = generate_log_timestamp_field(num_records, max_date=rng_context.reference_date, rng=rng_context.column('Time Stamp'))
+      dict['User ID'] = generate_log_userid_field(num_records, rng=rng_context.column('User ID'))
+      dict['IP Address'] = generate_log_ip_address_field(num_records, rng=rng_context.column('IP Address'))
+      dict['Hostname'] = generate_log_hostname_field(num_records, rng=rng_context.column('Hostname'))
+      dict['Log Level'] = generate_log_severity_field(num_records, rng=rng_context.column('Log Level'))
+      dict['Status'] = generate_log_status_field(num_records, dict['Log Level'], rng=rng_context.column('Status'))
+      dict['Reference ID'] = generate_log_referenceid_field(num_records, rng=rng_context.column('Reference ID'))
+      dict['Source'] = generate_log_source_field(num_records, rng=rng_context.column('Source'))
+      dict['Log Error Code'], dict['Log Error Code Description'] = generate_log_error_codes_fields(num_records, rng=rng_context.column('Log Error Code'))
       return dict
 
 #----------------------------------------------------------------------------------
@@ -1,9 +1,691 @@
 import pandas as pd
-import random
+import numpy as np
 import string
+import zlib
+import functools
 from datetime import datetime, timedelta, date
 
 
+# ---------------------------------------------------------------------------------------------------------
+# ---------------------------------------------------------------------------------------------------------
+# --------------                    Seeded Random Streams                                    --------------
+# ---------------------------------------------------------------------------------------------------------
+# ---------------------------------------------------------------------------------------------------------
+
+# Default reference date ("today") of the generated data: the latest date a date field can hold,
+# fixed so the same master seed produces the same dataset on any day
+default_reference_date = datetime(2025, 1, 1)
+
+class RNG_Context:
+      """
+      Derives independent, reproducible NumPy random streams from one master seed.
+      Every stream is addressed by a path of names (e.g. table -> chunk -> column), so the same
+      path always produces the same numbers, whatever order or process it is generated in.
+      """
+      def __init__(self, master_seed = None, path = (), record_offset = 0, reference_date = default_reference_date):
+            """
+            Initialize the RNG_Context object.
+            :param master_seed: Master seed for every derived stream (default None draws a fresh random seed).
+            :param path: Names of the scopes this context was derived through (default root scope).
+            :param record_offset: Position of the first record of this scope within its table (default 0).
+            :param reference_date: Reference date ("today") of the generated data, the latest date a date field can hold
+                                   (default default_reference_date).
+            """
+            if master_seed is None:
+                  master_seed = np.random.SeedSequence().entropy
+            self.master_seed = master_seed
+            self.path = tuple(path)
+            self.record_offset = record_offset
+            self.reference_date = reference_date
+
+      def __repr__(self):
+            return f"RNG_Context(master_seed={self.master_seed}, path={self.path}, record_offset={self.record_offset}, reference_date={self.reference_date:%Y-%m-%d})"
+
+      def table(self, table_name):
+            """
+            Derive the context of a table.
+            :param table_name: Name of the table.
+            :return: RNG_Context scoped to the table.
+            """
+            return RNG_Context(self.master_seed, self.path + (f"table:{table_name}",), self.record_offset, self.reference_date)
+
+      def chunk(self, chunk_num, record_offset = 0):
+            """
+            Derive the context of a chunk of rows.
+            :param chunk_num: Position of the chunk within its table.
+            :param record_offset: Position of the first record of the chunk within its table (default 0).
+            :return: RNG_Context scoped to the chunk.
+            """
+            return RNG_Context(self.master_seed, self.path + (f"chunk:{chunk_num}",), self.record_offset + record_offset, self.reference_date)
+
+      def column(self, column_name):
+            """
+            Create the random stream of a column.
+            :param column_name: Name of the column (or of any other named operation).
+            :return: numpy.random.Generator dedicated to the column.
+            """
+            # zlib.crc32 is stable across processes, unlike the built-in hash() of a string
+            spawn_key = tuple(zlib.crc32(name.encode("utf-8")) for name in self.path + (f"column:{column_name}",))
+            return np.random.default_rng(np.random.SeedSequence(entropy=self.master_seed, spawn_key=spawn_key))
+
+      def table_column(self, column_name):
+            """
+            Create a random stream shared by every chunk of the table (e.g. for the vocabulary of a column),
+            so values that must agree across chunk boundaries are drawn identically in each chunk.
+            :param column_name: Name of the column (or of any other named operation).
+            :return: numpy.random.Generator dedicated to the column, ignoring the chunk scope.
+            """
+            table_path = tuple(name for name in self.path if not name.startswith("chunk:"))
+            return RNG_Context(self.master_seed, table_path).column(column_name)
+
+# Resolve the context used by the table generators and data classes
+def get_rng_context(rng_context = None):
+      """
+      Return the RNG_Context to derive streams from.
+      :param rng_context: An RNG_Context, an integer master seed, or None for a fresh random master seed.
+      :return: An RNG_Context.
+      """
+      if isinstance(rng_context, RNG_Context):
+            return rng_context
+      return RNG_Context(rng_context)
+
+
+# ---------------------------------------------------------------------------------------------------------
+# ---------------------------------------------------------------------------------------------------------
+# --------------                    Batch (NumPy) Support Fields                             --------------
+# ---------------------------------------------------------------------------------------------------------
+# ---------------------------------------------------------------------------------------------------------
+
+# Default NumPy generator used when no generator is passed to the batch functions
+default_rng = np.random.default_rng()
+
+# Resolve the generator used by the batch functions
+def get_rng(rng = None):
+      """
+      Return the NumPy generator to draw from.
+      :param rng: A numpy.random.Generator, or None to use the module default generator.
+      :return: A numpy.random.Generator.
+      """
+      if rng is None:
+            return default_rng
+      return rng
+
+# Batch Random Integer Generator
+def generate_random_int_array(num_records, min, max, rng = None):
+      """
+      Generate an array of random integers within a specified range (both ends inclusive).
+      :param num_records: Number of integers to generate.
+      :param min: Minimum value for the random integers.
+      :param max: Maximum value for the random integers.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: NumPy array of random integers.
+      """
+      return get_rng(rng).integers(min, max, size=num_records, endpoint=True)
+
+# Batch Date Converter: datetime, yyyymmdd integer, or array of dates to a day resolution datetime64 array
+def function_date_to_datetime64_array(date_value):
+      """
+      Convert a date, or a list/array of dates, into a day resolution datetime64 array.
+      :param date_value: A datetime, a yyyymmdd integer, or a list/array/Series of dates (None becomes NaT).
+      :return: NumPy datetime64[D] array (zero dimensional for a single date).
+      """
+      if isinstance(date_value, int):
+            date_value = function_date_int_to_datetime(date_value)
+      return np.asarray(date_value, dtype='datetime64[ns]').astype('datetime64[D]')
+
+# Batch Random Date Generator
+def generate_date_array(num_records, min_date, max_date, rng = None, mask = None):
+      """
+      Generate an array of random dates between min_date and max_date (both ends inclusive).
+      The bounds may be single dates or per-record arrays, so dependent columns (e.g. modified >= created)
+      are drawn in one call.
+      :param num_records: Number of dates to generate.
+      :param min_date: Minimum date, or array of per-record minimum dates.
+      :param max_date: Maximum date, or array of per-record maximum dates.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :param mask: Optional boolean array; records where it is False are left as NaT.
+      :return: NumPy datetime64[ns] array of dates (day granularity).
+      """
+      min_day = np.broadcast_to(function_date_to_datetime64_array(min_date), (num_records,))
+      max_day = np.broadcast_to(function_date_to_datetime64_array(max_date), (num_records,))
+      missing = np.isnat(min_day) | np.isnat(max_day)
+      # Day spans as integers; missing bounds and inverted ranges collapse to a zero day span
+      span = np.where(missing, 0, (max_day - min_day).astype(np.int64))
+      span = np.maximum(span, 0)
+      offsets = get_rng(rng).integers(0, span, endpoint=True)
+      date_array = (min_day + offsets).astype('datetime64[ns]')
+      if mask is not None:
+            missing = missing | ~np.asarray(mask, dtype=bool)
+      date_array[missing] = np.datetime64('NaT')
+      return date_array
+
+# Character sets for the bulk string kernel
+alphabet_upper = string.ascii_uppercase
+alphabet_digits = string.digits
+alphabet_lower_digits = string.ascii_lowercase + string.digits
+
+# Batch Random String Kernel
+def generate_random_string_array(num_records, alphabet, min_len, max_len = None, prefix = "", suffix = "", rng = None):
+      """
+      Generate a column of random strings drawn from an alphabet, built as one byte matrix.
+      :param num_records: Number of strings to generate.
+      :param alphabet: ASCII characters to draw from (e.g. alphabet_upper).
+      :param min_len: Minimum number of random characters in each string.
+      :param max_len: Maximum number of random characters in each string (default min_len, i.e. fixed width).
+      :param prefix: Text placed before each string (default empty).
+      :param suffix: Text placed after each string (default empty).
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: NumPy array of random strings.
+      """
+      if max_len is None:
+            max_len = min_len
+      if min_len < 0 or max_len < min_len:
+            raise ValueError(f"String length range {min_len}-{max_len} is not valid")
+      if max_len == 0:
+            return np.full(num_records, prefix + suffix)
+      rng = get_rng(rng)
+      alphabet_codes = np.frombuffer(alphabet.encode("ascii"), dtype=np.uint8)
+      char_codes = alphabet_codes[rng.integers(0, len(alphabet_codes), size=(num_records, max_len))]
+      if max_len != min_len:
+            # Null bytes past each record's length are dropped by the fixed width byte string dtype
+            lengths = rng.integers(min_len, max_len, size=num_records, endpoint=True)
+            char_codes[np.arange(max_len) >= lengths[:, None]] = 0
+      strings = char_codes.view(f"S{max_len}").ravel()
+      if prefix:
+            strings = np.char.add(prefix.encode("ascii"), strings)
+      if suffix:
+            strings = np.char.add(strings, suffix.encode("ascii"))
+      return strings.astype(str)
+
+# Batch Zero Padded Number Formatter
+def format_zero_padded_array(int_list, width, prefix = ""):
+      """
+      Format non-negative integers as zero padded digit strings, digit by digit in one byte matrix.
+      :param int_list: Integers to format (each must fit in width digits).
+      :param width: Number of digits in each string.
+      :param prefix: Text placed before each string (default empty).
+      :return: NumPy array of zero padded strings.
+      """
+      values = np.asarray(int_list, dtype=np.int64)
+      powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+      digit_codes = ((values[:, None] // powers) % 10 + ord("0")).astype(np.uint8)
+      strings = np.ascontiguousarray(digit_codes).view(f"S{width}").ravel()
+      if prefix:
+            strings = np.char.add(prefix.encode("ascii"), strings)
+      return strings.astype(str)
+
+# Batch Random Letter Generator
+def generate_random_letter_array(num_records, num_letters, rng = None):
+      """
+      Generate an array of strings made of random uppercase letters.
+      :param num_records: Number of strings to generate.
+      :param num_letters: Number of letters in each string.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: NumPy array of random uppercase strings.
+      """
+      return generate_random_string_array(num_records, alphabet_upper, max(num_letters, 0), rng=rng)
+
+# Batch Random Choice Generator
+def generate_random_choice_array(num_records, choice_list, rng = None):
+      """
+      Generate an array of values chosen uniformly at random from a list.
+      :param num_records: Number of values to generate.
+      :param choice_list: List of values to choose from.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: NumPy array of randomly chosen values.
+      """
+      choice_array = np.asarray(choice_list)
+      return choice_array[get_rng(rng).integers(0, len(choice_array), size=num_records)]
+
+# Distributions of generate_skewed_index_array
+skewed_index_distributions = ['uniform', 'zipf', 'hot_key', 'at_least_once']
+
+# Batch Skewed Index Generator: positions into a list of values, drawn with a configurable skew
+def generate_skewed_index_array(num_records, num_values, distribution = 'uniform', rng = None, zipf_exponent = 1.1, \
+                                hot_value_perc = 1, hot_record_perc = 80):
+      """
+      Generate an array of random positions into a list of values, with a configurable distribution:
+      'uniform' draws every position equally, 'zipf' draws the k-th most frequent position with weight 1/k**zipf_exponent,
+      'hot_key' sends hot_record_perc% of the records to hot_value_perc% of the positions, and 'at_least_once'
+      uses every position once before drawing the remaining records uniformly. Which positions are the
+      frequent ones is itself random.
+      :param num_records: Number of positions to generate.
+      :param num_values: Number of values to choose from.
+      :param distribution: One of skewed_index_distributions (default 'uniform').
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :param zipf_exponent: Exponent of the 'zipf' distribution (default 1.1).
+      :param hot_value_perc: Percentage of the positions that are hot for 'hot_key' (default 1%, at least one position).
+      :param hot_record_perc: Percentage of the records drawn from the hot positions for 'hot_key' (default 80%).
+      :return: NumPy array of positions.
+      """
+      rng = get_rng(rng)
+      if num_values < 1:
+            raise ValueError(f"num_values value of {num_values} must be 1 or greater")
+      if distribution == 'uniform':
+            return rng.integers(0, num_values, size=num_records)
+      if distribution == 'zipf':
+            if zipf_exponent <= 0:
+                  raise ValueError(f"zipf_exponent value of {zipf_exponent} must be greater than 0")
+            # Bounded Zipf by inverse CDF over the ranks, then a random rank -> position mapping
+            rank_cdf = np.cumsum(np.arange(1, num_values + 1, dtype=float) ** -zipf_exponent)
+            ranks = np.searchsorted(rank_cdf, rng.random(num_records) * rank_cdf[-1], side='right')
+            return rng.permutation(num_values)[np.minimum(ranks, num_values - 1)]
+      if distribution == 'hot_key':
+            if hot_value_perc > 100 or hot_value_perc <= 0:
+                  raise ValueError(f"hot_value_perc value of {hot_value_perc} is not between 0% - 100%")
+            if hot_record_perc > 100 or hot_record_perc < 0:
+                  raise ValueError(f"hot_record_perc value of {hot_record_perc} is not between 0% - 100%")
+            hot_values = rng.permutation(num_values)[:max(1, round(num_values * hot_value_perc / 100))]
+            positions = rng.integers(0, num_values, size=num_records)
+            hot_records = rng.random(num_records) < hot_record_perc / 100
+            positions[hot_records] = hot_values[rng.integers(0, len(hot_values), size=int(hot_records.sum()))]
+            return positions
+      if distribution == 'at_least_once':
+            if num_records < num_values:
+                  raise ValueError(f"at_least_once needs num_records ({num_records}) of at least num_values ({num_values})")
+            positions = np.concatenate([np.arange(num_values), rng.integers(0, num_values, size=num_records - num_values)])
+            return rng.permutation(positions)
+      raise ValueError(f"distribution {distribution} is not one of {skewed_index_distributions}")
+
+# Batch Fan-Out Generator: number of related records per record
+def generate_fan_out_array(num_records, fan_out, rng = None):
+      """
+      Generate the number of related records of every record.
+      :param num_records: Number of records.
+      :param fan_out: An int (the same count for every record), or a dictionary with the 'distribution':
+                      'uniform' with 'min' and 'max', 'poisson' with 'mean', or 'zipf' with 'max' and 'zipf_exponent'
+                      (counts 1..max, count k with weight 1/k**zipf_exponent).
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: NumPy array of counts.
+      """
+      rng = get_rng(rng)
+      if isinstance(fan_out, (int, np.integer)):
+            if fan_out < 0:
+                  raise ValueError(f"fan_out value of {fan_out} must be 0 or greater")
+            return np.full(num_records, fan_out, dtype=np.int64)
+      distribution = fan_out.get('distribution', 'uniform')
+      if distribution == 'uniform':
+            return rng.integers(fan_out.get('min', 1), fan_out['max'], size=num_records, endpoint=True)
+      if distribution == 'poisson':
+            return rng.poisson(fan_out['mean'], size=num_records)
+      if distribution == 'zipf':
+            # Rank k of the Zipf draw is the count k, so small counts are the frequent ones
+            rank_cdf = np.cumsum(np.arange(1, fan_out['max'] + 1, dtype=float) ** -fan_out.get('zipf_exponent', 2))
+            return 1 + np.minimum(np.searchsorted(rank_cdf, rng.random(num_records) * rank_cdf[-1], side='right'), fan_out['max'] - 1)
+      raise ValueError(f"fan_out distribution {distribution} is not one of ['uniform', 'poisson', 'zipf']")
+
+# Batch Random Choice Generator excluding a given value per record
+def generate_random_choice_excluding_array(exclude_list, choice_list, rng = None):
+      """
+      Generate an array of values chosen at random from a list, where each record avoids the matching value in exclude_list.
+      :param exclude_list: Values that must not be chosen, one per record.
+      :param choice_list: List of values to choose from (must contain at least two distinct values).
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: NumPy array of randomly chosen values.
+      """
+      rng = get_rng(rng)
+      choice_array = pd.unique(np.asarray(choice_list))
+      if len(choice_array) < 2:
+            raise ValueError("choice_list must contain at least two distinct values")
+      num_records = len(exclude_list)
+      exclude_index = pd.Index(choice_array).get_indexer(np.asarray(exclude_list))
+      # Shifting the excluded position by 1..n-1 (mod n) gives a uniform choice among the other values
+      offsets = rng.integers(1, len(choice_array) - 1, size=num_records, endpoint=True)
+      choice_index = (exclude_index + offsets) % len(choice_array)
+      # Values outside of the choice list cannot collide, so they use a plain uniform choice
+      not_found = exclude_index < 0
+      choice_index[not_found] = rng.integers(0, len(choice_array), size=int(not_found.sum()))
+      return choice_array[choice_index]
+
+class Weighted_Sampler:
+      """
+      Weighted sampler over a fixed vocabulary, built once with Walker's alias method.
+      Each draw costs one uniform position and one uniform float, whatever the vocabulary size.
+      """
+      def __init__(self, value_list, weight_list):
+            """
+            Initialize the Weighted_Sampler object and build its alias table.
+            :param value_list: Values to choose from.
+            :param weight_list: Corresponding weights for each value in the value_list.
+            """
+            weights = np.asarray(weight_list, dtype=float)
+            if len(value_list) != len(weights):
+                  raise ValueError(f"value_list has {len(value_list)} values but weight_list has {len(weights)} weights")
+            if len(weights) == 0 or weights.min() < 0 or weights.sum() <= 0:
+                  raise ValueError(f"weight_list {list(weight_list)} must be non-empty, non-negative and not all zero")
+            self.values = np.asarray(value_list)
+            self.prob, self.alias = self._build_alias_table(weights / weights.sum())
+
+      @staticmethod
+      def _build_alias_table(probabilities):
+            """
+            Build the alias table (Vose's variant) for a normalized probability list.
+            :param probabilities: Probabilities summing to 1.
+            :return: Two NumPy arrays, the acceptance probability and the alias position of each column.
+            """
+            num_values = len(probabilities)
+            scaled = probabilities * num_values
+            prob = np.ones(num_values)
+            alias = np.arange(num_values)
+            small = [i for i in range(num_values) if scaled[i] < 1]
+            large = [i for i in range(num_values) if scaled[i] >= 1]
+            while small and large:
+                  small_i = small.pop()
+                  large_i = large.pop()
+                  prob[small_i] = scaled[small_i]
+                  alias[small_i] = large_i
+                  scaled[large_i] = scaled[large_i] + scaled[small_i] - 1
+                  if scaled[large_i] < 1:
+                        small.append(large_i)
+                  else:
+                        large.append(large_i)
+            # Whatever is left over is full up to rounding error
+            return prob, alias
+
+      def sample_index(self, num_records, rng = None):
+            """
+            Draw weighted positions into the vocabulary.
+            :param num_records: Number of positions to draw.
+            :param rng: Optional numpy.random.Generator (default module generator).
+            :return: NumPy array of positions into the value_list.
+            """
+            rng = get_rng(rng)
+            column = rng.integers(0, len(self.prob), size=num_records)
+            accept = rng.random(num_records) < self.prob[column]
+            return np.where(accept, column, self.alias[column])
+
+      def sample(self, num_records, rng = None):
+            """
+            Draw weighted values from the vocabulary.
+            :param num_records: Number of values to draw.
+            :param rng: Optional numpy.random.Generator (default module generator).
+            :return: NumPy array of randomly chosen values.
+            """
+            return self.values[self.sample_index(num_records, rng)]
+
+# Cached Weighted_Sampler lookup, so each vocabulary and weight set only builds its alias table once
+@functools.lru_cache(maxsize=256)
+def _cached_weighted_sampler(value_tuple, weight_tuple):
+      return Weighted_Sampler(value_tuple, weight_tuple)
+
+def get_weighted_sampler(value_list, weight_list):
+      """
+      Return the (cached) Weighted_Sampler for a vocabulary and weight set.
+      :param value_list: Values to choose from.
+      :param weight_list: Corresponding weights for each value in the value_list.
+      :return: Weighted_Sampler for the vocabulary.
+      """
+      return _cached_weighted_sampler(tuple(value_list), tuple(float(weight) for weight in weight_list))
+
+# Batch Random Weighted Index Generator
+def generate_random_weighted_index_array(num_records, weight_list, rng = None):
+      """
+      Generate an array of random positions, weighted by a list of weights.
+      :param num_records: Number of positions to generate.
+      :param weight_list: Weights for each position.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: NumPy array of positions into weight_list.
+      """
+      return get_weighted_sampler(range(len(weight_list)), weight_list).sample_index(num_records, rng)
+
+# Batch Random Weighted Generator
+def generate_random_weighted_string_array(num_records, string_list, weight_list, rng = None):
+      """
+      Generate an array of strings chosen from a list, weighted by a corresponding list of weights.
+      :param num_records: Number of strings to generate.
+      :param string_list: List of strings to choose from.
+      :param weight_list: Corresponding weights for each string in the string_list.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: NumPy array of randomly chosen strings.
+      """
+      return get_weighted_sampler(string_list, weight_list).sample(num_records, rng)
+
+# Batch Priorization Generator: selecting random values from a list with priorization on a single value
+def generate_random_unique_weighted_array(num_records, random_list, priority_item, weight_pri = 10, weight_oth = 1, rng = None):
+      """
+      Generate an array of random choices from a list, giving priority to a specific item.
+      :param num_records: Number of values to generate.
+      :param random_list: List of items to choose from.
+      :param priority_item: Item to prioritize in the list.
+      :param weight_pri: Weight for the priority item (default 10).
+      :param weight_oth: Weight for other items in the list (default 1).
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: NumPy array of randomly chosen items.
+      """
+      weight_list = [weight_pri if item == priority_item else weight_oth for item in random_list]
+      return generate_random_weighted_string_array(num_records, random_list, weight_list, rng)
+
+# Batch Categorical Generator: values are drawn as positions into the vocabulary and stored dictionary-encoded
+def generate_random_categorical_array(num_records, category_list, weight_list = None, rng = None):
+      """
+      Generate a pandas Categorical of values chosen from a vocabulary, uniformly or weighted. The draws match
+      generate_random_choice_array / generate_random_weighted_string_array, only the storage differs.
+      :param num_records: Number of values to generate.
+      :param category_list: Vocabulary to choose from (a repeated value counts once per occurrence).
+      :param weight_list: Optional weights for each value in the category_list (default uniform).
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: pandas Categorical whose categories are the distinct vocabulary values.
+      """
+      position_codes, categories = pd.factorize(np.asarray(category_list))
+      if weight_list is None:
+            positions = get_rng(rng).integers(0, len(position_codes), size=num_records)
+      else:
+            positions = generate_random_weighted_index_array(num_records, weight_list, rng)
+      return pd.Categorical.from_codes(position_codes[positions], categories=categories)
+
+# Batch Priorization Categorical Generator: generate_random_unique_weighted_array stored as a Categorical
+def generate_random_unique_weighted_categorical(num_records, random_list, priority_item, weight_pri = 10, weight_oth = 1, rng = None):
+      """
+      Generate a pandas Categorical of random choices from a vocabulary, giving priority to a specific item.
+      :param num_records: Number of values to generate.
+      :param random_list: Vocabulary to choose from.
+      :param priority_item: Item to prioritize in the list.
+      :param weight_pri: Weight for the priority item (default 10).
+      :param weight_oth: Weight for other items in the list (default 1).
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: pandas Categorical whose categories are the distinct vocabulary values.
+      """
+      weight_list = [weight_pri if item == priority_item else weight_oth for item in random_list]
+      return generate_random_categorical_array(num_records, random_list, weight_list, rng)
+
+# Batch Dictionary Key and Value Generator
+def generate_dict_key_and_value_array(num_records, choice_dict, rng = None):
+      """
+      Generate an array of random dictionary keys and the array of their matching values.
+      :param num_records: Number of records to generate.
+      :param choice_dict: Dictionary to choose from.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Two NumPy arrays, one for the keys and one for their values.
+      """
+      key_array = np.asarray(list(choice_dict.keys()))
+      value_array = np.asarray(list(choice_dict.values()))
+      choice_index = get_rng(rng).integers(0, len(key_array), size=num_records)
+      return key_array[choice_index], value_array[choice_index]
+
+# Batch Dependent Choice Generator: each record chooses from the list mapped to its key
+def generate_mapped_choice_array(key_list, choice_dict, rng = None):
+      """
+      Generate an array where each record is chosen at random from the list mapped to its key.
+      :param key_list: Keys for each record.
+      :param choice_dict: Dictionary mapping each key to a list of possible values.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: NumPy array of randomly chosen values.
+      """
+      key_array = np.asarray(key_list)
+      result = np.empty(len(key_array), dtype=object)
+      # Loop over the distinct keys (the vocabulary), never over the records
+      for key in np.unique(key_array):
+            key_mask = key_array == key
+            result[key_mask] = generate_random_choice_array(int(key_mask.sum()), choice_dict[key], rng)
+      return result.astype(str)
+
+# Batch String Joiner
+def join_string_arrays(string_arrays, separator = ""):
+      """
+      Join several arrays element-wise into one array of strings.
+      :param string_arrays: List of arrays (or scalars) to join, all of the same length.
+      :param separator: String placed between each joined element (default empty).
+      :return: NumPy array of joined strings.
+      """
+      joined = np.asarray(string_arrays[0]).astype(str)
+      for string_array in string_arrays[1:]:
+            if separator:
+                  joined = np.char.add(joined, separator)
+            joined = np.char.add(joined, np.asarray(string_array).astype(str))
+      return joined
+
+class Feistel_ID_Source:
+      """
+      Keyed format-preserving permutation of an ID range [min_id, max_id], built as a balanced Feistel network
+      over the smallest power-of-two domain holding the range, with cycle-walking back into the range.
+      Position i of the permutation is always the same ID, so disjoint position ranges (chunks, workers)
+      give disjoint IDs without any shared state, in O(1) memory per ID.
+      """
+      num_rounds = 4
+
+      def __init__(self, min_id, max_id, rng = None):
+            """
+            Initialize the Feistel_ID_Source object.
+            :param min_id: Smallest ID of the range.
+            :param max_id: Largest ID of the range.
+            :param rng: Optional numpy.random.Generator the round keys are drawn from (default module generator).
+            """
+            if max_id < min_id:
+                  raise ValueError(f"max_id value of {max_id} is smaller than min_id value of {min_id}")
+            self.min_id = int(min_id)
+            self.num_ids = int(max_id) - int(min_id) + 1
+            if self.num_ids > 2 ** 62:
+                  raise ValueError(f"ID range of {self.num_ids} values is above the 2**62 values supported")
+            self.half_bits = max(1, ((self.num_ids - 1).bit_length() + 1) // 2)
+            self.half_mask = np.uint64((1 << self.half_bits) - 1)
+            self.round_keys = get_rng(rng).integers(0, 2 ** 63, size=self.num_rounds, dtype=np.uint64)
+
+      def _round_function(self, half, round_key):
+            # 64-bit multiply-xorshift mix of the half block and the round key (uint64 arithmetic wraps)
+            mixed = (half ^ round_key) * np.uint64(0x9E3779B97F4A7C15)
+            mixed ^= mixed >> np.uint64(29)
+            mixed *= np.uint64(0xBF58476D1CE4E5B9)
+            mixed ^= mixed >> np.uint64(32)
+            return mixed & self.half_mask
+
+      def _permute(self, positions):
+            left = positions >> np.uint64(self.half_bits)
+            right = positions & self.half_mask
+            for round_key in self.round_keys:
+                  left, right = right, left ^ self._round_function(right, round_key)
+            return (left << np.uint64(self.half_bits)) | right
+
+      def ids(self, start, count):
+            """
+            IDs at positions start .. start + count - 1 of the permutation.
+            :param start: First position.
+            :param count: Number of IDs.
+            :return: NumPy int64 array of distinct IDs.
+            """
+            if start < 0 or start + count > self.num_ids:
+                  raise ValueError(f"Positions {start} to {start + count - 1} are outside the {self.num_ids} IDs of the range")
+            values = self._permute(np.arange(start, start + count, dtype=np.uint64))
+            # Cycle-walking: values that land outside the range are permuted again until they land inside it
+            outside = np.flatnonzero(values >= np.uint64(self.num_ids))
+            while len(outside):
+                  values[outside] = self._permute(values[outside])
+                  outside = outside[values[outside] >= np.uint64(self.num_ids)]
+            return values.astype(np.int64) + self.min_id
+
+# Smallest digit width at or above default_width whose ID range holds num_records distinct IDs
+def unique_id_width(default_width, num_records):
+      """
+      Widen a fixed-width numeric ID until its range (10**(width-1) .. 10**width - 1) holds num_records distinct IDs.
+      :param default_width: Preferred number of digits.
+      :param num_records: Number of distinct IDs needed.
+      :return: Number of digits.
+      """
+      width = default_width
+      while 9 * 10 ** (width - 1) < num_records:
+            width += 1
+      return width
+
+# Batch Unique Fixed Width ID Generator
+def generate_unique_id_array(num_records, len_id_char, rng = None, id_offset = 0):
+      """
+      Generate distinct, random-looking numeric IDs of a fixed digit width from a Feistel_ID_Source.
+      The same rng state and a different id_offset give IDs distinct from those of every other offset range,
+      so chunks of one table (same rng stream, consecutive offsets) never collide.
+      :param num_records: Number of IDs to generate.
+      :param len_id_char: Number of digits of each ID.
+      :param rng: Optional numpy.random.Generator the permutation key is drawn from (default module generator).
+      :param id_offset: Position of the first ID in the permutation (default 0).
+      :return: NumPy int64 array of distinct IDs.
+      """
+      len_id_char = int(len_id_char)
+      id_source = Feistel_ID_Source(10 ** (len_id_char - 1), 10 ** len_id_char - 1, rng)
+      if id_offset + num_records > id_source.num_ids:
+            raise ValueError(f"{id_offset + num_records} distinct IDs do not fit in {len_id_char} digits, "
+                             f"use a len_id_char of at least {unique_id_width(len_id_char, id_offset + num_records)}")
+      return id_source.ids(id_offset, num_records)
+
+# Batch Zero Padded ID Generator
+def generate_prefixed_id_array(num_records, prefix, min_dig_id = 1, max_dig_id = 100000, rng = None):
+      """
+      Generate an array of IDs made of a prefix and a random number zero padded to the digit length of max_dig_id.
+      :param num_records: Number of IDs to generate.
+      :param prefix: Prefix of each ID (e.g. "T").
+      :param min_dig_id: Minimum numeric value for the ID.
+      :param max_dig_id: Maximum numeric value for the ID.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: NumPy array of IDs.
+      """
+      digits = generate_random_int_array(num_records, min_dig_id, max_dig_id, rng)
+      return format_zero_padded_array(digits, len(str(max_dig_id)), prefix)
+
+# Batch Phone Number Generator
+def generate_phone_number_array(num_records, rng = None):
+      """
+      Generate an array of fake phone numbers with all digits being the same random digit.
+      :param num_records: Number of phone numbers to generate.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: NumPy array of fake phone numbers.
+      """
+      return np.char.multiply(generate_random_int_array(num_records, 1, 9, rng).astype(str), 10)
+
+# Batch Log Hostname Generator
+def generate_log_hostname_array(num_records, rng = None):
+      """
+      Generate an array of random hostnames of 7-15 lowercase letters and digits ending in '.com'.
+      :param num_records: Number of hostnames to generate.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: NumPy array of hostnames.
+      """
+      return generate_random_string_array(num_records, alphabet_lower_digits, 7, 15, suffix=".com", rng=rng)
+
+# Batch Log IP Address Generator
+def generate_log_ip_address_array(num_records, rng = None):
+      """
+      Generate an array of random IP addresses.
+      :param num_records: Number of IP addresses to generate.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: NumPy array of IP addresses.
+      """
+      octets = generate_random_int_array((num_records, 4), 0, 255, rng)
+      return join_string_arrays([octets[:, 0], octets[:, 1], octets[:, 2], octets[:, 3]], ".")
+
+# Batch Legal Firm Name Generator
+def generate_legal_firm_name_array(num_records, surnames, legal_terms, rng = None):
+      """
+      Generate an array of random legal firm names made of two different surnames and a legal term.
+      :param num_records: Number of firm names to generate.
+      :param surnames: List of possible surnames.
+      :param legal_terms: List of possible legal terms.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: NumPy array of legal firm names.
+      """
+      surname1 = generate_random_choice_array(num_records, surnames, rng)
+      # Ensure that the two surnames are not the same
+      surname2 = generate_random_choice_excluding_array(surname1, surnames, rng)
+      legal_term = generate_random_choice_array(num_records, legal_terms, rng)
+      return join_string_arrays([surname1, " & ", surname2, " ", legal_term])
+
+
 # ---------------------------------------------------------------------------------------------------------
 # ---------------------------------------------------------------------------------------------------------
 # --------------                    Standard Support Fields                                  --------------
@@ -19,45 +701,125 @@ def generate_random_record_length(min = 500, max = 100000, seed_val = 50):
       :param seed_val: Seed value for random number generator (default 50).
       :return: A random integer within the specified range.
       """
-      # Set the seed for reproducibilityS
-      random.seed(seed_val)
-      # Number of records
-      return random.randint(min, max)
+      # Use a local seeded generator for reproducibility, leaving the global random state untouched
+      return int(np.random.default_rng(seed_val).integers(min, max, endpoint=True))
 
 # Generate a DataFrame with a random ID Column
-def table_generate_id_records(num_records, min_num = 1):
+def table_generate_id_records(num_records, min_num = 1, rng = None):
       """
       Generate a dictionary with a key 'ID_Record' containing a list of random integers.
       :param num_records: Number of records to generate.
       :param min_num: Minimum value for the random integers (default 1).
+      :param rng: Optional numpy.random.Generator (default module generator).
       :return: Dictionary with generated random integers.
       """
-      return {'ID_Record': [random.randint(min_num, num_records) for _ in range(num_records)]}
+      return {'ID_Record': generate_random_int_array(num_records, min_num, num_records, rng)}
+
+# Generate a table chunk by chunk
+def generate_table_chunks(table_generator, id_records, chunk_size, rng_context = None, id_field_name = 'ID_Record', **table_kwargs):
+      """
+      Generate a table as a stream of fixed-size chunks, so only one chunk is held in memory at a time.
+      Each chunk gets its own RNG_Context chunk scope, so the stream is reproducible for a given chunk_size.
+      :param table_generator: A generate_table_* function taking (dict, id_field_name, rng_context).
+      :param id_records: Dictionary holding the ID column of the whole table, an array or a Shuffled_ID_Source
+                         (e.g. from table_generate_unique_id_records) whose chunk slices are computed as they are needed.
+      :param chunk_size: Number of rows in each chunk (the last chunk may be smaller).
+      :param rng_context: Optional RNG_Context (or master seed) the chunk streams are derived from.
+      :param id_field_name: Name of the ID column (default 'ID_Record').
+      :param table_kwargs: Extra keyword arguments passed to table_generator.
+      :return: Generator of dictionaries, one per chunk, populated by table_generator.
+      """
+      if chunk_size < 1:
+            raise ValueError(f"chunk_size value of {chunk_size} must be 1 or greater")
+      rng_context = get_rng_context(rng_context)
+      id_list = id_records[id_field_name]
+      for chunk_num, chunk_start in enumerate(range(0, len(id_list), chunk_size)):
+            chunk_dict = {id_field_name: id_list[chunk_start:chunk_start + chunk_size]}
+            yield table_generator(chunk_dict, id_field_name, rng_context.chunk(chunk_num, chunk_start), **table_kwargs)
+
+# Lazy shuffled ID column of a table
+class Shuffled_ID_Source:
+      """
+      Indexable, lazily computed shuffle of the IDs start_id .. start_id + num_records - 1.
+      The i-th ID is computed directly from a Feistel_ID_Source, so no ID list is built or shuffled up front
+      and chunks of the table only compute their own slice.
+      """
+      def __init__(self, num_records, start_id = 1000, rng = None):
+            """
+            Initialize the Shuffled_ID_Source object.
+            :param num_records: Number of IDs (rows of the table).
+            :param start_id: Smallest ID (default 1000).
+            :param rng: Optional numpy.random.Generator the permutation key is drawn from (default module generator).
+            """
+            if num_records < 0:
+                  raise ValueError(f"num_records value of {num_records} must be 0 or greater")
+            self.num_records = int(num_records)
+            self.start_id = int(start_id)
+            self.id_source = Feistel_ID_Source(self.start_id, self.start_id + max(self.num_records, 1) - 1, rng)
+
+      def __len__(self):
+            return self.num_records
+
+      def __getitem__(self, index):
+            if isinstance(index, slice):
+                  start, stop, step = index.indices(self.num_records)
+                  if step != 1:
+                        return self.id_source.ids(0, self.num_records)[index] if self.num_records else np.empty(0, dtype=np.int64)
+                  return self.id_source.ids(start, max(stop - start, 0))
+            if index < 0:
+                  index += self.num_records
+            if not 0 <= index < self.num_records:
+                  raise IndexError(f"ID index {index} is out of range for {self.num_records} IDs")
+            return int(self.id_source.ids(index, 1)[0])
+
+      def __array__(self, dtype = None, copy = None):
+            ids = self.to_numpy()
+            return ids if dtype is None else ids.astype(dtype)
+
+      def to_numpy(self):
+            """
+            Compute every ID of the source.
+            :return: NumPy int64 array of the shuffled IDs.
+            """
+            return self[0:self.num_records]
 
 # Generate a DataFrame with unique and random ID Column
-def table_generate_unique_id_records(num_records, start_id=1000):
+def table_generate_unique_id_records(num_records, start_id=1000, rng=None):
     """
-    Generate a dictionary with a key 'ID_Record' containing a list of unique, shuffled integers.
+    Generate a dictionary with a key 'ID_Record' holding a lazy shuffle of unique integers.
     
     The integers start from `start_id` and increase sequentially to create the specified number of records.
+    The IDs are only computed when a table generator (or a chunk of it) needs them.
     
     :param num_records: Number of unique records to generate.
     :param start_id: The starting ID value for the sequence of integers (default is 1000).
-    :return: Dictionary with a key 'ID_Record' and a value being a list of unique, shuffled integers.
+    :param rng: Optional numpy.random.Generator (default module generator).
+    :return: Dictionary with a key 'ID_Record' and a value being a Shuffled_ID_Source of unique integers.
     """
-    id_list = [id for id in range(start_id, start_id + num_records)]
-    random.shuffle(id_list)
-    return {'ID_Record': id_list}
+    return {'ID_Record': Shuffled_ID_Source(num_records, start_id, rng)}
+
+# Resolve the ID column of a table dictionary
+def resolve_id_records(dict, id_field_name = 'ID_Record'):
+      """
+      Replace a lazy Shuffled_ID_Source ID column by its IDs, so the dictionary can become a DataFrame.
+      :param dict: Table dictionary holding the ID column.
+      :param id_field_name: Name of the ID column (default 'ID_Record').
+      :return: Number of records of the table.
+      """
+      if isinstance(dict[id_field_name], Shuffled_ID_Source):
+            dict[id_field_name] = dict[id_field_name].to_numpy()
+      return len(dict[id_field_name])
 
 # Random Integer Generator
-def generate_random_int(min, max):
+def generate_random_int(min, max, rng = None):
       """
       Generate a random integer within a specified range.
       :param min: Minimum value for the random integer.
       :param max: Maximum value for the random integer.
+      :param rng: Optional numpy.random.Generator (default module generator).
       :return: A random integer within the specified range.
       """
-      return random.randint(min, max)
+      return int(generate_random_int_array(1, min, max, rng)[0])
 
 # Random Letter Generator
 def generate_random_letter(num_letters):
@@ -66,7 +828,7 @@ def generate_random_letter(num_letters):
       :param num_letters: Number of letters to generate.
       :return: A string of random uppercase letters.
       """
-      return ''.join(random.choice(string.ascii_uppercase) for _ in range(num_letters))
+      return str(generate_random_letter_array(1, num_letters)[0])
 
 # Random Weighted Generator
 def generate_random_weighted_string_list(string_list, weight_list):
@@ -76,7 +838,7 @@ def generate_random_weighted_string_list(string_list, weight_list):
       :param weight_list: Corresponding weights for each string in the string_list.
       :return: A randomly chosen string based on the specified weights.
       """
-      return random.choices(string_list,weights = weight_list, k=1)[0]
+      return string_list[int(generate_random_weighted_index_array(1, weight_list)[0])]
 
 # Function to convert date into datetime format
 def function_date_int_to_datetime(date):
@@ -111,11 +873,12 @@ def function_date_int_to_datetime(date):
             raise Exception(f'{date} cannot be converted to datetime')
       
 # Function to generate random date
-def generate_date(min_date, max_date):
+def generate_date(min_date, max_date, rng = None):
       """
       Generate a random date within a specified date range.
       :param min_date: Minimum date in the range.
       :param max_date: Maximum date in the range.
+      :param rng: Optional numpy.random.Generator (default module generator).
       :return: A random date within the specified range.
       :raises Exception: If min_date or max_date is not a datetime object.
       """
@@ -123,10 +886,7 @@ def generate_date(min_date, max_date):
             raise Exception("min_date is not in the format of datetime objects")
       if not isinstance(max_date, datetime):
             raise Exception("min_date is not in the format of datetime objects")
-      date_range = max_date - min_date
-      random_days = random.randint(0, date_range.days)
-      random_date = min_date + timedelta(days=random_days)
-      return random_date
+      return pd.Timestamp(generate_date_array(1, min_date, max_date, rng)[0]).to_pydatetime()
 
 # Function to generate a full name
 def generate_full_name(first_name_list, last_name_list):
@@ -136,9 +896,8 @@ def generate_full_name(first_name_list, last_name_list):
       :param last_name_list: List of possible last names.
       :return: A randomly generated full name.
       """
-      first_name = random.choice(first_name_list)
-      last_name = random.choice(last_name_list)
-      return f"{first_name} {last_name}"
+      return str(join_string_arrays([generate_random_choice_array(1, first_name_list), \
+                                     generate_random_choice_array(1, last_name_list)], " ")[0])
 
 # Function to generate a random fake phone number
 # (to ensure avoidance of pulling a real number, 
@@ -148,15 +907,15 @@ def generate_phone_number():
       Generate a fake phone number with all digits being the same random digit.
       :return: A string representing a fake phone number.
       """
-      digit = str(random.randint(1,9))
-      return digit*10
+      return str(generate_phone_number_array(1)[0])
 
-def random_date(start_date, end_date=date.today()):
+def random_date(start_date, end_date=default_reference_date.date(), rng = None):
       """
       Generates a random date between start_date and end_date.
 
       :param start_date: The start date as a datetime.date object.
       :param end_date: The end date as a datetime.date object.
+      :param rng: Optional numpy.random.Generator (default module generator).
       :return: A random date between start_date and end_date.
       """
       if isinstance(start_date, datetime):
@@ -168,7 +927,7 @@ def random_date(start_date, end_date=date.today()):
             
       time_between_dates = end_date - start_date
       days_between_dates = time_between_dates.days
-      random_number_of_days = random.randrange(days_between_dates)
+      random_number_of_days = generate_random_int(0, days_between_dates - 1, rng)
       return start_date + timedelta(days=random_number_of_days)
 
 # Priorization function part A: for weighted function support giving one element priority
@@ -191,9 +950,8 @@ def generate_random_unique_weighted_list(random_list, priority_item, weight_pri
       :param weight_oth: Weight for other items in the list (default 1).
       :return: A randomly chosen item from the list, with priority given to the priority item.
       """
-      weight_list = []
       weight_list = [weight_pri if item == priority_item else weight_oth for item in random_list]
-      return random.choices(random_list, weights=weight_list, k=1)[0]
+      return generate_random_weighted_string_list(random_list, weight_list)
 
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
@@ -207,19 +965,15 @@ def generate_log_ip_address():
     Generate a random IP address.
     :return: A string representing a random IP address.
     """
-    random_ip = ".".join(str(random.randint(0, 255)) for _ in range(4))
-    return random_ip
+    return str(generate_log_ip_address_array(1)[0])
 
-def generate_log_hostname():
+def generate_log_hostname(rng = None):
     """
     Generate a random hostname.
+    :param rng: Optional numpy.random.Generator (default module generator).
     :return: A string representing a random hostname.
     """
-    chars = string.ascii_lowercase + string.digits
-    length = random.randint(7, 15)
-    hostname = ''.join(random.choice(chars) for _ in range(length))
-    hostname += '.com'
-    return hostname
+    return str(generate_log_hostname_array(1, rng)[0])
 
 # ---------------------------------------------------------------------------------------------------------
 # ---------------------------------------------------------------------------------------------------------
@@ -236,13 +990,7 @@ def generate_legal_firm_name(surnames, legal_terms):
     :param legal_terms: List of possible legal terms.
     :return: A string representing a legal firm name.
     """
-    surname1 = random.choice(surnames)
-    surname2 = random.choice(surnames)
-    legal_term = random.choice(legal_terms)
-    # Ensure that the two surnames are not the same
-    while surname1 == surname2:
-        surname2 = random.choice(surnames)
-    return f"{surname1} & {surname2} {legal_term}"
+    return str(generate_legal_firm_name_array(1, surnames, legal_terms)[0])
 
 
 
@@ -253,6 +1001,5 @@ def generate_legal_type_and_def(dict_leg_type):
       :param dict_leg_type: Dictionary of legal types and their definitions.
       :return: A tuple containing a random legal type and its definition.
       """
-      type = random.choice(list(dict_leg_type))
-      type_def = dict_leg_type[type]
-      return type, type_def
+      type_array, type_def_array = generate_dict_key_and_value_array(1, dict_leg_type)
+      return str(type_array[0]), str(type_def_array[0])
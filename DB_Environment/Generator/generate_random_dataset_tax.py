@@ -1,5 +1,5 @@
 import pandas as pd
-import random
+import numpy as np
 from datetime import datetime, timedelta
 import generate_random_dataset_support_functions as gtsf
 
@@ -88,14 +88,15 @@ list_debit_and_credit = ['Debit','Credit']
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
 # Generate the Tax Account field
-def generate_tax_account_field(num_records, len_id_char = 8):
+def generate_tax_account_field(num_records, len_id_char = 8, rng = None, id_offset = 0):
       """
       Generate a list of tax account numbers with a specified character length.
       :param num_records: Number of account numbers to generate.
       :param len_id_char: Length of each account number in characters (default is 8).
-      :return: List of tax account numbers.
+      :param rng: Optional numpy.random.Generator the ID permutation key is drawn from (default module generator).
+      :param id_offset: Position of the first ID in the permutation, for chunks of a table (default 0).
+      :return: Array of tax account numbers.
       """
-      dict_list = []
       if type(len_id_char) == str:
             if len_id_char.isdigit():
                   zeros_req = int(len_id_char)-1
@@ -104,36 +105,29 @@ def generate_tax_account_field(num_records, len_id_char = 8):
       else:
             zeros_req = len_id_char - 1
             
-      zeros = "0" * zeros_req
-      min = int("1"+zeros)
-      max = int("9"*len_id_char) 
-      for _ in range(num_records):
-            dict_list.append(random.randint(min, max))
-      return dict_list
+      return gtsf.generate_unique_id_array(num_records, zeros_req + 1, rng, id_offset)
 
 # Generate the Tax Security ID field
-def generate_tax_sec_id_field(num_records, min = 100000, max = 9999999):
+def generate_tax_sec_id_field(num_records, min = 100000, max = 9999999, rng = None):
       """
       Generate a list of security IDs for tax purposes.
       :param num_records: Number of security IDs to generate.
       :param min: Minimum value for security ID.
       :param max: Maximum value for security ID.
-      :return: List of security IDs.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of security IDs.
       """
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_random_int(min, max))
-      return dict_list
+      return gtsf.generate_random_int_array(num_records, min, max, rng)
 
 # Generate the Tax CUSIP field
-def generate_tax_cusip_field(num_records, len_id_char = 7):
+def generate_tax_cusip_field(num_records, len_id_char = 7, rng = None):
       """
       Generate a list of CUSIP (Committee on Uniform Securities Identification Procedures) numbers.
       :param num_records: Number of CUSIP numbers to generate.
       :param len_id_char: Length of each CUSIP number in characters (default is 7).
-      :return: List of CUSIP numbers.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of CUSIP numbers.
       """
-      dict_list = []
       if type(len_id_char) == str:
             if len_id_char.isdigit():
                   zeros_req = int(len_id_char)-1
@@ -145,89 +139,74 @@ def generate_tax_cusip_field(num_records, len_id_char = 7):
       zeros = "0" * zeros_req
       min = int("1"+zeros)
       max = int("9"*len_id_char) 
-      for _ in range(num_records):
-            dict_list.append(random.randint(min, max))
-      return dict_list
+      return gtsf.generate_random_int_array(num_records, min, max, rng)
 
 # Generate the Tax Entry CD field
-def generate_tax_entrycd_field(num_records):
+def generate_tax_entrycd_field(num_records, rng = None):
       """
       Generate a list of entry codes for tax transactions.
       :param num_records: Number of entry codes to generate.
-      :return: List of entry codes.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of entry codes.
       """
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(random.choice(list_entrycd))
-      return dict_list
+      return gtsf.generate_random_choice_array(num_records, list_entrycd, rng)
 
 # Generate the Tax Currency field
-def generate_tax_currency_field(num_records, priority_item = 'USD', weight_usd = 10, weight_oth = 1):
+def generate_tax_currency_field(num_records, priority_item = 'USD', weight_usd = 10, weight_oth = 1, rng = None):
       """
       Generate a list of currencies with weighted preference for a specific currency.
       :param num_records: Number of currencies to generate.
       :param priority_item: Currency to prioritize (default 'USD').
       :param weight_usd: Weight for the prioritized currency (default 10).
       :param weight_oth: Weight for other currencies (default 1).
-      :return: List of currencies.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of currencies.
       """
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_random_unique_weighted_list(list_cur, priority_item, weight_usd, weight_oth))
-      return dict_list
+      return gtsf.generate_random_unique_weighted_array(num_records, list_cur, priority_item, weight_usd, weight_oth, rng)
 
 # Generate the Tax Net Amount field
-def generate_tax_net_amount_field(num_records, min = 1, max = 99999):
+def generate_tax_net_amount_field(num_records, min = 1, max = 99999, rng = None):
       """
       Generate a list of net amounts for tax transactions.
       :param num_records: Number of net amounts to generate.
       :param min: Minimum value for net amount.
       :param max: Maximum value for net amount.
-      :return: List of net amounts.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of net amounts.
       """
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_random_int(min, max))
-      return dict_list
+      return gtsf.generate_random_int_array(num_records, min, max, rng)
 
 # Generate the Tax Withholding Amount field
-def generate_tax_withholding_amount_field(num_records, min = 1, max = 9999):
+def generate_tax_withholding_amount_field(num_records, min = 1, max = 9999, rng = None):
       """
       Generate a list of withholding amounts for tax transactions.
       :param num_records: Number of withholding amounts to generate.
       :param min: Minimum value for withholding amount.
       :param max: Maximum value for withholding amount.
-      :return: List of withholding amounts.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of withholding amounts.
       """
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_random_int(min, max))
-      return dict_list
+      return gtsf.generate_random_int_array(num_records, min, max, rng)
 
 # Generate the Tax Debit and Credit field
-def generate_tax_debit_and_credit_field(num_records):
+def generate_tax_debit_and_credit_field(num_records, rng = None):
       """
       Generate a list of debit and credit statuses for tax transactions.
       :param num_records: Number of statuses to generate.
-      :return: List of debit and credit statuses.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Array of debit and credit statuses.
       """
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(random.choice(list_debit_and_credit))
-      return dict_list
+      return gtsf.generate_random_choice_array(num_records, list_debit_and_credit, rng)
 
 # Generate the Tax Type field
-def generate_tax_type_field(num_records):
+def generate_tax_type_field(num_records, rng = None):
       """
       Generate a list of tax types.
       :param num_records: Number of tax types to generate.
-      :return: List of tax types.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: Categorical of tax types.
       """
-      dict_list = []
-      tax_types = list(dict_tax_types.keys())
-      for _ in range(num_records):
-            dict_list.append(random.choice(tax_types))
-      return dict_list
+      return gtsf.generate_random_categorical_array(num_records, list(dict_tax_types.keys()), rng=rng)
 
 # Generate the Tax Type Description field
 def generate_tax_type_desc_field(num_records, tax_type_list):
@@ -235,28 +214,23 @@ def generate_tax_type_desc_field(num_records, tax_type_list):
       Generate descriptions for the given tax types.
       :param num_records: Number of descriptions to generate.
       :param tax_type_list: List of tax types.
-      :return: List of tax type descriptions.
+      :return: Array of tax type descriptions.
       """
-      dict_list = []
-      for x in range(num_records):
-            dict_list.append(dict_tax_types[tax_type_list[x]])
-      return dict_list
+      return pd.Series(np.asarray(tax_type_list[:num_records])).map(dict_tax_types).to_numpy()
 
 # Generate the Tax Transaction Date field
-def generate_tax_trans_date_field(num_records, min_date = datetime(2010,1,1), max_date = datetime.now()):
+def generate_tax_trans_date_field(num_records, min_date = datetime(2010,1,1), max_date = gtsf.default_reference_date, rng = None):
       """
-      Generate a list of transaction dates for tax purposes within a specified range.
+      Generate an array of transaction dates for tax purposes within a specified range.
       :param num_records: Number of transaction dates to generate.
       :param min_date: Minimum date for the range.
       :param max_date: Maximum date for the range.
-      :return: List of transaction dates.
+      :param rng: Optional numpy.random.Generator (default module generator).
+      :return: datetime64 array of transaction dates.
       """
       min_date = gtsf.function_date_int_to_datetime(min_date)
       max_date = gtsf.function_date_int_to_datetime(max_date)
-      dict_list = []
-      for _ in range(num_records):
-            dict_list.append(gtsf.generate_date(min_date, max_date))
-      return dict_list
+      return gtsf.generate_date_array(num_records, min_date, max_date, rng)
 
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
@@ -265,26 +239,29 @@ def generate_tax_trans_date_field(num_records, min_date = datetime(2010,1,1), ma
 #----------------------------------------------------------------------------------
 
 # Function to run each field to build the tax table
-def generate_table_tax_general(dict, id_field_name = 'ID_Record'):  
+def generate_table_tax_general(dict, id_field_name = 'ID_Record', rng_context = None, total_records = None):  
       """
       Populate a dictionary with various tax-related data fields to build a tax table.
       :param dict: Dictionary to populate with tax data.
       :param num_records: Number of records to generate for each field.
+      :param rng_context: Optional RNG_Context (or master seed) the table's column streams are derived from.
+      :param total_records: Rows of the whole table when dict holds one chunk of it (default the rows in dict).
       :return: Dictionary populated with tax data fields.
       """
-      num_records = len(dict[id_field_name])
-      dict['Tax Account'] = generate_tax_account_field(num_records)
-      dict['Sec ID'] = generate_tax_sec_id_field(num_records)
-      dict['CUSIP'] = generate_tax_cusip_field(num_records)
-      dict['Entry CD'] = generate_tax_entrycd_field(num_records)
-      dict['Currency'] = generate_tax_currency_field(num_records)
-      dict['Net Amount'] = generate_tax_net_amount_field(num_records)
-      dict['Withholding Amount'] = generate_tax_withholding_amount_field(num_records)
-      dict['Credit and Debit'] = generate_tax_debit_and_credit_field(num_records)
-      dict['Tax Type'] = generate_tax_type_field(num_records)
+      num_records = gtsf.resolve_id_records(dict, id_field_name)
+      rng_context = gtsf.get_rng_context(rng_context).table('tax_general')
+      dict['Tax Account'] = generate_tax_account_field(num_records, gtsf.unique_id_width(8, num_records if total_records is None else total_records), rng=rng_context.table_column('Tax Account'), id_offset=rng_context.record_offset)
+      dict['Sec ID'] = generate_tax_sec_id_field(num_records, rng=rng_context.column('Sec ID'))
+      dict['CUSIP'] = generate_tax_cusip_field(num_records, rng=rng_context.column('CUSIP'))
+      dict['Entry CD'] = generate_tax_entrycd_field(num_records, rng=rng_context.column('Entry CD'))
+      dict['Currency'] = generate_tax_currency_field(num_records, rng=rng_context.column('Currency'))
+      dict['Net Amount'] = generate_tax_net_amount_field(num_records, rng=rng_context.column('Net Amount'))
+      dict['Withholding Amount'] = generate_tax_withholding_amount_field(num_records, rng=rng_context.column('Withholding Amount'))
+      dict['Credit and Debit'] = generate_tax_debit_and_credit_field(num_records, rng=rng_context.column('Credit and Debit'))
+      dict['Tax Type'] = generate_tax_type_field(num_records, rng=rng_context.column('Tax Type'))
       dict['Tax Type Definition'] = generate_tax_type_desc_field(num_records, dict['Tax Type'])
       # - - - Date Format: YYYYMMDD - - -
-      dict['Transaction Date'] = generate_tax_trans_date_field(num_records)
+      dict['Transaction Date'] = generate_tax_trans_date_field(num_records, max_date=rng_context.reference_date, rng=rng_context.column('Transaction Date'))
       # - - - - - - - - - - - - - - - - -
       return dict
 
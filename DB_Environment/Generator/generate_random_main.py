@@ -1,3 +1,7 @@
+import argparse
+import os
+from datetime import datetime
+import numpy as np
 import pandas as pd
 import generate_random_dataset_support_functions as grdfs
 import generate_random_dataset_business as grdb
@@ -8,7 +12,10 @@ import generate_random_dataset_tax as grdt
 import generate_random_dataset_financial as grdf
 import generate_random_dataset_log as grdlo
 import generate_random_data_relationship as grdr
-import generate_random_data_analysis_conditions as grdac
+import generate_random_scheduler as grdsch
+import generate_random_archive_writer as grdaw
+import generate_random_corruption_plan as grdcp
+import generate_random_corruption_manifest as grdcm
 
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
@@ -16,49 +23,153 @@ import generate_random_data_analysis_conditions as grdac
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
 
-def generate_table_basic(min_rand_record_lim=1, max_rand_record_lim=100000, exact_num=0, start_id = 1000):
+def generate_table_basic(min_rand_record_lim=1, max_rand_record_lim=100000, exact_num=0, start_id = 1000, rng_context = None):
+      rng_context = grdfs.get_rng_context(rng_context)
       if exact_num == 0:
-            num_records = grdfs.generate_random_record_length(min_rand_record_lim, max_rand_record_lim)
+            num_records = int(rng_context.column('Record Length').integers(min_rand_record_lim, max_rand_record_lim, endpoint=True))
       else:
             num_records = exact_num
-      
-      return grdfs.table_generate_unique_id_records(num_records, start_id) 
 
-
-# Max and Min random selection for id record generator to be used as a uniform value
-uniform_max = 100
-uniform_min = 100
-uniform_exact = 100
-
-# Business Table Fields
-bus_fields = {
-      
+      return grdfs.table_generate_unique_id_records(num_records, start_id, rng=rng_context.column('ID_Record'))
+
+
+# Default master seed every table, column and data alteration stream is derived from
+default_master_seed = 20240101
+
+# Default scale factor: at 1.0 every root table has its base_rows, and child tables follow their parent by ratio
+default_scale_factor = 0.1
+
+# Default output folder, next to the Generator folder
+default_output_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Data_Archive")
+
+# Table registry: generator function, row sizing and output file name of every table
+#   base_rows: rows at scale factor 1.0 for a root table
+#   parent/ratio: a child table has ratio rows per row of its parent table
+#   chunk_total_records: the generator takes total_records, since a column depends on the size of the whole table
+table_registry = {
+      'business':                 {'generator': grdb.generate_table_business_general,            'base_rows': 1000, 'parent': None,       'ratio': None, 'file_name': "business data", 'chunk_total_records': True},
+      'legal':                    {'generator': grdle.generate_table_legal_general,              'base_rows': None, 'parent': 'business', 'ratio': 1.0,  'file_name': "legal data", 'chunk_total_records': True},
+      'address':                  {'generator': grda.generate_table_address_general,             'base_rows': None, 'parent': 'legal',    'ratio': 1.0,  'file_name': "address data", 'chunk_total_records': True},
+      'tax':                      {'generator': grdt.generate_table_tax_general,                 'base_rows': None, 'parent': 'legal',    'ratio': 1.0,  'file_name': "tax data", 'chunk_total_records': True},
+      'finance':                  {'generator': grdf.generate_table_finance_general,             'base_rows': None, 'parent': 'tax',      'ratio': 1.0,  'file_name': "finance data"},
+      'employee':                 {'generator': grde.generate_table_employee_general,            'base_rows': 1000, 'parent': None,       'ratio': None, 'file_name': "employee data"},
+      'log_general':              {'generator': grdlo.generate_table_log_general,                'base_rows': 1000, 'parent': None,       'ratio': None, 'file_name': "Log General Information", 'chunk_total_records': True},
+      'log_datachange':           {'generator': grdlo.generate_table_log_datachange,             'base_rows': 1000, 'parent': None,       'ratio': None, 'file_name': "Log Datachanges", 'chunk_total_records': True},
+      'log_filechange':           {'generator': grdlo.generate_table_log_filechange,             'base_rows': 1000, 'parent': None,       'ratio': None, 'file_name': "Log Filechanges", 'chunk_total_records': True},
+      'log_security':             {'generator': grdlo.generate_table_log_security,               'base_rows': 1000, 'parent': None,       'ratio': None, 'file_name': "Log Security Details", 'chunk_total_records': True},
+      'log_user_web_activity':    {'generator': grdlo.generate_table_log_user_web_activity,      'base_rows': 1000, 'parent': None,       'ratio': None, 'file_name': "Log User Web Activity", 'chunk_total_records': True},
+      'log_user_server_activity': {'generator': grdlo.generate_table_log_user_server_activity,   'base_rows': 1000, 'parent': None,       'ratio': None, 'file_name': "Log User Server Activity", 'chunk_total_records': True},
+      'log_user_account_activity':{'generator': grdlo.generate_table_log_user_account_activity,  'base_rows': 1000, 'parent': None,       'ratio': None, 'file_name': "Log User Account Activity", 'chunk_total_records': True},
+      'log_errors':               {'generator': grdlo.generate_table_log_errors,                 'base_rows': 1000, 'parent': None,       'ratio': None, 'file_name': "Log Errors", 'chunk_total_records': True},
+      'log_error_codes':          {'generator': grdlo.generate_table_log_error_codes,            'base_rows': 1000, 'parent': None,       'ratio': None, 'file_name': "Log Error Codes", 'chunk_total_records': True},
 }
 
-# Legal Table Fields
-le_fields = {
-      
+# Intermediary tables: built from the key fields of the listed tables once they are linked, one row per row of the first table
+intermediary_registry = {
+      'employee_system':          {'tables': ('employee', 'legal'), 'key_fields': ('Employee ID', 'Legal Account'),       'file_name': "Employee System"},
 }
 
-# Address Table Fields
-addr_fields = {
-      
+# Corruption plan: realistic data alterations and data integrity error conditions of each table
+# Each operation lists the field, the type (grdcp.corruption_types), the percentage and any further method arguments
+# Operations on the same field run back to back in the listed order, so list an operation after those changing the fields it reads
+corruption_plan = {
+      'business': [
+            {'field': 'External ID',      'type': 'duplicates',               'perc': 35, 'dup_option_perc': 30},
+            {'field': 'Company Name',     'type': 'override',                 'perc': 12, 'value': ""},
+            {'field': 'Modified Date',    'type': 'override',                 'perc': 7,  'value': ""},
+            {'field': 'Closed Date',      'type': 'closed_date_misalignment', 'perc': 15, 'open_date_field': 'Creation Date', 'modified_date_field': 'Modified Date'},
+      ],
+      'legal': [
+            {'field': 'Legal Account',    'type': 'duplicates',               'perc': 25, 'dup_option_perc': 21},
+            {'field': 'Legal Firm',       'type': 'override',                 'perc': 16, 'value': ""},
+            {'field': 'LE Modified Date', 'type': 'override',                 'perc': 12, 'value': ""},
+            {'field': 'LE Closed Date',   'type': 'closed_date_misalignment', 'perc': 8,  'open_date_field': 'LE Creation Date'},
+            {'field': 'LE Closed Date',   'type': 'closed_date_misalignment', 'perc': 18, 'modified_date_field': 'LE Modified Date'},
+      ],
+      'address': [
+            {'field': 'Zip Code',         'type': 'override',                 'perc': 12, 'value': ""},
+            {'field': 'Address Street',   'type': 'abbreviation',             'perc': 22},
+            {'field': 'Original Country', 'type': 'value_change',             'perc': 11, 'target_value': 'RUS', 'change_value': 'GER'},
+            {'field': 'Original Country', 'type': 'not_target_change',        'perc': 15, 'not_target_record': 'RUS', 'change_record': 'RUS'},
+            {'field': 'Address Street',   'type': 'address_format',           'perc': 15},
+      ],
+      'employee': [
+            {'field': 'Employee Email',   'type': 'email_format',             'perc': 15},
+      ],
 }
 
-# Tax Table Fields
-tax_fields = {
-      
-}
+# Foreign key links: (parent table, parent key field, child table, Foreign_Keys keyword arguments, column placement)
+# Listed in the order they are applied, since a child can receive several keys
+# The keyword arguments can also set the 'distribution' of child records over parent keys, with its 'distribution_kwargs'
+#   e.g. {'distribution': 'zipf', 'distribution_kwargs': {'zipf_exponent': 1.3}} (default uniform)
+# or rules through 'conditions' (parent_filter, match_fields, date_rule of Foreign_Keys.add_foreignkey_conditions),
+#   e.g. only active legal entities created before the financial record (children without an eligible parent get a null key):
+#   {'foreign_key_abbreviation_post': " ID", 'conditions': {'parent_filter': {'Legal Status': ['ACTIVE']},
+#                                                          'date_rule': ('Financial Date', 'LE Creation Date')}}
+foreign_key_links = [
+      ('business', 'External ID',   'legal',   {'foreign_key_abbreviation_pre': "Bus "},  3),
+      ('business', 'External ID',   'address', {'foreign_key_abbreviation_pre': "Bus "},  3),
+      ('legal',    'Legal Account', 'address', {'foreign_key_abbreviation_post': " ID"},  4),
+      ('legal',    'Legal Account', 'tax',     {'foreign_key_abbreviation_post': " ID"},  3),
+      ('legal',    'Legal Account', 'finance', {'foreign_key_abbreviation_post': " ID"},  3),
+      ('tax',      'Tax Account',   'finance', {'foreign_key_abbreviation_post': " ID"},  3),
+]
+
+
+def resolve_table_rows(scale_factor = default_scale_factor, table_rows = None):
+      """
+      Work out the number of rows of every registered table.
+      :param scale_factor: Multiplier applied to the base_rows of every root table.
+      :param table_rows: Optional dictionary of table name -> exact row count; child tables of an
+                         overridden table keep their row ratio to it unless they are overridden too.
+      :return: Dictionary of table name -> number of rows.
+      """
+      table_rows = table_rows or {}
+      for table_name in table_rows:
+            if table_name not in table_registry:
+                  raise ValueError(f"{table_name} is not a registered table")
+      if scale_factor <= 0:
+            raise ValueError(f"scale_factor value of {scale_factor} must be greater than 0")
+
+      resolved_rows = {}
+      def resolve(table_name):
+            if table_name not in resolved_rows:
+                  table_spec = table_registry[table_name]
+                  if table_name in table_rows:
+                        resolved_rows[table_name] = int(table_rows[table_name])
+                  elif table_spec['parent'] is None:
+                        resolved_rows[table_name] = max(1, round(table_spec['base_rows'] * scale_factor))
+                  else:
+                        resolved_rows[table_name] = max(1, round(resolve(table_spec['parent']) * table_spec['ratio']))
+            return resolved_rows[table_name]
+      for table_name in table_registry:
+            resolve(table_name)
+      return resolved_rows
+
+
+def resolve_required_tables(output_tables = None):
+      """
+      Work out which tables have to be generated to write the requested output tables: every foreign key
+      parent of a requested table, and every table an intermediary table is built from, is generated too.
+      :param output_tables: Table or intermediary names to write (default None writes everything).
+      :return: Two lists, the tables to generate and the intermediary tables to build.
+      """
+      if not output_tables:
+            return list(table_registry), list(intermediary_registry)
+      for table_name in output_tables:
+            if table_name not in table_registry and table_name not in intermediary_registry:
+                  raise ValueError(f"{table_name} is not a registered table")
+
+      required_tables = set(table_name for table_name in output_tables if table_name in table_registry)
+      intermediary_tables = [table_name for table_name in intermediary_registry if table_name in output_tables]
+      for table_name in intermediary_tables:
+            required_tables.update(intermediary_registry[table_name]['tables'])
+      # Foreign key parents of the required tables are required as well (parents are linked before their children)
+      for parent_name, _, child_name, _, _ in reversed(foreign_key_links):
+            if child_name in required_tables:
+                  required_tables.add(parent_name)
+      return [table_name for table_name in table_registry if table_name in required_tables], intermediary_tables
 
-# Finance_fields Table Fields
-finance_fields = {
-      
-}
-
-# Employee Table Fields
-emp_fields = {
-      
-}
 
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
@@ -66,49 +177,17 @@ emp_fields = {
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
 
-# Random Business Table
-id_dict_copy = generate_table_basic(uniform_min, uniform_max)
-bus_df = pd.DataFrame(grdb.generate_table_business_general(id_dict_copy))
-
-# Random Legal Table
-id_dict_copy = generate_table_basic(uniform_min, uniform_max)
-le_df = pd.DataFrame(grdle.generate_table_legal_general(id_dict_copy))
-
-# Random Address Table
-id_dict_copy = generate_table_basic(uniform_min, uniform_max)
-addr_df = pd.DataFrame(grda.generate_table_address_general(id_dict_copy))
-
-# Random Tax Table
-id_dict_copy = generate_table_basic(uniform_min, uniform_max)
-tax_df = pd.DataFrame(grdt.generate_table_tax_general(id_dict_copy))
-
-# Random Finance Table
-id_dict_copy = generate_table_basic(uniform_min, uniform_max)
-finance_df = pd.DataFrame(grdf.generate_table_finance_general(id_dict_copy))
-
-# Random Employee Table
-id_dict_copy = generate_table_basic(uniform_min, uniform_max)
-emp_df = pd.DataFrame(grde.generate_table_employee_general(id_dict_copy))
-
-# Random Log Table
-id_dict_copy = generate_table_basic(uniform_min, uniform_max)
-log_df_g = pd.DataFrame(grdlo.generate_table_log_general(id_dict_copy))
-id_dict_copy = generate_table_basic(uniform_min, uniform_max)
-log_df_dc = pd.DataFrame(grdlo.generate_table_log_datachange(id_dict_copy))
-id_dict_copy = generate_table_basic(uniform_min, uniform_max)
-log_df_fc = pd.DataFrame(grdlo.generate_table_log_filechange(id_dict_copy))
-id_dict_copy = generate_table_basic(uniform_min, uniform_max)
-log_df_sec = pd.DataFrame(grdlo.generate_table_log_security(id_dict_copy))
-id_dict_copy = generate_table_basic(uniform_min, uniform_max)
-log_df_wa = pd.DataFrame(grdlo.generate_table_log_user_web_activity(id_dict_copy))
-id_dict_copy = generate_table_basic(uniform_min, uniform_max)
-log_df_sa = pd.DataFrame(grdlo.generate_table_log_user_server_activity(id_dict_copy))
-id_dict_copy = generate_table_basic(uniform_min, uniform_max)
-log_df_ac = pd.DataFrame(grdlo.generate_table_log_user_account_activity(id_dict_copy))
-id_dict_copy = generate_table_basic(uniform_min, uniform_max)
-log_df_le = pd.DataFrame(grdlo.generate_table_log_errors(id_dict_copy))
-id_dict_copy = generate_table_basic(uniform_min, uniform_max)
-log_df_ec = pd.DataFrame(grdlo.generate_table_log_error_codes(id_dict_copy))
+def generate_table(table_name, num_records, rng_context):
+      """
+      Generate one registered table.
+      :param table_name: Name of the table in the table_registry.
+      :param num_records: Number of rows to generate.
+      :param rng_context: RNG_Context (or master seed) of the run.
+      :return: DataFrame of the table.
+      """
+      rng_context = grdfs.get_rng_context(rng_context)
+      id_dict_copy = generate_table_basic(exact_num=num_records, rng_context=rng_context.table(table_name))
+      return pd.DataFrame(table_registry[table_name]['generator'](id_dict_copy, rng_context=rng_context))
 
 
 #----------------------------------------------------------------------------------
@@ -117,118 +196,361 @@ log_df_ec = pd.DataFrame(grdlo.generate_table_log_error_codes(id_dict_copy))
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
 
-# Establishing the Business DB link by inserting its ID into other DBs
-df_foreignkey_bus = grdr.Foreign_Keys(bus_df, db_fk_field_name='External ID', foreign_key_abbreviation_pre="Bus ")
-le_df = df_foreignkey_bus.add_foreignkey_random(le_df,col_placement=3)
-addr_df = df_foreignkey_bus.add_foreignkey_random(addr_df,col_placement=3)
-
-# Establishing the Legal DB link by inserting its ID into other DBs
-df_foreignkey_le = grdr.Foreign_Keys(le_df, db_fk_field_name='Legal Account', foreign_key_abbreviation_post=" ID")
-addr_df = df_foreignkey_le.add_foreignkey_random(addr_df,col_placement=4)
-tax_df = df_foreignkey_le.add_foreignkey_random(tax_df, col_placement=3)
-finance_df = df_foreignkey_le.add_foreignkey_random(finance_df, col_placement=3)
-
-# Establishing the Tax DB link by inserting its ID into other DBs
-df_foreignkey_tax = grdr.Foreign_Keys(tax_df, db_fk_field_name='Tax Account', foreign_key_abbreviation_post=" ID")
-finance_df = df_foreignkey_tax.add_foreignkey_random(finance_df, col_placement=3)
+def link_foreign_key(parent_df, parent_key, child_name, child_df, fk_kwargs, col_placement, rng_context):
+      """
+      Insert the key of a parent table into a child table.
+      :param parent_df: DataFrame of the parent table.
+      :param parent_key: Key field of the parent table.
+      :param child_name: Name of the child table (scopes the random stream of the link).
+      :param child_df: DataFrame of the child table.
+      :param fk_kwargs: Keyword arguments for Foreign_Keys (abbreviations) and the optional distribution settings.
+      :param col_placement: Column position of the new key in the child table.
+      :param rng_context: RNG_Context of the run.
+      :return: Child DataFrame with the foreign key inserted.
+      """
+      fk_kwargs = dict(fk_kwargs)
+      distribution = fk_kwargs.pop('distribution', 'uniform')
+      distribution_kwargs = fk_kwargs.pop('distribution_kwargs', {})
+      conditions = fk_kwargs.pop('conditions', None)
+      df_foreignkey = grdr.Foreign_Keys(parent_df, db_fk_field_name=parent_key, rng_context=rng_context.table(child_name), **fk_kwargs)
+      if conditions:
+            return df_foreignkey.add_foreignkey_conditions(child_df, col_placement=col_placement, **conditions)
+      return df_foreignkey.add_foreignkey_random(child_df, col_placement=col_placement, distribution=distribution, **distribution_kwargs)
+
+def foreign_key_parent_fields(parent_key, fk_kwargs):
+      """
+      List the parent fields a foreign key link reads: the key and the fields of its conditions.
+      :param parent_key: Key field of the parent table.
+      :param fk_kwargs: Keyword arguments of the link.
+      :return: List of parent field names.
+      """
+      conditions = fk_kwargs.get('conditions') or {}
+      parent_fields = [parent_key] + list(conditions.get('parent_filter') or {}) + list(conditions.get('match_fields') or {})
+      if conditions.get('date_rule'):
+            parent_fields.append(conditions['date_rule'][1])
+      return list(dict.fromkeys(parent_fields))
+
+def build_intermediary_table(table_name, tables, rng_context):
+      """
+      Build an intermediary relationship table from linked tables.
+      :param table_name: Name of the table in the intermediary_registry.
+      :param tables: Dictionary of table name -> DataFrame.
+      :param rng_context: RNG_Context of the run.
+      :return: DataFrame of the intermediary table.
+      """
+      if table_name == 'employee_system':
+            # Creating an intermediary Employee-Legal Table:
+            df_intermediary = grdr.Intermediary_Data(rng_context=rng_context.table(table_name))
+            return df_intermediary.create_2db_relationship_df_random(df1=tables['employee'], df1_id_field_name='Employee ID', \
+                                                                     df2=tables['legal'], df2_id_field_name='Legal Account')
+      raise ValueError(f"{table_name} is not a registered intermediary table")
 
-# Creating an intermediary Business-Legal Table:
-df_intermediary = grdr.Intermediary_Data()
-emp_interdb_df = df_intermediary.create_2db_relationship_df_random(df1=emp_df, df1_id_field_name='Employee ID', \
-                                                                   df2=le_df, df2_id_field_name='Legal Account')
 
-      
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
 #----------              Modidify Data for Realistic Attributes           ---------
+#----------              Create Data Integirty Error Conditions           ---------
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
 
-da_inserts_bus = grdac.Data_Analysis_Inserts(bus_df)
-bus_df = da_inserts_bus.create_duplicates_within_field_random('External ID', dup_option_perc=30, field_perc_to_dup=35)
-bus_df = da_inserts_bus.insert_value_by_override_perc('Company Name', field_perc_to_dup=12, value="")
-bus_df = da_inserts_bus.insert_value_by_override_perc('Modified Date', field_perc_to_dup=7, value="")
-da_changes_bus = grdac.Data_Analysis_Changes(bus_df)
-
-da_inserts_le = grdac.Data_Analysis_Inserts(le_df)
-le_df = da_inserts_le.create_duplicates_within_field_random('Legal Account', dup_option_perc=21, field_perc_to_dup=25)
-le_df = da_inserts_le.insert_value_by_override_perc('Legal Firm', field_perc_to_dup=16, value="")
-le_df = da_inserts_le.insert_value_by_override_perc('LE Modified Date', field_perc_to_dup=12, value="")
-da_changes_le = grdac.Data_Analysis_Changes(le_df)
-
-da_inserts_addr = grdac.Data_Analysis_Inserts(addr_df)
-addr_df = da_inserts_addr.insert_value_by_override_perc('Zip Code', field_perc_to_dup=12, value="")
-da_changes_addr = grdac.Data_Analysis_Changes(addr_df)
-addr_df = da_changes_addr.address_abbreviation_change('Address Street', field_perc_to_dup=22)
-addr_df = da_changes_addr.target_value_change_value('Original Country',field_perc_to_dup=11, target_value='RUS', change_value='GER')
-addr_df = da_changes_addr.not_target_record_change_record('Original Country',field_perc_to_dup=15, not_target_record='RUS', change_record='RUS')
-
-da_inserts_tax = grdac.Data_Analysis_Inserts(tax_df)
-da_changes_tax = grdac.Data_Analysis_Changes(tax_df)
-
-da_inserts_finance = grdac.Data_Analysis_Inserts(finance_df)
-da_changes_finance = grdac.Data_Analysis_Changes(finance_df)
-
-da_inserts_emp = grdac.Data_Analysis_Inserts(emp_df)
-da_changes_emp = grdac.Data_Analysis_Changes(emp_df)
+def finish_table(table_name, df, rng_context, manifest = None):
+      """
+      Apply the realistic data alterations and data integrity error conditions of a table, as listed in its corruption_plan.
+      :param table_name: Name of the table.
+      :param df: DataFrame of the (linked) table.
+      :param rng_context: RNG_Context of the run (a chunk context for a chunk of a streamed table).
+      :param manifest: Optional Corruption_Manifest the altered row positions are recorded in.
+      :return: Finished DataFrame.
+      """
+      return grdcp.Corruption_Plan(corruption_plan.get(table_name, [])).apply(df, rng_context.table(table_name), manifest)
+
+def new_table_manifest(table_name, archive_writer):
+      """
+      Create the corruption manifest of a table, when the table has a corruption plan and manifests are written.
+      :param table_name: Name of the table.
+      :param archive_writer: Archive_Writer of the run.
+      :return: Corruption_Manifest, or None.
+      """
+      if table_name in corruption_plan and archive_writer.write_manifests:
+            return grdcm.Corruption_Manifest(table_name)
+      return None
 
 
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
-#----------              Create Data Integirty Error Conditions           ---------
+#----------              Store Datasets                                   ---------
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
-da_errors_bus = grdac.Data_Analysis_Err_Conditions(bus_df)
-bus_df = da_errors_bus.closed_date_misalignment(closed_date_field='Closed Date', open_date_field='Creation Date', modified_date_field='Modified Date', apply_perc=15)
-
-da_errors_le = grdac.Data_Analysis_Err_Conditions(le_df)
-le_df = da_errors_le.closed_date_misalignment(open_date_field='LE Creation Date', closed_date_field='LE Closed Date', apply_perc= 8)
-le_df = da_errors_le.closed_date_misalignment(modified_date_field='LE Modified Date', closed_date_field='LE Closed Date', apply_perc= 18)
 
-da_errors_addr = grdac.Data_Analysis_Err_Conditions(addr_df)
-addr_df = da_errors_addr.address_incorrect_format('Address Street', apply_perc=15)
+def write_table(df, file_name, archive_writer):
+      """
+      Write a whole table to the Data_Archive.
+      :param df: DataFrame to write.
+      :param file_name: File name without extension.
+      :param archive_writer: Archive_Writer of the run.
+      :return: Path of the written file.
+      """
+      file_path = archive_writer.write(df, file_name)
+      archive_writer.close(file_name)
+      return file_path
+
+def finish_and_write_table(table_name, df, rng_context, file_name, archive_writer):
+      """
+      Apply the data alterations of a table and write it out with its corruption manifest (one pool step,
+      so the finished table never has to be sent back to the scheduling process).
+      :param table_name: Name of the table.
+      :param df: DataFrame of the (linked) table.
+      :param rng_context: RNG_Context of the run.
+      :param file_name: File name without extension.
+      :param archive_writer: Archive_Writer of the run.
+      :return: Path of the written file.
+      """
+      manifest = new_table_manifest(table_name, archive_writer)
+      file_path = write_table(finish_table(table_name, df, rng_context, manifest), file_name, archive_writer)
+      if manifest is not None:
+            archive_writer.write_manifest(manifest, file_name)
+      return file_path
 
-da_errors_tax = grdac.Data_Analysis_Err_Conditions(tax_df)
-
-da_errors_finance = grdac.Data_Analysis_Err_Conditions(finance_df)
-
-da_errors_emp = grdac.Data_Analysis_Err_Conditions(emp_df)
-emp_df = da_errors_emp.email_incorrect_format('Employee Email', apply_perc=15)
 
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
-#----------              Store Datasets                                   ---------
+#----------              Schedule the Table Dependency Graph              ---------
 #----------------------------------------------------------------------------------
 #----------------------------------------------------------------------------------
-pathway_output = "DB_Environment/Data_Archive/"
-# Random Business Table
-bus_df.to_csv(pathway_output + "business data.csv", index=False)
 
-# Random Legal Table
-le_df.to_csv(pathway_output + "legal data.csv", index=False)
+def build_schedule(table_rows, generate_tables, intermediary_tables, output_tables, rng_context, archive_writer, max_workers = None):
+      """
+      Build the dependency graph of a run: table generation and finishing/writing run in the process pool,
+      foreign key links and intermediary tables run in the scheduling process as soon as their inputs are ready.
+      :param table_rows: Dictionary of table name -> number of rows.
+      :param generate_tables: Tables to generate.
+      :param intermediary_tables: Intermediary tables to build.
+      :param output_tables: Tables and intermediary tables to write.
+      :param rng_context: RNG_Context of the run.
+      :param archive_writer: Archive_Writer of the run.
+      :param max_workers: Number of worker processes (default None uses every core, 0 runs in-process).
+      :return: Table_Scheduler whose 'store:<table>' steps return the written file paths.
+      """
+      scheduler = grdsch.Table_Scheduler(max_workers)
+      linked = {}
+      for table_name in generate_tables:
+            linked[table_name] = scheduler.add_step(f"generate:{table_name}", generate_table, (table_name, table_rows[table_name], rng_context))
+      # Each child table chains its foreign key links in registry order; a link starts once its parent is generated
+      parent_tables = {table_name: grdsch.Step_Result(f"generate:{table_name}") for table_name in generate_tables}
+      for link_num, (parent_name, parent_key, child_name, fk_kwargs, col_placement) in enumerate(foreign_key_links):
+            if parent_name in linked and child_name in linked:
+                  linked[child_name] = scheduler.add_step(f"link:{link_num}:{parent_name}->{child_name}", link_foreign_key, \
+                                                          (parent_tables[parent_name], parent_key, child_name, linked[child_name], fk_kwargs, col_placement, rng_context), \
+                                                          in_pool=False)
+      for table_name in intermediary_tables:
+            source_tables = {source_name: linked[source_name] for source_name in intermediary_registry[table_name]['tables']}
+            linked[table_name] = scheduler.add_step(f"intermediary:{table_name}", build_intermediary_table, (table_name, source_tables, rng_context), in_pool=False)
+      for table_name in output_tables:
+            if table_name in table_registry:
+                  scheduler.add_step(f"store:{table_name}", finish_and_write_table, \
+                                     (table_name, linked[table_name], rng_context, table_registry[table_name]['file_name'], archive_writer))
+            else:
+                  scheduler.add_step(f"store:{table_name}", write_table, (linked[table_name], intermediary_registry[table_name]['file_name'], archive_writer))
+      return scheduler
 
-# Random Address Table
-addr_df.to_csv(pathway_output + "address data.csv", index=False)
 
-# Random Employee Table
-emp_df.to_csv(pathway_output + "employee data.csv", index=False)
+#----------------------------------------------------------------------------------
+#----------------------------------------------------------------------------------
+#----------              Chunked Streaming Mode                           ---------
+#----------------------------------------------------------------------------------
+#----------------------------------------------------------------------------------
 
-# Random Tax Table
-tax_df.to_csv(pathway_output + "tax data.csv", index=False)
+def stream_table(table_name, num_records, chunk_size, rng_context, archive_writer, write_output, parent_keys, retain_fields):
+      """
+      Generate, link, finish and write a table one chunk at a time, so memory is bounded by the chunk size.
+      Foreign keys are drawn from the key columns of the parent tables, which are kept whole.
+      :param table_name: Name of the table in the table_registry.
+      :param num_records: Number of rows of the whole table.
+      :param chunk_size: Number of rows in each chunk.
+      :param rng_context: RNG_Context of the run.
+      :param archive_writer: Archive_Writer of the run.
+      :param write_output: Finish and write the chunks (False when the table is only generated for its keys).
+      :param parent_keys: Dictionary of parent table name -> dictionary of retained field -> array (keys and condition fields).
+      :param retain_fields: Key fields of this table to keep for child and intermediary tables.
+      :return: Dictionary of retained key field -> key array for the whole table.
+      """
+      table_spec = table_registry[table_name]
+      id_records = generate_table_basic(exact_num=num_records, rng_context=rng_context.table(table_name))
+      table_kwargs = {'total_records': num_records} if table_spec.get('chunk_total_records') else {}
+      table_chunks = grdfs.generate_table_chunks(table_spec['generator'], id_records, chunk_size, rng_context, **table_kwargs)
+      retained_keys = {field: [] for field in retain_fields}
+      manifest = new_table_manifest(table_name, archive_writer) if write_output else None
+      chunk_start = 0
+      for chunk_num, chunk_dict in enumerate(table_chunks):
+            chunk_context = rng_context.chunk(chunk_num, chunk_start)
+            chunk_df = pd.DataFrame(chunk_dict)
+            for parent_name, parent_key, child_name, fk_kwargs, col_placement in foreign_key_links:
+                  if child_name == table_name and parent_name in parent_keys:
+                        parent_df = pd.DataFrame({field: parent_keys[parent_name][field] for field in foreign_key_parent_fields(parent_key, fk_kwargs)})
+                        chunk_df = link_foreign_key(parent_df, parent_key, child_name, chunk_df, fk_kwargs, col_placement, chunk_context)
+            for field in retain_fields:
+                  retained_keys[field].append(chunk_df[field].to_numpy(copy=True))
+            if write_output:
+                  archive_writer.write(finish_table(table_name, chunk_df, chunk_context, manifest), table_spec['file_name'], append=chunk_num > 0)
+            chunk_start += len(chunk_df)
+      archive_writer.close(table_spec['file_name'])
+      if manifest is not None:
+            archive_writer.write_manifest(manifest, table_spec['file_name'])
+      return {field: np.concatenate(key_arrays) for field, key_arrays in retained_keys.items()}
+
+def write_intermediary_table(table_name, table_keys, rng_context, archive_writer):
+      """
+      Build an intermediary table from the retained key columns of its tables and write it.
+      :param table_name: Name of the table in the intermediary_registry.
+      :param table_keys: Dictionary of table name -> dictionary of key field -> key array.
+      :param rng_context: RNG_Context of the run.
+      :param archive_writer: Archive_Writer of the run.
+      :return: Path of the written file.
+      """
+      tables = {source_name: pd.DataFrame(key_arrays) for source_name, key_arrays in table_keys.items()}
+      return write_table(build_intermediary_table(table_name, tables, rng_context), intermediary_registry[table_name]['file_name'], archive_writer)
+
+def build_stream_schedule(table_rows, generate_tables, intermediary_tables, output_tables, rng_context, archive_writer, chunk_size, max_workers = None):
+      """
+      Build the dependency graph of a chunked run: each table streams in its own pool step once the key
+      columns of its foreign key parents are available, and intermediary tables are built from retained keys.
+      :param table_rows: Dictionary of table name -> number of rows.
+      :param generate_tables: Tables to generate.
+      :param intermediary_tables: Intermediary tables to build.
+      :param output_tables: Tables and intermediary tables to write.
+      :param rng_context: RNG_Context of the run.
+      :param archive_writer: Archive_Writer of the run.
+      :param chunk_size: Number of rows in each chunk.
+      :param max_workers: Number of worker processes (default None uses every core, 0 runs in-process).
+      :return: Table_Scheduler whose 'store:<table>' steps return the key columns (tables) or file path (intermediaries).
+      """
+      retain_fields = {table_name: [] for table_name in generate_tables}
+      for parent_name, parent_key, child_name, fk_kwargs, _ in foreign_key_links:
+            if parent_name in retain_fields and child_name in retain_fields:
+                  for field in foreign_key_parent_fields(parent_key, fk_kwargs):
+                        if field not in retain_fields[parent_name]:
+                              retain_fields[parent_name].append(field)
+      for table_name in intermediary_tables:
+            for source_name, key_field in zip(intermediary_registry[table_name]['tables'], intermediary_registry[table_name]['key_fields']):
+                  if key_field not in retain_fields[source_name]:
+                        retain_fields[source_name].append(key_field)
+
+      scheduler = grdsch.Table_Scheduler(max_workers)
+      streamed = {}
+      # The table registry lists parents before their children
+      for table_name in generate_tables:
+            parent_keys = {parent_name: streamed[parent_name] for parent_name, _, child_name, _, _ in foreign_key_links \
+                           if child_name == table_name and parent_name in streamed}
+            streamed[table_name] = scheduler.add_step(f"store:{table_name}", stream_table, \
+                                                      (table_name, table_rows[table_name], chunk_size, rng_context, archive_writer, \
+                                                       table_name in output_tables, parent_keys, retain_fields[table_name]))
+      for table_name in intermediary_tables:
+            table_keys = {source_name: streamed[source_name] for source_name in intermediary_registry[table_name]['tables']}
+            scheduler.add_step(f"store:{table_name}", write_intermediary_table, (table_name, table_keys, rng_context, archive_writer))
+      return scheduler
 
-# Random Finance Table
-finance_df.to_csv(pathway_output + "finance data.csv", index=False)
 
-# Log Tables
-log_df_g.to_csv(pathway_output + "Log General Information.csv", index=False)
-log_df_dc.to_csv(pathway_output + "Log Datachanges.csv", index=False)
-log_df_fc.to_csv(pathway_output + "Log Filechanges.csv", index=False)
-log_df_sec.to_csv(pathway_output + "Log Security Details.csv", index=False)
-log_df_wa.to_csv(pathway_output + "Log User Web Activity.csv", index=False)
-log_df_sa.to_csv(pathway_output + "Log User Server Activity.csv", index=False)
-log_df_ac.to_csv(pathway_output + "Log User Account Activity.csv", index=False)
-log_df_le.to_csv(pathway_output + "Log Errors.csv", index=False)
-log_df_ec.to_csv(pathway_output + "Log Error Codes.csv", index=False)
+#----------------------------------------------------------------------------------
+#----------------------------------------------------------------------------------
+#----------              Command Line Entry Point                         ---------
+#----------------------------------------------------------------------------------
+#----------------------------------------------------------------------------------
 
-# Intermediary DBs
-emp_interdb_df.to_csv(pathway_output + "Employee System.csv", index=False)
\ No newline at end of file
+def parse_table_rows(table_rows_args):
+      """
+      Parse --rows TABLE=N arguments.
+      :param table_rows_args: List of "table=rows" strings.
+      :return: Dictionary of table name -> number of rows.
+      """
+      table_rows = {}
+      for table_rows_arg in table_rows_args or []:
+            table_name, sep, num_rows = table_rows_arg.partition("=")
+            if not sep or not num_rows.isdigit() or int(num_rows) < 1:
+                  raise argparse.ArgumentTypeError(f"--rows value '{table_rows_arg}' is not in the format TABLE=N with N >= 1")
+            table_rows[table_name] = int(num_rows)
+      return table_rows
+
+def parse_reference_date(reference_date_arg):
+      """
+      Parse a --reference-date argument.
+      :param reference_date_arg: Date in the format YYYY-MM-DD.
+      :return: datetime of the date.
+      """
+      try:
+            return datetime.strptime(reference_date_arg, "%Y-%m-%d")
+      except ValueError:
+            raise argparse.ArgumentTypeError(f"--reference-date value '{reference_date_arg}' is not a date in the format YYYY-MM-DD")
+
+def build_arg_parser():
+      """
+      Build the command line parser of the generator.
+      :return: argparse.ArgumentParser.
+      """
+      table_names = list(table_registry) + list(intermediary_registry)
+      parser = argparse.ArgumentParser(description="Generate the random business, legal, address, tax, finance, employee and log datasets.")
+      parser.add_argument("--scale-factor", type=float, default=default_scale_factor,
+                          help=f"Multiplier on the base row count of every root table; child tables follow their parent by ratio (default {default_scale_factor}).")
+      parser.add_argument("--rows", action="append", metavar="TABLE=N",
+                          help="Exact row count for one table (repeatable); overrides the scale factor for the table and its children.")
+      parser.add_argument("--seed", type=int, default=default_master_seed,
+                          help=f"Master seed of every random stream (default {default_master_seed}).")
+      parser.add_argument("--reference-date", type=parse_reference_date, default=grdfs.default_reference_date, metavar="YYYY-MM-DD",
+                          help=f"Reference date (\"today\") of the data, the latest date a date field can hold (default {grdfs.default_reference_date:%Y-%m-%d}).")
+      parser.add_argument("--output-dir", default=default_output_dir,
+                          help=f"Folder the datasets are written to (default {default_output_dir}).")
+      parser.add_argument("--format", choices=list(grdaw.archive_formats), default="csv",
+                          help="File format of the datasets; parquet and feather keep the column dtypes and need pyarrow (default csv).")
+      parser.add_argument("--row-group-size", type=int, default=grdaw.default_row_group_size,
+                          help=f"Rows per Parquet row group / Arrow record batch (default {grdaw.default_row_group_size}).")
+      parser.add_argument("--workers", type=int, default=None,
+                          help="Number of worker processes for table generation (default every core, 0 runs everything in one process).")
+      parser.add_argument("--chunk-size", type=int, default=None,
+                          help="Stream every table in chunks of this many rows, writing each chunk before making the next (default off).")
+      parser.add_argument("--no-manifest", action="store_true",
+                          help=f"Do not write the corruption manifest ({grdaw.manifest_extension}) of the altered row positions next to each table.")
+      parser.add_argument("--tables", nargs="+", choices=table_names, metavar="TABLE",
+                          help=f"Tables to write (default all): {', '.join(table_names)}.")
+      return parser
+
+def main(argv = None):
+      """
+      Generate, link, alter and store the datasets.
+      :param argv: Command line arguments (default sys.argv[1:]).
+      :return: Dictionary of table name -> written file path.
+      """
+      parser = build_arg_parser()
+      args = parser.parse_args(argv)
+      try:
+            table_rows = resolve_table_rows(args.scale_factor, parse_table_rows(args.rows))
+            generate_tables, intermediary_tables = resolve_required_tables(args.tables)
+      except (ValueError, argparse.ArgumentTypeError) as err:
+            parser.error(str(err))
+      if args.chunk_size is not None and args.chunk_size < 1:
+            parser.error(f"--chunk-size value of {args.chunk_size} must be 1 or greater")
+      output_tables = args.tables or list(table_registry) + list(intermediary_registry)
+
+      rng_context = grdfs.RNG_Context(args.seed, reference_date=args.reference_date)
+      os.makedirs(args.output_dir, exist_ok=True)
+      try:
+            archive_writer = grdaw.Archive_Writer(args.output_dir, args.format, args.row_group_size, \
+                                                  metadata={'generator': "generate_random_main", 'master_seed': args.seed, 'reference_date': f"{args.reference_date:%Y-%m-%d}", \
+                                                            'scale_factor': args.scale_factor, 'chunk_size': args.chunk_size or 0}, \
+                                                  write_manifests=not args.no_manifest)
+      except (ValueError, ImportError) as err:
+            parser.error(str(err))
+      if args.chunk_size:
+            scheduler = build_stream_schedule(table_rows, generate_tables, intermediary_tables, output_tables, rng_context, archive_writer, args.chunk_size, args.workers)
+      else:
+            scheduler = build_schedule(table_rows, generate_tables, intermediary_tables, output_tables, rng_context, archive_writer, args.workers)
+      results = scheduler.run()
+      written_files = {}
+      for table_name in output_tables:
+            if table_name in table_registry:
+                  written_files[table_name] = archive_writer.file_path(table_registry[table_name]['file_name'])
+            else:
+                  written_files[table_name] = results[f"store:{table_name}"]
+      return written_files
+
+
+if __name__ == "__main__":
+      main()
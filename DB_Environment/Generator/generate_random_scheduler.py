@@ -0,0 +1,99 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+
+class Step_Result:
+      """
+      Placeholder for the result of another step, used in the arguments of a scheduled step.
+      """
+      def __init__(self, step_name):
+            """
+            Initialize the Step_Result object.
+            :param step_name: Name of the step whose result is passed in.
+            """
+            self.step_name = step_name
+
+      def __repr__(self):
+            return f"Step_Result({self.step_name!r})"
+
+
+class Table_Scheduler:
+      """
+      Runs a dependency graph of named steps. Pool steps run in a process pool, local steps run in the
+      calling process; every step starts as soon as the steps it depends on have finished.
+      """
+      def __init__(self, max_workers = None):
+            """
+            Initialize the Table_Scheduler object.
+            :param max_workers: Number of worker processes (default None uses every core, 0 runs every step in-process).
+            """
+            if max_workers is not None and max_workers < 0:
+                  raise ValueError(f"max_workers value of {max_workers} must be 0 or greater")
+            self.max_workers = max_workers
+            self.steps = {}
+
+      def add_step(self, step_name, function, args = (), in_pool = True):
+            """
+            Add a step to the graph. Its dependencies are the Step_Result placeholders in its arguments.
+            :param step_name: Unique name of the step.
+            :param function: Function to run (a module level function for pool steps, so it can be pickled).
+            :param args: Positional arguments; Step_Result placeholders (also as dictionary values) are replaced by results.
+            :param in_pool: Run the step in the process pool (default True) or in the calling process.
+            :return: Step_Result placeholder of the new step.
+            """
+            if step_name in self.steps:
+                  raise ValueError(f"Step {step_name} is already scheduled")
+            depends_on = set()
+            for arg in args:
+                  values = arg.values() if isinstance(arg, dict) else [arg]
+                  depends_on.update(value.step_name for value in values if isinstance(value, Step_Result))
+            self.steps[step_name] = {'function': function, 'args': tuple(args), 'depends_on': depends_on, 'in_pool': in_pool}
+            return Step_Result(step_name)
+
+      def _resolve_args(self, args, results):
+            resolved_args = []
+            for arg in args:
+                  if isinstance(arg, Step_Result):
+                        arg = results[arg.step_name]
+                  elif isinstance(arg, dict):
+                        arg = {key: results[value.step_name] if isinstance(value, Step_Result) else value for key, value in arg.items()}
+                  resolved_args.append(arg)
+            return resolved_args
+
+      def run(self):
+            """
+            Run every step of the graph.
+            :return: Dictionary of step name -> result.
+            """
+            for step_name, step in self.steps.items():
+                  missing = step['depends_on'] - set(self.steps)
+                  if missing:
+                        raise ValueError(f"Step {step_name} depends on unknown steps {sorted(missing)}")
+            if self.max_workers == 0:
+                  return self._run_steps(None)
+            max_workers = self.max_workers or os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                  return self._run_steps(pool)
+
+      def _run_steps(self, pool):
+            pending = dict(self.steps)
+            results = {}
+            running = {}
+            while pending or running:
+                  ready = [step_name for step_name, step in pending.items() if step['depends_on'] <= results.keys()]
+                  for step_name in ready:
+                        step = pending.pop(step_name)
+                        args = self._resolve_args(step['args'], results)
+                        if pool is not None and step['in_pool']:
+                              running[pool.submit(step['function'], *args)] = step_name
+                        else:
+                              results[step_name] = step['function'](*args)
+                  if ready:
+                        # Local steps may have unlocked further steps
+                        continue
+                  if not running:
+                        raise ValueError(f"Steps {sorted(pending)} have circular dependencies")
+                  done, _ = wait(running, return_when=FIRST_COMPLETED)
+                  for future in done:
+                        results[running.pop(future)] = future.result()
+            return results
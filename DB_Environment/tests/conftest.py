@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The generator and data integrity modules import each other by bare name, as when run from their own folders
+for folder in ("Generator", "Data_Integrity"):
+      sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), folder))
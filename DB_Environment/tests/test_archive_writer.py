@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import generate_random_archive_writer as grdaw
+
+
+def chunk_fixture(start, num_records):
+      positions = np.arange(start, start + num_records)
+      return pd.DataFrame({'Record ID': positions,
+                           'Amount': positions * 1.5,
+                           'Status': pd.Categorical(np.where(positions % 2, "OPEN", "CLOSED"), categories=["CLOSED", "OPEN"]),
+                           'Created': pd.Timestamp("2020-01-01") + pd.to_timedelta(positions, unit='D'),
+                           # All null in the first chunk, text in later ones; blanks inserted into a numeric column
+                           'Note': [None] * num_records if start == 0 else [f"n{position}" for position in positions],
+                           'Zip Code': pd.Series([10001 if position % 3 else "" for position in positions], dtype=object)})
+
+
+def test_columnar_append_round_trip(tmp_path):
+      chunks = [chunk_fixture(start, 40) for start in (0, 40, 80)]
+      for file_format in ("parquet", "feather"):
+            writer = grdaw.Archive_Writer(str(tmp_path), file_format, row_group_size=25, metadata={'master_seed': 7})
+            for chunk_num, chunk in enumerate(chunks):
+                  file_path = writer.write(chunk, "chunked data", append=chunk_num > 0)
+            writer.close()
+            table = grdaw.read_archive_table(file_path)
+            expected = pd.concat(chunks, ignore_index=True)
+            assert len(table) == 120, file_format
+            np.testing.assert_array_equal(table['Record ID'], expected['Record ID'])
+            np.testing.assert_array_equal(table['Amount'], expected['Amount'])
+            assert table['Status'].tolist() == expected['Status'].tolist()
+            assert (pd.to_datetime(table['Created']) == expected['Created']).all()
+            assert table['Note'].isna().sum() == 40 and table['Note'].iloc[40] == "n40"
+            assert table['Zip Code'].astype(str).tolist() == expected['Zip Code'].astype(str).tolist()
+            assert grdaw.read_archive_table(file_path, columns=['Amount']).columns.tolist() == ['Amount']
+      metadata = pq.read_schema(tmp_path / "chunked data.parquet").metadata
+      assert metadata[b'master_seed'] == b'7' and metadata[b'table'] == b'chunked data'
+      assert pq.ParquetFile(tmp_path / "chunked data.parquet").metadata.num_row_groups == 6
+
+
+def test_csv_append_round_trip(tmp_path):
+      writer = grdaw.Archive_Writer(str(tmp_path))
+      for chunk_num, start in enumerate((0, 40)):
+            file_path = writer.write(chunk_fixture(start, 40)[['Record ID', 'Amount']], "chunked data", append=chunk_num > 0)
+      table = grdaw.read_archive_table(file_path)
+      np.testing.assert_array_equal(table['Record ID'], np.arange(80))
@@ -0,0 +1,25 @@
+import numpy as np
+import data_integrity_corruption_scoring as dics
+import generate_random_archive_writer as grdaw
+import generate_random_corruption_manifest as grdcm
+
+
+def test_manifest_round_trip_through_the_scorer(tmp_path):
+      manifest = grdcm.Corruption_Manifest('address')
+      manifest.add_records(6)
+      manifest.record('Zip Code', 'insert_value_by_override_perc', [4, 1])
+      manifest.add_records(6)
+      manifest.record('Zip Code', 'insert_value_by_override_perc', [0, 1], record_offset=6)
+      manifest.record('Address Street', 'inject_malformation:address', [2, 2, 5])
+      writer = grdaw.Archive_Writer(str(tmp_path))
+      writer.write_manifest(manifest, "Address Data")
+
+      # The scorer reads back every recorded position from the file the writer placed next to the table
+      scorer = dics.Corruption_Scorer(writer.manifest_path("Address Data"))
+      assert (scorer.table_name, scorer.num_records) == ('address', 12)
+      np.testing.assert_array_equal(scorer.truth_positions('Zip Code'), [1, 4, 6, 7])
+      np.testing.assert_array_equal(scorer.truth_positions('Address Street'), [2, 5])
+      assert scorer.corruption_types('Address Street') == ['inject_malformation:address']
+
+      result = scorer.score([1, 6, 9], 'Zip Code')
+      assert (result['true_positives'], result['false_positives'], result['false_negatives']) == (2, 1, 2)
@@ -0,0 +1,24 @@
+import pandas as pd
+import generate_random_data_analysis_conditions as grdac
+import generate_random_corruption_plan as grdcp
+
+
+cross_field_plan = [
+      {'field': 'Closed Date',   'type': 'override',                 'perc': 10, 'value': ""},
+      {'field': 'Modified Date', 'type': 'override',                 'perc': 10, 'value': ""},
+      {'field': 'Closed Date',   'type': 'closed_date_misalignment', 'perc': 10, 'modified_date_field': 'Modified Date'},
+]
+
+
+def test_apply_runs_a_reading_operation_after_the_field_it_reads(monkeypatch):
+      calls = []
+      def recorder(method_name, field_keyword):
+            def method(self, **kwargs):
+                  calls.append((method_name, kwargs[field_keyword]))
+                  return self.df
+            return method
+      monkeypatch.setattr(grdac.Data_Analysis_Inserts, 'insert_value_by_override_perc', recorder('override', 'field_name'))
+      monkeypatch.setattr(grdac.Data_Analysis_Err_Conditions, 'closed_date_misalignment', recorder('misalignment', 'closed_date_field'))
+      df = pd.DataFrame({'Closed Date': ["2020-01-01"] * 4, 'Modified Date': ["2019-01-01"] * 4})
+      grdcp.Corruption_Plan(cross_field_plan).apply(df, rng_context=7)
+      assert calls == [('override', 'Closed Date'), ('override', 'Modified Date'), ('misalignment', 'Closed Date')]
@@ -0,0 +1,14 @@
+import pandas as pd
+import generate_random_data_analysis_conditions as grdac
+
+
+def test_duplicates_on_a_low_cardinality_field():
+      df = pd.DataFrame({'f': ['x'] * 10})
+      df = grdac.Data_Analysis_Inserts(df, rng_context=7).create_duplicates_within_field_random('f', dup_option_perc=21, field_perc_to_dup=25)
+      assert df['f'].tolist() == ['x'] * 10
+
+
+def test_duplicates_on_an_empty_field():
+      df = pd.DataFrame({'f': pd.Series([], dtype=object)})
+      df = grdac.Data_Analysis_Inserts(df, rng_context=7).create_duplicates_within_field_random('f', dup_option_perc=21, field_perc_to_dup=25)
+      assert df.empty
@@ -0,0 +1,15 @@
+import numpy as np
+import pandas as pd
+import data_integrity_data_checks as didc
+
+
+def test_format_check_positions_with_duplicate_index_labels():
+      df = pd.DataFrame({'Zip Code': ["12345", "bad", None, "", "x1", "12345-6789"]}, index=[0, 0, 1, 5, 5, 2])
+      positions = didc.Data_Check_Formats(df).check_zip_code_format_field('Zip Code', return_list="i")
+      np.testing.assert_array_equal(positions, [1, 4])
+
+
+def test_format_check_positions_ignore_index_labels():
+      df = pd.DataFrame({'Employee Email': ["john.smith@mailtype.com", "jane.doe@@mailtype.com"]}, index=[10, 3])
+      positions = didc.Data_Check_Formats(df).check_employee_email_format_field('Employee Email', return_list="i")
+      np.testing.assert_array_equal(positions, [1])
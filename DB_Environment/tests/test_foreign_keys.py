@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import generate_random_data_relationship as grdr
+import generate_random_main as grdm
+
+
+def conditional_fixture():
+      rng = np.random.default_rng(11)
+      parents = pd.DataFrame({'Legal Account': np.arange(100, 300),
+                              'Legal Status': rng.choice(['ACTIVE', 'CLOSED'], 200),
+                              'Currency': rng.choice(['USD', 'EUR'], 200),
+                              'LE Creation Date': pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 1000, 200), unit='D')})
+      children = pd.DataFrame({'Finance ID': np.arange(2000),
+                               'Currency': rng.choice(['USD', 'EUR', 'GBP'], 2000),
+                               'Financial Date': pd.Timestamp("2019-06-01") + pd.to_timedelta(rng.integers(0, 1600, 2000), unit='D')})
+      return parents, children
+
+
+def test_conditional_foreign_keys_only_pick_eligible_parents():
+      parents, children = conditional_fixture()
+      children = grdr.Foreign_Keys(parents, 'Legal Account', rng_context=3).add_foreignkey_conditions(
+            children, col_placement=2, parent_filter={'Legal Status': ['ACTIVE']}, match_fields={'Currency': 'Currency'},
+            date_rule=('Financial Date', 'LE Creation Date'))
+      linked = children.merge(parents, on='Legal Account', how='left', suffixes=("", " Parent"))
+      has_key = linked['Legal Account'].notna()
+      assert has_key.any()
+      assert (linked.loc[has_key, 'Legal Status'] == 'ACTIVE').all()
+      assert (linked.loc[has_key, 'Currency'] == linked.loc[has_key, 'Currency Parent']).all()
+      assert (linked.loc[has_key, 'LE Creation Date'] <= linked.loc[has_key, 'Financial Date']).all()
+
+      # Exactly the children without any eligible parent get a null key
+      active = parents[parents['Legal Status'] == 'ACTIVE']
+      earliest = active.groupby('Currency')['LE Creation Date'].min()
+      expect_key = children['Financial Date'] >= children['Currency'].map(earliest)
+      np.testing.assert_array_equal(has_key.to_numpy(), expect_key.fillna(False).to_numpy(dtype=bool))
+
+
+def test_default_links_are_unconditional():
+      parents, children = conditional_fixture()
+      for parent_name, parent_key, child_name, fk_kwargs, col_placement in grdm.foreign_key_links:
+            assert 'conditions' not in fk_kwargs
+      children = grdm.link_foreign_key(parents, 'Legal Account', 'finance', children, {'foreign_key_abbreviation_post': " ID"}, 3, grdm.grdfs.RNG_Context(1))
+      assert children['Legal Account ID'].notna().all()
+      assert children['Legal Account ID'].isin(parents['Legal Account']).all()
+
+
+def random_link(distribution, **distribution_kwargs):
+      parents = pd.DataFrame({'External ID': np.arange(1000, 1200)})
+      children = pd.DataFrame({'Legal ID': np.arange(20000)})
+      children = grdr.Foreign_Keys(parents, 'External ID', foreign_key_abbreviation_pre="Bus ", rng_context=5).add_foreignkey_random(
+            children, col_placement=1, distribution=distribution, **distribution_kwargs)
+      assert children.columns.tolist() == ['Bus External ID', 'Legal ID']
+      assert children['Bus External ID'].isin(parents['External ID']).all()
+      return np.sort(children['Bus External ID'].value_counts().to_numpy())[::-1]
+
+
+def test_random_foreign_key_distributions():
+      uniform = random_link('uniform')
+      assert uniform.max() < 2 * 100
+      # at_least_once uses every parent
+      assert len(random_link('at_least_once')) == 200
+      # Zipf: the most used parent takes about 1 / sum(k**-1.1) of the children
+      zipf = random_link('zipf', zipf_exponent=1.1)
+      expected_top = 20000 / np.sum(np.arange(1, 201, dtype=float) ** -1.1)
+      assert abs(zipf[0] - expected_top) < 5 * np.sqrt(expected_top)
+      # hot_key: 80% of the children go to the 2 hottest parents (1% of 200), plus their uniform share
+      hot = random_link('hot_key', hot_value_perc=1, hot_record_perc=80)
+      assert abs(hot[:2].sum() / 20000 - (0.8 + 0.2 * 2 / 200)) < 0.02
@@ -0,0 +1,32 @@
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import generate_random_dataset_support_functions as gtsf
+import generate_random_data_analysis_conditions as grdac
+import generate_random_main as grdm
+
+
+def test_date_fields_end_at_the_reference_date():
+      reference_date = datetime(2015, 6, 30)
+      rng_context = gtsf.RNG_Context(4, reference_date=reference_date)
+      for table_name, date_fields in {'business': ['Creation Date', 'Modified Date', 'Closed Date'],
+                                      'employee': ['Hire Date', 'Termination Date'],
+                                      'log_general': ['Time Stamp']}.items():
+            df = grdm.generate_table(table_name, 2000, rng_context)
+            for field in date_fields:
+                  assert pd.to_datetime(df[field]).max() <= pd.Timestamp(reference_date) + pd.Timedelta(days=1), field
+
+
+def test_same_seed_gives_the_same_table_under_the_default_reference_date():
+      first = grdm.generate_table('legal', 500, gtsf.RNG_Context(9))
+      second = grdm.generate_table('legal', 500, gtsf.RNG_Context(9, reference_date=gtsf.default_reference_date))
+      pd.testing.assert_frame_equal(first, second)
+      assert gtsf.RNG_Context(9, reference_date=datetime(2003, 1, 1)).table('legal').chunk(2, 10).reference_date == datetime(2003, 1, 1)
+
+
+def test_closed_date_misalignment_ends_at_the_reference_date():
+      reference_date = datetime(2005, 1, 1)
+      df = pd.DataFrame({'Creation Date': pd.to_datetime(["2004-01-01"] * 50), 'Closed Date': pd.to_datetime(["2004-06-01"] * 50)})
+      rng_context = gtsf.RNG_Context(2, reference_date=reference_date)
+      df = grdac.Data_Analysis_Err_Conditions(df, rng_context=rng_context).closed_date_misalignment('Closed Date', open_date_field='Creation Date', apply_perc=100)
+      assert pd.to_datetime(df['Closed Date']).max() <= pd.Timestamp(reference_date)
@@ -0,0 +1,40 @@
+import pandas as pd
+import data_integrity_referential_checks as dirc
+import generate_random_main as grdm
+
+
+def write_fixture(folder, filetype):
+      parents = pd.DataFrame({'Legal Account': [1001, 1002, 1003, 1003], 'Legal Firm': list("abcd")})
+      # Two orphan rows (9999 twice), one null key, five valid rows
+      children = pd.DataFrame({'Tax Account': range(8),
+                               'Legal Account ID': pd.array([1001, 9999, None, 1003, 1002, 9999, 1001, 1001], dtype="Int64")})
+      for file_name, df in [("legal data", parents), ("tax data", children)]:
+            if filetype == ".csv":
+                  df.to_csv(folder / f"{file_name}.csv", index=False)
+            elif filetype == ".parquet":
+                  df.to_parquet(folder / f"{file_name}.parquet", index=False)
+            else:
+                  df.to_feather(folder / f"{file_name}.feather")
+
+
+def test_orphan_counts_on_a_known_fixture(tmp_path):
+      for filetype in (".csv", ".parquet", ".feather"):
+            write_fixture(tmp_path, filetype)
+            for chunk_size in (3, 100):
+                  checker = dirc.Referential_Check(tmp_path, filetype, chunk_size=chunk_size)
+                  result = checker.find_orphans("tax data", "Legal Account ID", "legal data", "Legal Account", sample_size=1)
+                  assert (result['rows'], result['null_keys'], result['orphans'], result['orphan_perc']) == (8, 1, 2, 25.0), (filetype, chunk_size)
+                  assert result['sample']['Tax Account'].astype(int).tolist() == [1]
+                  assert list(checker.load_parent_keys("legal data", "Legal Account")) == ["1001", "1002", "1003"]
+
+
+def test_generated_archive_orphans_match_a_direct_anti_join(tmp_path):
+      # The corruption plan alters parent keys (e.g. duplicated External IDs) after the children are linked, so orphans are expected
+      grdm.main(["--scale-factor", "0.05", "--workers", "0", "--output-dir", str(tmp_path)])
+      summary, samples = dirc.Referential_Check(tmp_path, chunk_size=7).check_archive(print_results="N")
+      assert len(summary) == len(dirc.referential_links)
+      for (child_file_name, fk_field, parent_file_name, parent_key_field), result in zip(dirc.referential_links, summary.to_dict('records')):
+            child_keys = pd.read_csv(tmp_path / f"{child_file_name}.csv", dtype=str)[fk_field]
+            parent_keys = set(pd.read_csv(tmp_path / f"{parent_file_name}.csv", dtype=str)[parent_key_field].dropna())
+            assert result['rows'] == len(child_keys) > 0
+            assert result['orphans'] == int((child_keys.notna() & ~child_keys.isin(parent_keys)).sum()), (child_file_name, fk_field)
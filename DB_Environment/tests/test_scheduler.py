@@ -0,0 +1,47 @@
+import operator
+import generate_random_main as grdm
+import generate_random_scheduler as grdsch
+
+
+def build_graph(max_workers):
+      scheduler = grdsch.Table_Scheduler(max_workers)
+      base = scheduler.add_step("base", operator.add, (2, 3))
+      doubled = scheduler.add_step("doubled", operator.mul, (base, 2))
+      squared = scheduler.add_step("squared", operator.mul, (base, base))
+      scheduler.add_step("collect", dict, ({'doubled': doubled, 'squared': squared, 'fixed': 1},), in_pool=False)
+      return scheduler
+
+
+def test_steps_receive_the_results_they_depend_on():
+      for max_workers in (0, 2):
+            results = build_graph(max_workers).run()
+            assert results == {'base': 5, 'doubled': 10, 'squared': 25, 'collect': {'doubled': 10, 'squared': 25, 'fixed': 1}}
+
+
+def test_unknown_and_circular_dependencies_are_rejected():
+      scheduler = grdsch.Table_Scheduler(0)
+      scheduler.add_step("child", operator.neg, (grdsch.Step_Result("missing"),))
+      for scheduler, message in [(scheduler, "unknown"), (circular_graph(), "circular")]:
+            try:
+                  scheduler.run()
+            except ValueError as err:
+                  assert message in str(err)
+            else:
+                  raise AssertionError(f"expected a {message} dependency error")
+
+
+def circular_graph():
+      scheduler = grdsch.Table_Scheduler(0)
+      scheduler.add_step("first", operator.neg, (grdsch.Step_Result("second"),))
+      scheduler.add_step("second", operator.neg, (grdsch.Step_Result("first"),))
+      return scheduler
+
+
+def test_parallel_and_in_process_runs_write_the_same_archive(tmp_path):
+      for max_workers in (0, 2):
+            grdm.main(["--scale-factor", "0.05", "--workers", str(max_workers), "--output-dir", str(tmp_path / str(max_workers))])
+      file_names = sorted(path.name for path in (tmp_path / "0").iterdir())
+      assert len(file_names) > 15
+      assert file_names == sorted(path.name for path in (tmp_path / "2").iterdir())
+      for file_name in file_names:
+            assert (tmp_path / "0" / file_name).read_bytes() == (tmp_path / "2" / file_name).read_bytes(), file_name
@@ -0,0 +1,37 @@
+import numpy as np
+import generate_random_dataset_support_functions as gtsf
+import generate_random_dataset_address as grda
+import generate_random_dataset_log as grdlo
+import generate_random_dataset_tax as grdt
+
+
+def test_feistel_ids_are_unique_and_in_range_across_chunk_offsets():
+      id_source = gtsf.Feistel_ID_Source(1000, 9999, np.random.default_rng(3))
+      chunks = [id_source.ids(offset, 1500) for offset in range(0, 9000, 1500)]
+      ids = np.concatenate(chunks)
+      assert len(ids) == id_source.num_ids == 9000
+      assert len(np.unique(ids)) == 9000
+      assert ids.min() >= 1000 and ids.max() <= 9999
+      # A chunk is the same slice of the permutation as the whole range
+      np.testing.assert_array_equal(id_source.ids(0, 9000)[3000:4500], chunks[2])
+
+
+def test_unique_id_array_refuses_to_overflow_its_width():
+      try:
+            gtsf.generate_unique_id_array(10, 1, rng=np.random.default_rng(3))
+      except ValueError as err:
+            assert "at least 2" in str(err)
+      else:
+            raise AssertionError("10 one-digit IDs should not fit")
+
+
+def test_table_ids_widen_with_the_whole_table_size():
+      id_records = {'ID_Record': np.arange(5)}
+      widths = {'Address ID': (grda.generate_table_address_general, 9 * 10 ** 7 + 1, 9),
+                'Tax Account': (grdt.generate_table_tax_general, 9 * 10 ** 7 + 1, 9),
+                'Log ID': (grdlo.generate_table_log_general, 9 * 10 ** 8 + 1, 10)}
+      for field, (generator, total_records, width) in widths.items():
+            ids = generator(dict(id_records), rng_context=gtsf.RNG_Context(5), total_records=total_records)[field]
+            assert all(len(str(id_value)) == width for id_value in ids), field
+            ids = generator(dict(id_records), rng_context=gtsf.RNG_Context(5))[field]
+            assert all(len(str(id_value)) == width - 1 for id_value in ids), field
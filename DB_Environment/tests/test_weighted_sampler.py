@@ -0,0 +1,31 @@
+import numpy as np
+import generate_random_dataset_support_functions as gtsf
+
+
+def test_alias_table_reproduces_the_weights_exactly():
+      weights = np.array([5, 1, 0, 3, 11, 0.5])
+      sampler = gtsf.Weighted_Sampler(list("abcdef"), weights)
+      # Each column holds 1/n of the mass: its own share prob[i] and its alias's share 1 - prob[i]
+      mass = sampler.prob / len(weights)
+      np.add.at(mass, sampler.alias, (1 - sampler.prob) / len(weights))
+      np.testing.assert_allclose(mass, weights / weights.sum(), atol=1e-12)
+
+
+def test_sampled_frequencies_follow_the_weights():
+      weights = np.array([5, 1, 0, 3, 11, 0.5])
+      sampler = gtsf.Weighted_Sampler(list("abcdef"), weights)
+      num_records = 400000
+      counts = np.bincount(sampler.sample_index(num_records, np.random.default_rng(8)), minlength=len(weights))
+      expected = weights / weights.sum()
+      assert counts[2] == 0
+      # Within 5 binomial standard deviations of every expected count
+      np.testing.assert_array_less(np.abs(counts / num_records - expected), 5 * np.sqrt(expected * (1 - expected) / num_records) + 1e-12)
+
+
+def test_sampler_rejects_bad_weights():
+      for value_list, weight_list in [(["a", "b"], [1]), (["a"], [-1]), (["a", "b"], [0, 0]), ([], [])]:
+            try:
+                  gtsf.Weighted_Sampler(value_list, weight_list)
+            except ValueError:
+                  continue
+            raise AssertionError(f"{weight_list} should be rejected")